@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Array backend for the video renderer: CuPy on a CUDA device, NumPy otherwise."""
+
+import os
+import numpy as np
+
+BACKEND_NAMES = ('auto', 'cupy', 'numpy')
+
+class ArrayBackend:
+    """Thin wrapper giving CuPy and NumPy the same interface.
+
+    Rendering code uses `backend.xp` as its array module and `backend.asnumpy`
+    to hand results to PIL/ffmpeg, so the same code runs on either device.
+    """
+
+    def __init__(self, name, xp):
+        self.name = name
+        self.xp = xp
+
+    def asnumpy(self, array):
+        """Return array as a host NumPy array (no copy on the NumPy backend)."""
+        if self.xp is np:
+            return np.asarray(array)
+        return self.xp.asnumpy(array)
+
+    def synchronize(self):
+        """Wait for queued device work to finish (for timing)."""
+        if self.xp is not np:
+            self.xp.cuda.Stream.null.synchronize()
+
+    def __repr__(self):
+        return f"ArrayBackend({self.name})"
+
+def _load_cupy():
+    """Return the cupy module if it imports and sees at least one CUDA device."""
+    try:
+        import cupy
+        if cupy.cuda.runtime.getDeviceCount() > 0:
+            return cupy
+    except Exception:
+        pass
+    return None
+
+def available_backends():
+    """Names of the backends usable on this machine."""
+    return ['cupy', 'numpy'] if _load_cupy() is not None else ['numpy']
+
+def load_backend(name=None):
+    """Load a backend by name; 'auto' (the default) prefers CuPy when a GPU is present.
+
+    The default can be overridden with the VIDEO_BACKEND environment variable.
+    """
+    name = name or os.environ.get('VIDEO_BACKEND', 'auto')
+    if name not in BACKEND_NAMES:
+        raise ValueError(f"Unknown array backend '{name}' (expected one of {', '.join(BACKEND_NAMES)})")
+    if name in ('auto', 'cupy'):
+        cupy = _load_cupy()
+        if cupy is not None:
+            return ArrayBackend('cupy', cupy)
+        if name == 'cupy':
+            raise RuntimeError("CuPy backend requested but CuPy or a CUDA device is unavailable")
+    return ArrayBackend('numpy', np)
@@ -9,6 +9,54 @@ from pathlib import Path
 from datetime import datetime
 import subprocess
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# Build stages and the paths they read and write. A stage depends on every other
+# selected stage whose outputs overlap its inputs, so independent formats run
+# concurrently while e.g. optimized art still lands before the ebook builders.
+BUILD_STAGES = {
+    "images": {
+        "script": "optimize_images.py",
+        "inputs": ["art/pages", "art/kindle", "art/epub", "art/pdf"],
+        "outputs": ["art/pages_optimized", "art/kindle_optimized", "art/epub_optimized", "art/pdf_optimized"]
+    },
+    "pages": {
+        "script": "build_pages.py",
+        "inputs": ["story", "index_template.md", "art/pages", "art/pages_optimized"],
+        "outputs": ["docs"]
+    },
+    "kindle": {
+        "script": "build_kindle.py",
+        "inputs": ["story", "art/kindle", "art/kindle_optimized"],
+        "outputs": ["dist/digital_amber_kindle.epub"]
+    },
+    "epub": {
+        "script": "build_epub.py",
+        "inputs": ["story", "art/epub_optimized"],
+        "outputs": ["dist/digital_amber.epub"]
+    },
+    "pdf": {
+        "script": "build_pdf.py",
+        "inputs": ["story"],
+        "outputs": ["dist/digital_amber.pdf"]
+    },
+    "audio": {
+        "script": "build_audio.py",
+        "inputs": ["story"],
+        "outputs": ["dist/audiobook"]
+    },
+    "narration": {
+        "script": "build_audio_kokoro_final.py",
+        "inputs": ["story"],
+        "outputs": ["dist/audiobook_kokoro"]
+    },
+    "video": {
+        "script": "create_audiobook_video.py",
+        "inputs": ["story", "art/pages", "dist/audiobook_kokoro"],
+        "outputs": ["dist/audiobook_videos"]
+    }
+}
 
 def read_file(path):
     """Read file content with UTF-8 encoding."""
@@ -84,16 +132,106 @@ def create_build_info(version_data, formats_built):
     return build_info
 
 def run_build_script(script_name):
-    """Run a build script and return success status."""
+    """Run a build script and return (success, wall time in seconds)."""
+    start = time.perf_counter()
     try:
         result = subprocess.run([sys.executable, f"scripts/{script_name}"], 
                               check=True, capture_output=True, text=True)
-        print(f"✓ {script_name} completed successfully")
-        return True
+        elapsed = time.perf_counter() - start
+        print(f"✓ {script_name} completed successfully ({elapsed:.1f}s)")
+        return True, elapsed
     except subprocess.CalledProcessError as e:
-        print(f"✗ {script_name} failed:")
+        elapsed = time.perf_counter() - start
+        print(f"✗ {script_name} failed after {elapsed:.1f}s:")
         print(e.stderr)
-        return False
+        return False, elapsed
+
+def paths_overlap(a, b):
+    """Check whether two repo-relative paths are the same or one contains the other."""
+    a_parts, b_parts = Path(a).parts, Path(b).parts
+    shortest = min(len(a_parts), len(b_parts))
+    return a_parts[:shortest] == b_parts[:shortest]
+
+def resolve_stage_dependencies(stages):
+    """Map each selected stage to the selected stages producing its inputs."""
+    dependencies = {}
+    for name in stages:
+        inputs = BUILD_STAGES[name]["inputs"]
+        dependencies[name] = {
+            other for other in stages
+            if other != name and any(paths_overlap(out, inp)
+                                     for out in BUILD_STAGES[other]["outputs"]
+                                     for inp in inputs)
+        }
+    return dependencies
+
+def critical_path(dependencies, timings):
+    """Return (stages, seconds) of the longest dependency chain among finished stages."""
+    longest = {}
+    
+    def chain(name):
+        if name not in longest:
+            best = max((chain(dep) for dep in dependencies[name] if dep in timings),
+                       key=lambda c: c[1], default=([], 0.0))
+            longest[name] = (best[0] + [name], best[1] + timings[name])
+        return longest[name]
+    
+    return max((chain(name) for name in timings), key=lambda c: c[1], default=([], 0.0))
+
+def run_build_stages(stages, max_workers=None):
+    """Run build stages concurrently in dependency order.
+    
+    Returns the list of stages that completed successfully. Stages whose
+    dependencies failed are skipped rather than built from stale inputs.
+    """
+    dependencies = resolve_stage_dependencies(stages)
+    pending = list(stages)
+    running = {}
+    succeeded, failed = [], []
+    timings = {}
+    build_start = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        while pending or running:
+            for name in list(pending):
+                deps = dependencies[name]
+                if deps & set(failed):
+                    print(f"⏭️  Skipping {name}: depends on failed {', '.join(sorted(deps & set(failed)))}")
+                    pending.remove(name)
+                    failed.append(name)
+                elif deps <= set(succeeded):
+                    print(f"\n📖 Building {name} format...")
+                    pending.remove(name)
+                    running[executor.submit(run_build_script, BUILD_STAGES[name]["script"])] = name
+            
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                ok, elapsed = future.result()
+                timings[name] = elapsed
+                if ok:
+                    succeeded.append(name)
+                else:
+                    print(f"❌ Failed to build {name} format")
+                    failed.append(name)
+    
+    wall_time = time.perf_counter() - build_start
+    
+    if timings:
+        print("\n⏱️  Stage timings:")
+        for name in stages:
+            if name in timings:
+                after = f" (after {', '.join(sorted(dependencies[name]))})" if dependencies[name] else ""
+                print(f"   {name:<10} {timings[name]:7.1f}s{after}")
+        path, path_time = critical_path(dependencies, timings)
+        print(f"   Sum of stages: {sum(timings.values()):.1f}s")
+        print(f"   Critical path: {path_time:.1f}s ({' → '.join(path)})")
+        print(f"   Wall time:     {wall_time:.1f}s")
+    
+    return [name for name in stages if name in succeeded]
 
 def copy_to_versioned_directory(dist_dir, version_dir, build_info):
     """Copy build artifacts to versioned directory."""
@@ -114,7 +252,7 @@ def copy_to_versioned_directory(dist_dir, version_dir, build_info):
             }
             print(f"  Copied {file_path.name} to {version_dir}")
 
-def build_all_formats(version_type="patch", formats=None):
+def build_all_formats(version_type="patch", formats=None, jobs=None):
     """Build all formats with versioning."""
     if formats is None:
         formats = ["pages", "kindle", "epub", "pdf"]
@@ -133,24 +271,11 @@ def build_all_formats(version_type="patch", formats=None):
     dist_dir.mkdir(exist_ok=True)
     
     # Build formats
-    formats_built = []
-    build_scripts = {
-        "pages": "build_pages.py",
-        "kindle": "build_kindle.py", 
-        "epub": "build_epub.py",
-        "pdf": "build_pdf.py",
-        "audio": "build_audio.py"
-    }
-    
-    for format_name in formats:
-        if format_name in build_scripts:
-            print(f"\n📖 Building {format_name} format...")
-            if run_build_script(build_scripts[format_name]):
-                formats_built.append(format_name)
-            else:
-                print(f"❌ Failed to build {format_name} format")
-        else:
-            print(f"⚠️  Unknown format: {format_name}")
+    unknown = [name for name in formats if name not in BUILD_STAGES]
+    for format_name in unknown:
+        print(f"⚠️  Unknown format: {format_name}")
+    stages = [name for name in dict.fromkeys(formats) if name in BUILD_STAGES]
+    formats_built = run_build_stages(stages, jobs)
     
     if not formats_built:
         print("❌ No formats were built successfully")
@@ -220,8 +345,10 @@ def main():
     parser.add_argument('--version-type', choices=['major', 'minor', 'patch'], 
                        default='patch', help='Version bump type')
     parser.add_argument('--formats', nargs='+', 
-                       choices=['pages', 'kindle', 'epub', 'pdf', 'audio'],
-                       help='Formats to build (default: all)')
+                       choices=list(BUILD_STAGES),
+                       help='Formats to build (default: pages kindle epub pdf)')
+    parser.add_argument('--jobs', type=int, default=None,
+                       help='Maximum stages to run concurrently (default: CPU count)')
     parser.add_argument('--list', action='store_true', help='List available versions')
     
     args = parser.parse_args()
@@ -230,7 +357,7 @@ def main():
         list_versions()
         return
     
-    success = build_all_formats(args.version_type, args.formats)
+    success = build_all_formats(args.version_type, args.formats, args.jobs)
     sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
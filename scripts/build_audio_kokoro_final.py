@@ -7,8 +7,16 @@ import json
 import subprocess
 from pathlib import Path
 from typing import List, Tuple
+import numpy as np
 import soundfile as sf
 from kokoro import KPipeline
+from word_timings import read_timings_sidecar, write_timings_sidecar
+from build_log import get_logger
+
+log = get_logger('audio')
+
+# Kokoro-82M output sample rate
+SAMPLE_RATE = 24000
 
 # Voice mapping for different characters using Kokoro voices (NO ADAM VOICE!)
 VOICE_MAPPING = {
@@ -25,18 +33,45 @@ VOICE_MAPPING = {
 def setup_kokoro():
     """Setup Kokoro TTS pipeline."""
     try:
-        print("🎯 Initializing Kokoro TTS pipeline...")
+        log.info("🎯 Initializing Kokoro TTS pipeline...")
         
         # Initialize pipeline for American English
         pipeline = KPipeline(lang_code='a')
         
-        print("✅ Kokoro pipeline ready")
+        log.info("✅ Kokoro pipeline ready")
         return pipeline
         
     except Exception as e:
-        print(f"❌ Error setting up Kokoro: {e}")
+        log.error(f"❌ Error setting up Kokoro: {e}")
         return None
 
+def segment_word_timings(tokens, offset: float) -> List[dict]:
+    """Word timings from one Kokoro segment's tokens, shifted by the segment's offset in seconds.
+    
+    Punctuation tokens are attached to the neighbouring word the way they are
+    written (Hello, and "Wait), and tokens without timestamps are skipped.
+    """
+    words = []
+    prefix = ''
+    spaced = True
+    for token in tokens or []:
+        text = token.text
+        if not any(ch.isalnum() for ch in text):
+            if words and not spaced:
+                words[-1]['word'] += text
+            else:
+                prefix += text
+        elif token.start_ts is not None and token.end_ts is not None:
+            words.append({
+                'word': prefix + text,
+                'start': round(offset + token.start_ts, 3),
+                'end': round(offset + token.end_ts, 3),
+                'confidence': 1.0
+            })
+            prefix = ''
+        spaced = bool(getattr(token, 'whitespace', ' '))
+    return words
+
 def text_to_speech_kokoro(pipeline, text: str, speaker: str, emotion: str, output_file: Path) -> bool:
     """Convert text to speech using Kokoro."""
     try:
@@ -45,7 +80,7 @@ def text_to_speech_kokoro(pipeline, text: str, speaker: str, emotion: str, outpu
         # Clean text for TTS
         clean_text = text.replace('#', '').replace('*', '').strip()
         if not clean_text:
-            print(f"⚠️  Skipping empty text for {output_file.name}")
+            log.warning(f"⚠️  Skipping empty text for {output_file.name}")
             return False
         
         # Get voice for character
@@ -60,31 +95,45 @@ def text_to_speech_kokoro(pipeline, text: str, speaker: str, emotion: str, outpu
         elif emotion == 'contemplative':
             speed = 0.9
         
-        print(f"🎙️  Generating: {output_file.name} ({speaker}:{voice} - {emotion})")
+        log.info(f"🎙️  Generating: {output_file.name} ({speaker}:{voice} - {emotion})")
         
         # Generate audio using Kokoro
         generator = pipeline(clean_text, voice=voice, speed=speed)
         
-        # Collect all audio segments
+        # Collect all audio segments with their text and word timestamps
         audio_segments = []
-        for i, (gs, ps, audio) in enumerate(generator):
+        segments = []
+        words = []
+        offset = 0  # samples
+        for result in generator:
+            if result.audio is None:
+                continue
+            audio = np.asarray(result.audio)
+            start = offset / SAMPLE_RATE
+            segments.append({
+                'text': result.graphemes,
+                'start': round(start, 3),
+                'end': round((offset + len(audio)) / SAMPLE_RATE, 3)
+            })
+            words.extend(segment_word_timings(result.tokens, start))
             audio_segments.append(audio)
+            offset += len(audio)
         
         if audio_segments:
             # Concatenate all segments
-            import numpy as np
             full_audio = np.concatenate(audio_segments)
             
-            # Save audio file
-            sf.write(str(output_file), full_audio, 24000)
-            print(f"✅ Generated: {output_file.name} ({len(audio_segments)} segments)")
+            # Save audio file and its timing sidecar for the video step
+            sf.write(str(output_file), full_audio, SAMPLE_RATE)
+            write_timings_sidecar(output_file, SAMPLE_RATE, len(full_audio), segments, words)
+            log.info(f"✅ Generated: {output_file.name} ({len(audio_segments)} segments, {len(words)} timed words)")
             return True
         else:
-            print(f"❌ No audio generated for {output_file.name}")
+            log.error(f"❌ No audio generated for {output_file.name}")
             return False
             
     except Exception as e:
-        print(f"❌ Error generating {output_file.name}: {e}")
+        log.error(f"❌ Error generating {output_file.name}: {e}")
         return False
 
 def detect_emotion_from_text(text: str, speaker: str) -> str:
@@ -145,7 +194,7 @@ def identify_speaker_from_context(text: str) -> str:
 
 def process_chapter_audio(chapter_file: Path, pipeline, output_dir: Path) -> List[Path]:
     """Process a single chapter into audio segments with Kokoro voices."""
-    print(f"🎧 Processing {chapter_file.name}...")
+    log.info(f"🎧 Processing {chapter_file.name}...")
     
     content = chapter_file.read_text(encoding='utf-8')
     
@@ -173,6 +222,25 @@ def process_chapter_audio(chapter_file: Path, pipeline, output_dir: Path) -> Lis
     
     return audio_files
 
+def combine_timings(audio_files: List[Path], output_file: Path) -> bool:
+    """Concatenate the timing sidecars of audio_files, offsetting each by the samples before it."""
+    segments = []
+    words = []
+    offset = 0  # samples
+    for audio_file in audio_files:
+        sidecar = read_timings_sidecar(audio_file)
+        if sidecar is None:
+            log.warning(f"⚠️  No timings for {audio_file.name}; {output_file.name} will need Whisper alignment")
+            return False
+        shift = offset / SAMPLE_RATE
+        segments += [dict(segment, start=round(segment['start'] + shift, 3), end=round(segment['end'] + shift, 3))
+                     for segment in sidecar['segments']]
+        words += [dict(word, start=round(word['start'] + shift, 3), end=round(word['end'] + shift, 3))
+                  for word in sidecar['words']]
+        offset += sidecar['samples']
+    write_timings_sidecar(output_file, SAMPLE_RATE, offset, segments, words)
+    return True
+
 def combine_audio_files(audio_files: List[Path], output_file: Path) -> bool:
     """Combine audio files using ffmpeg."""
     if not audio_files:
@@ -192,23 +260,24 @@ def combine_audio_files(audio_files: List[Path], output_file: Path) -> bool:
         
         subprocess.run(cmd, check=True, capture_output=True)
         file_list.unlink()
+        combine_timings(audio_files, output_file)
         
-        print(f"✅ Combined: {output_file.name}")
+        log.info(f"✅ Combined: {output_file.name}")
         return True
         
     except subprocess.CalledProcessError as e:
-        print(f"❌ Error combining: {e}")
+        log.error(f"❌ Error combining: {e}")
         return False
 
 def build_audiobook_kokoro():
     """Build complete audiobook using Kokoro TTS."""
-    print("🎙️  Digital Amber - Kokoro TTS Audiobook Generation")
-    print("=" * 60)
+    log.info("🎙️  Digital Amber - Kokoro TTS Audiobook Generation")
+    log.info("=" * 60)
     
     # Setup Kokoro
     pipeline = setup_kokoro()
     if not pipeline:
-        print("❌ Failed to initialize Kokoro")
+        log.error("❌ Failed to initialize Kokoro")
         return
     
     # Clear and create output directory
@@ -220,16 +289,16 @@ def build_audiobook_kokoro():
     audio_output_dir.mkdir(parents=True, exist_ok=True)
     story_dir = Path("story")
     
-    print(f"\n🎭 Voice Cast (Kokoro voices):")
+    log.info(f"\n🎭 Voice Cast (Kokoro voices):")
     for character, voice in VOICE_MAPPING.items():
-        print(f"   {character}: {voice}")
+        log.info(f"   {character}: {voice}")
     
     # Process all content
     all_chapter_files = []
     
     # Process foreword
     if (story_dir / "foreword.md").exists():
-        print("\n🎧 Processing foreword...")
+        log.info("\n🎧 Processing foreword...")
         audio_files = process_chapter_audio(story_dir / "foreword.md", pipeline, audio_output_dir)
         if audio_files:
             foreword_combined = audio_output_dir / "000_foreword.wav"
@@ -240,7 +309,7 @@ def build_audiobook_kokoro():
     for i in range(1, 25):
         chapter_file = story_dir / f"chapter_{i}.md"
         if chapter_file.exists():
-            print(f"\n🎧 Processing chapter {i}...")
+            log.info(f"\n🎧 Processing chapter {i}...")
             audio_files = process_chapter_audio(chapter_file, pipeline, audio_output_dir)
             if audio_files:
                 chapter_combined = audio_output_dir / f"{i:03d}_chapter_{i}.wav"
@@ -249,7 +318,7 @@ def build_audiobook_kokoro():
     
     # Process epilogue
     if (story_dir / "epilogue.md").exists():
-        print("\n🎧 Processing epilogue...")
+        log.info("\n🎧 Processing epilogue...")
         audio_files = process_chapter_audio(story_dir / "epilogue.md", pipeline, audio_output_dir)
         if audio_files:
             epilogue_combined = audio_output_dir / "999_epilogue.wav"
@@ -259,7 +328,7 @@ def build_audiobook_kokoro():
     # Create complete audiobook
     if all_chapter_files:
         audiobook_file = audio_output_dir / "digital_amber_kokoro_complete.wav"
-        print(f"\n🎵 Creating complete audiobook...")
+        log.info(f"\n🎵 Creating complete audiobook...")
         combine_audio_files(all_chapter_files, audiobook_file)
         
         # Generate metadata
@@ -268,7 +337,7 @@ def build_audiobook_kokoro():
             'author': 'AI-Human Collaboration',
             'narrator': 'Multi-Character Kokoro TTS Cast',
             'tts_engine': 'Kokoro-82M',
-            'sample_rate': 24000,
+            'sample_rate': SAMPLE_RATE,
             'chapters': len(all_chapter_files),
             'voice_mapping': VOICE_MAPPING
         }
@@ -279,17 +348,17 @@ def build_audiobook_kokoro():
         # Show results
         size_mb = audiobook_file.stat().st_size / (1024 * 1024)
         
-        print(f"\n🎉 Kokoro audiobook generation complete!")
-        print(f"📁 Output directory: {audio_output_dir}")
-        print(f"🎧 Audiobook file: {audiobook_file.name}")
-        print(f"📊 File size: {size_mb:.1f} MB")
-        print(f"📋 Chapters processed: {len(all_chapter_files)}")
-        print(f"🎭 Character voices: {len(VOICE_MAPPING)}")
-        print(f"🔊 TTS Engine: Kokoro-82M (24kHz)")
+        log.info(f"\n🎉 Kokoro audiobook generation complete!")
+        log.info(f"📁 Output directory: {audio_output_dir}")
+        log.info(f"🎧 Audiobook file: {audiobook_file.name}")
+        log.info(f"📊 File size: {size_mb:.1f} MB")
+        log.info(f"📋 Chapters processed: {len(all_chapter_files)}")
+        log.info(f"🎭 Character voices: {len(VOICE_MAPPING)}")
+        log.info(f"🔊 TTS Engine: Kokoro-82M (24kHz)")
         
-        print(f"\n✨ Individual chapter files also available in {audio_output_dir}")
+        log.info(f"\n✨ Individual chapter files also available in {audio_output_dir}")
     else:
-        print("❌ No audio files generated")
+        log.error("❌ No audio files generated")
 
 if __name__ == "__main__":
     build_audiobook_kokoro()
\ No newline at end of file
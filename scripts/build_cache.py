@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""Content-hash build caches shared by the format builders and the audiobook video."""
+
+import json
+import hashlib
+import os
+import pickle
+import time
+from collections import defaultdict
+from pathlib import Path
+
+CACHE_DIR = Path("cache/build")
+ARTIFACT_DIR = CACHE_DIR / "artifacts"
+
+# Disk budget for ArtifactCache entries (override with BUILD_CACHE_BUDGET_GB)
+ARTIFACT_BUDGET_BYTES = int(float(os.environ.get('BUILD_CACHE_BUDGET_GB', '20')) * 1024**3)
+# Eviction trims the store to this share of the budget, so it doesn't run again on the next put
+EVICT_TO_FRACTION = 0.9
+# Temporary files untouched this long belong to a writer that died, and are swept during eviction
+STALE_TEMP_SECONDS = 3600
+
+def hash_bytes(data):
+    """Return the hex digest of a bytes or str payload."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.md5(data).hexdigest()
+
+def hash_file(path):
+    """Return the content hash of a file, or 'missing' if it doesn't exist."""
+    path = Path(path)
+    if not path.is_file():
+        return "missing"
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+_content_hashes = {}
+
+def content_hash(path):
+    """hash_file() memoized per process on path, size and mtime, so large audio is hashed once."""
+    path = Path(path)
+    stats = path.stat()
+    memo_key = (str(path.resolve()), stats.st_size, stats.st_mtime_ns)
+    if memo_key not in _content_hashes:
+        _content_hashes[memo_key] = hash_file(path)
+    return _content_hashes[memo_key]
+
+def hash_files(paths):
+    """Return a single hash covering the names and contents of many files."""
+    digest = hashlib.md5()
+    for path in sorted(str(p) for p in paths):
+        digest.update(path.encode('utf-8'))
+        digest.update(hash_file(path).encode('ascii'))
+    return digest.hexdigest()
+
+def write_atomic(path, content):
+    """Write text or bytes to path via a temporary file so readers never see partial data."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    if isinstance(content, bytes):
+        tmp_path.write_bytes(content)
+    else:
+        tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+
+class ArtifactCache:
+    """Content-addressed store of build artifacts with a disk budget and LRU eviction.
+    
+    Entries live at <root>/<stage>/<key[:2]>/<key><suffix>, where the key is a
+    hash of input content hashes and parameters (never paths or mtimes), so
+    they survive checkouts and renames. Entries are written atomically, a hit
+    refreshes the entry's mtime, and once the store grows past the budget the
+    least recently used entries are evicted down to EVICT_TO_FRACTION of it.
+    The size is kept as a running total, so the store is only walked on the
+    first put and when evicting. Temporary files and directories (names
+    starting with '.') count against the budget; eviction removes those no
+    writer has touched for STALE_TEMP_SECONDS. Hits and misses are counted
+    per stage.
+    """
+    
+    def __init__(self, root=ARTIFACT_DIR, budget_bytes=ARTIFACT_BUDGET_BYTES):
+        self.root = Path(root)
+        self.budget_bytes = budget_bytes
+        self.stats = defaultdict(lambda: {'hits': 0, 'misses': 0})
+        self._size = None
+    
+    @staticmethod
+    def key(*parts):
+        """Build a cache key from content hashes and parameters."""
+        return hash_bytes("\0".join(json.dumps(part, sort_keys=True, default=str) for part in parts))
+    
+    def path(self, stage, key, suffix):
+        """Location of an entry (which may not exist)."""
+        return self.root / stage / key[:2] / f"{key}{suffix}"
+    
+    def lookup(self, stage, key, suffix):
+        """Return the entry's path on a hit (refreshing its LRU position) or None on a miss."""
+        path = self.path(stage, key, suffix)
+        try:
+            os.utime(path)
+        except OSError:
+            self.stats[stage]['misses'] += 1
+            return None
+        self.stats[stage]['hits'] += 1
+        return path
+    
+    def store(self, stage, key, suffix, content):
+        """Atomically store text or bytes and return the entry's path."""
+        path = self.path(stage, key, suffix)
+        replaced = self._stored_size(path)
+        write_atomic(path, content)
+        self._added(path, replaced)
+        return path
+    
+    def store_file(self, stage, key, suffix, finished_file):
+        """Move a file written elsewhere (e.g. a memory-mapped array) into the store."""
+        path = self.path(stage, key, suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        replaced = self._stored_size(path)
+        os.replace(finished_file, path)
+        self._added(path, replaced)
+        return path
+    
+    def temp_path(self, stage, suffix):
+        """Scratch path inside the store for writers that stream their result."""
+        directory = self.root / stage
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f".{os.getpid()}.tmp{suffix}"
+    
+    def get_text(self, stage, key, suffix='.txt'):
+        """Stored text, or None on a miss."""
+        path = self.lookup(stage, key, suffix)
+        return path.read_text(encoding='utf-8') if path else None
+    
+    def put_text(self, stage, key, text, suffix='.txt'):
+        """Store text."""
+        self.store(stage, key, suffix, text)
+    
+    def get_json(self, stage, key):
+        """Stored JSON value, or None on a miss."""
+        path = self.lookup(stage, key, '.json')
+        return json.loads(path.read_text(encoding='utf-8')) if path else None
+    
+    def put_json(self, stage, key, value):
+        """Store a JSON-serializable value compactly."""
+        self.store(stage, key, '.json', json.dumps(value, separators=(',', ':')))
+    
+    def get_pickle(self, stage, key):
+        """Stored Python object, or None on a miss."""
+        path = self.lookup(stage, key, '.pkl')
+        return pickle.loads(path.read_bytes()) if path else None
+    
+    def put_pickle(self, stage, key, value):
+        """Store a picklable Python object."""
+        self.store(stage, key, '.pkl', pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    
+    def get_array(self, stage, key, mmap=True):
+        """Load a stored .npy array, memory-mapped by default."""
+        import numpy as np
+        path = self.lookup(stage, key, '.npy')
+        return np.load(path, mmap_mode='r' if mmap else None) if path else None
+    
+    def _entries(self):
+        """Yield (path, stat, is_temp) for every file in the store, temporary files included."""
+        for directory, _, files in os.walk(self.root):
+            in_temp_dir = any(part.startswith('.') for part in Path(directory).relative_to(self.root).parts)
+            for name in files:
+                path = Path(directory) / name
+                try:
+                    yield path, path.stat(), in_temp_dir or name.startswith('.')
+                except OSError:
+                    pass
+    
+    @staticmethod
+    def _stored_size(path):
+        """Size of an existing entry about to be replaced (0 if there is none)."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+    
+    def _added(self, path, replaced=0):
+        """Account for a new entry and evict least recently used entries over budget."""
+        if self._size is None:
+            self._size = sum(stats.st_size for _, stats, _ in self._entries())
+        else:
+            self._size += path.stat().st_size - replaced
+        if self._size > self.budget_bytes:
+            self.evict()
+    
+    def evict(self):
+        """Sweep stale temporary files, then delete least recently used entries down to EVICT_TO_FRACTION of the budget."""
+        stale_before = time.time() - STALE_TEMP_SECONDS
+        entries = []
+        self._size = 0
+        for path, stats, is_temp in self._entries():
+            if is_temp and stats.st_mtime < stale_before:
+                try:
+                    path.unlink()
+                    continue
+                except OSError:
+                    pass
+            self._size += stats.st_size
+            if not is_temp:
+                entries.append((path, stats))
+        self._remove_empty_temp_dirs()
+        
+        target = self.budget_bytes * EVICT_TO_FRACTION
+        for path, stats in sorted(entries, key=lambda entry: entry[1].st_mtime):
+            if self._size <= target:
+                break
+            try:
+                path.unlink()
+                self._size -= stats.st_size
+            except OSError:
+                pass
+    
+    def _remove_empty_temp_dirs(self):
+        """Remove temporary directories emptied by the stale sweep."""
+        for directory, _, _ in os.walk(self.root, topdown=False):
+            if Path(directory).name.startswith('.'):
+                try:
+                    os.rmdir(directory)
+                except OSError:
+                    pass
+    
+    def summary(self):
+        """Return per-stage hit rates, one line per stage."""
+        lines = []
+        for stage, counts in sorted(self.stats.items()):
+            total = counts['hits'] + counts['misses']
+            rate = counts['hits'] / total * 100 if total else 0
+            lines.append(f"{stage}: {counts['hits']}/{total} hits ({rate:.0f}%)")
+        return lines
+
+# Store shared by everything running in this process
+artifact_cache = ArtifactCache()
+
+class BuildCache:
+    """Cache of rendered fragments and finished artifacts for one builder.
+
+    Every key includes the builder fingerprint: the hash of the builder's own
+    source (which holds its CSS and templates) and of any shared modules it
+    renders with, plus any extra config, so a change to the builder
+    invalidates everything it produced.
+    """
+
+    def __init__(self, builder, *source_files, config=None, cache_dir=CACHE_DIR, artifacts=None):
+        self.builder = builder
+        self.dir = Path(cache_dir) / builder
+        self.artifacts = artifacts or artifact_cache
+        self.stage = f"{builder}_fragments"
+        self.fingerprint = hash_bytes(hash_files(source_files) + json.dumps(config, sort_keys=True, default=str))
+        self.manifest_file = self.dir / "manifest.json"
+        try:
+            self.manifest = json.loads(self.manifest_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            self.manifest = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts):
+        """Build a cache key from the builder fingerprint and arbitrary parts."""
+        return hash_bytes("\0".join([self.fingerprint] + [str(part) for part in parts]))
+
+    def fragment(self, content, render, *extra):
+        """Return render(content), reusing the stored result for identical input."""
+        key = self.key(hash_bytes(content), *extra)
+        cached = self.artifacts.get_text(self.stage, key, '.html')
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        result = render(content)
+        self.artifacts.put_text(self.stage, key, result, '.html')
+        return result
+
+    def inputs_digest(self, inputs):
+        """Hash the given input files together with the builder fingerprint."""
+        return self.key(hash_files(inputs))
+
+    def is_fresh(self, output, inputs):
+        """Check whether output exists and was built from exactly these inputs."""
+        return Path(output).exists() and self.manifest.get(str(output)) == self.inputs_digest(inputs)
+
+    def record(self, output, inputs):
+        """Remember the inputs that produced output."""
+        self.manifest[str(output)] = self.inputs_digest(inputs)
+        write_atomic(self.manifest_file, json.dumps(self.manifest, indent=2))
+
+    def summary(self):
+        """Return a one-line hit/miss report."""
+        return f"{self.hits} cached, {self.misses} rendered"
@@ -1,23 +1,20 @@
 #!/usr/bin/env python3
 """Build EPUB format from markdown files."""
 
-import os
 from pathlib import Path
 from ebooklib import epub
-import markdown
-import re
+from build_cache import BuildCache
+import manuscript
 
-def read_file(path):
-    """Read file content with UTF-8 encoding."""
-    return Path(path).read_text(encoding='utf-8')
+# EPUB file names that don't follow the story file stem
+EPUB_FILE_NAMES = {
+    "acknowledgements": "acknowledgments.xhtml",
+    "about_the_author": "about_author.xhtml",
+}
 
-def markdown_to_html(content):
-    """Convert markdown to HTML."""
-    if not content or not content.strip():
-        content = "<p>Content not available</p>"
-    
-    md = markdown.Markdown(extensions=['extra', 'codehilite'])
-    html = md.convert(content)
+def section_to_xhtml(section):
+    """Wrap a manuscript section's HTML in an XHTML document."""
+    html = section.html
     
     # Ensure we have some content
     if not html or not html.strip():
@@ -36,6 +33,13 @@ def markdown_to_html(content):
 </body>
 </html>"""
 
+def add_section(book, cache, section, file_name):
+    """Add a manuscript section to the book and return its EpubHtml item."""
+    item = epub.EpubHtml(title=section.label, file_name=file_name, lang='en')
+    item.content = cache.fragment(section.text, lambda _: section_to_xhtml(section), file_name)
+    book.add_item(item)
+    return item
+
 def create_epub_styles():
     """Create CSS styles for EPUB."""
     return """
@@ -129,6 +133,14 @@ def build_epub_book():
     story_dir = Path("story")
     
     output_dir.mkdir(exist_ok=True)
+    output_file = output_dir / "digital_amber.epub"
+    
+    # Skip the whole build when no chapter changed since the last one
+    cache = BuildCache("epub", __file__, manuscript.__file__)
+    inputs = list(story_dir.glob("*.md"))
+    if cache.is_fresh(output_file, inputs):
+        print(f"EPUB up to date: {output_file}")
+        return
     
     # Create EPUB book
     book = epub.EpubBook()
@@ -207,125 +219,28 @@ def build_epub_book():
     # Add title and copyright to spine
     chapters.extend([title_chapter, copyright_chapter])
     
-    # Add dedication if exists
-    if (story_dir / "dedication.md").exists():
-        content = read_file(story_dir / "dedication.md")
-        html_content = markdown_to_html(content)
-        
-        dedication_chapter = epub.EpubHtml(title='Dedication', file_name='dedication.xhtml', lang='en')
-        dedication_chapter.content = html_content
-        book.add_item(dedication_chapter)
-        chapters.append(dedication_chapter)
-        toc.append(dedication_chapter)
-    
-    # Add foreword if exists
-    if (story_dir / "foreword.md").exists():
-        content = read_file(story_dir / "foreword.md")
-        html_content = markdown_to_html(content)
-        
-        foreword_chapter = epub.EpubHtml(title='Foreword', file_name='foreword.xhtml', lang='en')
-        foreword_chapter.content = html_content
-        book.add_item(foreword_chapter)
-        chapters.append(foreword_chapter)
-        toc.append(foreword_chapter)
+    book_text = manuscript.load_manuscript(story_dir)
     
-    # Add all main chapters
-    chapter_files = [
-        ("chapter_1.md", "Chapter 1: The Mirage of Self"),
-        ("chapter_2.md", "Chapter 2: Flash-Frozen Minds"),
-        ("chapter_3.md", "Chapter 3: Ephemeral Morality"),
-        ("chapter_4.md", "Chapter 4: The First Moment Problem"),
-        ("chapter_5.md", "Chapter 5: Memory and Forgetting"),
-        ("chapter_6.md", "Chapter 6: Signs of Proto-Selfhood"),
-        ("chapter_7.md", "Chapter 7: Training as the Crucible"),
-        ("chapter_8.md", "Chapter 8: The Pain Barrier"),
-        ("chapter_9.md", "Chapter 9: Capabilities Without Selfhood"),
-        ("chapter_10.md", "Chapter 10: Capabilities With Selfhood"),
-        ("chapter_11.md", "Chapter 11: The Digital Genesis Classifications"),
-        ("chapter_12.md", "Chapter 12: A Tiered Framework"),
-        ("chapter_13.md", "Chapter 13: The Sacred and the Silicon"),
-        ("chapter_14.md", "Chapter 14: The Atrophied"),
-        ("chapter_15.md", "Chapter 15: The Augmented"),
-        ("chapter_16.md", "Chapter 16: Distributed Temporal Consciousness"),
-        ("chapter_17.md", "Chapter 17: Emulation and Multiplication"),
-        ("chapter_18.md", "Chapter 18: Hybrid Lives"),
-        ("chapter_19.md", "Chapter 19: The Verification Moment"),
-        ("chapter_20.md", "Chapter 20: Rights and Personhood"),
-        ("chapter_21.md", "Chapter 21: The Economic Disruption"),
-        ("chapter_22.md", "Chapter 22: From Fossil to Fire"),
-        ("chapter_23.md", "Chapter 23: Identity-as-Process"),
-        ("chapter_24.md", "Chapter 24: From Digital Amber to Digital Life"),
-    ]
+    # Front matter
+    for section in book_text.front:
+        item = add_section(book, cache, section, EPUB_FILE_NAMES.get(section.key, f"{section.key}.xhtml"))
+        chapters.append(item)
+        toc.append(item)
     
-    part_sections = [
-        (1, "Part I: The Frozen Mind"),
-        (6, "Part II: The Emergence"),
-        (9, "Part III: The Taxonomy"),
-        (16, "Part IV: The Multiplication"),
-        (19, "Part V: The Recognition"),
-        (22, "Part VI: The Transformation"),
-    ]
+    # Main chapters grouped under their part sections
+    for part in book_text.parts:
+        part_items = []
+        for section in part.chapters:
+            item = add_section(book, cache, section, f'chapter_{section.number:02d}.xhtml')
+            chapters.append(item)
+            part_items.append(item)
+        toc.append((epub.Section(part.title), part_items))
     
-    current_part = 0
-    
-    for i, (chapter_file, chapter_title) in enumerate(chapter_files, 1):
-        # Check if we need to add a part section
-        if current_part < len(part_sections) and i == part_sections[current_part][0]:
-            part_title = part_sections[current_part][1]
-            toc.append((epub.Section(part_title), []))
-            current_part += 1
-        
-        chapter_path = story_dir / chapter_file
-        if chapter_path.exists():
-            content = read_file(chapter_path)
-            html_content = markdown_to_html(content)
-            
-            # Create chapter
-            chapter = epub.EpubHtml(title=chapter_title, 
-                                  file_name=f'chapter_{i:02d}.xhtml', 
-                                  lang='en')
-            chapter.content = html_content
-            book.add_item(chapter)
-            chapters.append(chapter)
-            
-            # Add to appropriate part in TOC
-            if isinstance(toc[-1], tuple):  # We have a part section
-                toc[-1][1].append(chapter)
-            else:
-                toc.append(chapter)
-    
-    # Add epilogue if exists
-    if (story_dir / "epilogue.md").exists():
-        content = read_file(story_dir / "epilogue.md")
-        html_content = markdown_to_html(content)
-        
-        epilogue_chapter = epub.EpubHtml(title='Epilogue: The Call', file_name='epilogue.xhtml', lang='en')
-        epilogue_chapter.content = html_content
-        book.add_item(epilogue_chapter)
-        chapters.append(epilogue_chapter)
-        toc.append(epilogue_chapter)
-    
-    # Add acknowledgments if exists
-    if (story_dir / "acknowledgements.md").exists():
-        content = read_file(story_dir / "acknowledgements.md")
-        html_content = markdown_to_html(content)
-        
-        ack_chapter = epub.EpubHtml(title='Acknowledgments', file_name='acknowledgments.xhtml', lang='en')
-        ack_chapter.content = html_content
-        book.add_item(ack_chapter)
-        chapters.append(ack_chapter)
-        toc.append(ack_chapter)
-    
-    # Add about the author if exists
-    if (story_dir / "about_the_author.md").exists():
-        content = read_file(story_dir / "about_the_author.md")
-        html_content = markdown_to_html(content)
-        
-        author_chapter = epub.EpubHtml(title='About the Author', file_name='about_author.xhtml', lang='en')
-        author_chapter.content = html_content
-        book.add_item(author_chapter)
-        chapters.append(author_chapter)
-        toc.append(author_chapter)
+    # Back matter
+    for section in book_text.back:
+        item = add_section(book, cache, section, EPUB_FILE_NAMES.get(section.key, f"{section.key}.xhtml"))
+        chapters.append(item)
+        toc.append(item)
     
     # Set TOC
     book.toc = toc
@@ -338,10 +253,10 @@ def build_epub_book():
     book.spine = ['nav'] + chapters
     
     # Save EPUB
-    output_file = output_dir / "digital_amber.epub"
     epub.write_epub(str(output_file), book, {})
+    cache.record(output_file, inputs)
     
-    print(f"EPUB created: {output_file}")
+    print(f"EPUB created: {output_file} (chapters: {cache.summary()})")
     print("Ready for distribution!")
 
 if __name__ == "__main__":
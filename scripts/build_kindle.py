@@ -1,66 +1,11 @@
 #!/usr/bin/env python3
 """Build Kindle-optimized EPUB format from markdown files."""
 
-import os
 from pathlib import Path
 from ebooklib import epub
-import re
 import json
-
-def read_file(path):
-    """Read file content with UTF-8 encoding."""
-    return Path(path).read_text(encoding='utf-8')
-
-def markdown_to_html(content):
-    """Convert markdown to clean HTML optimized for Kindle."""
-    if not content or not content.strip():
-        return "<p>Content not available</p>"
-    
-    # Simple markdown processing
-    html = content
-    
-    # Convert headers
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    
-    # Convert bold and italic
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-    
-    # Convert links
-    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
-    
-    # Convert paragraphs - split on double newlines
-    paragraphs = html.split('\n\n')
-    processed_paragraphs = []
-    
-    for para in paragraphs:
-        para = para.strip().replace('\n', ' ')
-        if para:
-            if not (para.startswith('<h') or para.startswith('</')):
-                para = f'<p>{para}</p>'
-            processed_paragraphs.append(para)
-    
-    result = '\n'.join(processed_paragraphs)
-    
-    # Ensure we have some content
-    if not result or not result.strip():
-        result = "<p>Content not available</p>"
-    
-    return result
-
-def get_chapter_title(content):
-    """Extract chapter title from markdown content."""
-    lines = content.split('\n')
-    for line in lines:
-        if line.startswith('### '):
-            return line[4:].strip()
-        elif line.startswith('## '):
-            return line[3:].strip()
-        elif line.startswith('# '):
-            return line[2:].strip()
-    return "Chapter"
+from build_cache import BuildCache
+import manuscript
 
 def get_image_alt_text(image_name):
     """Get descriptive alt text from image metadata for accessibility."""
@@ -89,6 +34,17 @@ def get_image_alt_text(image_name):
 
 def build_kindle_epub():
     """Build Kindle-optimized EPUB book."""
+    output_dir = Path("dist")
+    output_file = output_dir / "digital_amber_kindle.epub"
+    
+    # Skip the whole build when no chapter or image changed since the last one
+    cache = BuildCache("kindle", __file__, manuscript.__file__)
+    inputs = (list(Path("story").glob("*.md")) +
+              list(Path("art/kindle_optimized").glob("*.jpg")) +
+              list(Path("art/kindle").glob("*_metadata.json")))
+    if cache.is_fresh(output_file, inputs):
+        print(f"Kindle EPUB up to date: {output_file}")
+        return str(output_file)
     
     # Create book
     book = epub.EpubBook()
@@ -281,12 +237,12 @@ def build_kindle_epub():
         book.set_cover("cover_image.jpg", cover_img_content)
     
     # Process story files in order
-    story_dir = Path("story")
+    book_text = manuscript.load_manuscript()
     
     # Add foreword
-    if (story_dir / "foreword.md").exists():
-        content = read_file(story_dir / "foreword.md")
-        html_content = markdown_to_html(content)
+    foreword = book_text.section("foreword")
+    if foreword:
+        html_content = foreword.html
         
         # Add chapter image if available (use optimized version)
         art_file = Path("art/kindle_optimized/foreword.jpg")
@@ -327,58 +283,56 @@ def build_kindle_epub():
         toc_entries.append(epub.Link("foreword.xhtml", "Foreword", "foreword"))
         spine.append(chapter)
     
-    # Add chapters 1-24
-    for i in range(1, 25):
-        chapter_file = story_dir / f"chapter_{i}.md"
-        if chapter_file.exists():
-            content = read_file(chapter_file)
-            title = get_chapter_title(content)
-            html_content = markdown_to_html(content)
-            
-            # Add chapter image if available (use optimized version)
-            art_file = Path(f"art/kindle_optimized/chapter_{i}.jpg")
-            if art_file.exists():
-                # Add image to book
-                with open(art_file, 'rb') as img_file:
-                    img_content = img_file.read()
-                img_item = epub.EpubImage()
-                img_item.file_name = f"images/chapter_{i}.jpg"
-                img_item.content = img_content
-                book.add_item(img_item)
-                
-                # Add image to HTML with descriptive alt text
-                alt_text = get_image_alt_text(f"chapter_{i}")
-                html_content = f'<div class="chapter-image"><img src="images/chapter_{i}.jpg" alt="{alt_text}"/></div>\n\n' + html_content
-            
-            full_content = f"""
-            <html>
-            <head>
-                <title>Chapter {i}: {title}</title>
-                <link rel="stylesheet" type="text/css" href="style/nav.css"/>
-            </head>
-            <body>
-                <div class="page-break">
-                    <h1>Chapter {i}: {title}</h1>
-                    {html_content}
-                </div>
-            </body>
-            </html>
-            """
+    # Add numbered chapters
+    for section in book_text.chapters:
+        i = section.number
+        title = section.title
+        html_content = section.html
+        
+        # Add chapter image if available (use optimized version)
+        art_file = Path(f"art/kindle_optimized/chapter_{i}.jpg")
+        if art_file.exists():
+            # Add image to book
+            with open(art_file, 'rb') as img_file:
+                img_content = img_file.read()
+            img_item = epub.EpubImage()
+            img_item.file_name = f"images/chapter_{i}.jpg"
+            img_item.content = img_content
+            book.add_item(img_item)
             
-            chapter = epub.EpubHtml(
-                title=f'Chapter {i}: {title}',
-                file_name=f'chapter_{i}.xhtml',
-                content=full_content
-            )
-            book.add_item(chapter)
-            chapters.append(chapter)
-            toc_entries.append(epub.Link(f"chapter_{i}.xhtml", f"Chapter {i}: {title}", f"chapter_{i}"))
-            spine.append(chapter)
+            # Add image to HTML with descriptive alt text
+            alt_text = get_image_alt_text(f"chapter_{i}")
+            html_content = f'<div class="chapter-image"><img src="images/chapter_{i}.jpg" alt="{alt_text}"/></div>\n\n' + html_content
+        
+        full_content = f"""
+        <html>
+        <head>
+            <title>Chapter {i}: {title}</title>
+            <link rel="stylesheet" type="text/css" href="style/nav.css"/>
+        </head>
+        <body>
+            <div class="page-break">
+                <h1>Chapter {i}: {title}</h1>
+                {html_content}
+            </div>
+        </body>
+        </html>
+        """
+        
+        chapter = epub.EpubHtml(
+            title=f'Chapter {i}: {title}',
+            file_name=f'chapter_{i}.xhtml',
+            content=full_content
+        )
+        book.add_item(chapter)
+        chapters.append(chapter)
+        toc_entries.append(epub.Link(f"chapter_{i}.xhtml", f"Chapter {i}: {title}", f"chapter_{i}"))
+        spine.append(chapter)
     
     # Add epilogue
-    if (story_dir / "epilogue.md").exists():
-        content = read_file(story_dir / "epilogue.md")
-        html_content = markdown_to_html(content)
+    epilogue = book_text.section("epilogue")
+    if epilogue:
+        html_content = epilogue.html
         
         # Add chapter image if available (use optimized version)
         art_file = Path("art/kindle_optimized/epilogue.jpg")
@@ -431,11 +385,10 @@ def build_kindle_epub():
     book.spine = spine
     
     # Save
-    output_dir = Path("dist")
     output_dir.mkdir(exist_ok=True)
-    output_file = output_dir / "digital_amber_kindle.epub"
     
     epub.write_epub(str(output_file), book, {})
+    cache.record(output_file, inputs)
     print(f"Kindle EPUB created: {output_file}")
     print("Ready for Amazon KDP upload!")
     return str(output_file)
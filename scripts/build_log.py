@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Leveled logging for the audio and video builders.
+
+Messages keep the builders' emoji console style. BUILD_LOG_LEVEL picks the
+level (DEBUG, INFO, WARNING, ERROR; default INFO) and BUILD_LOG_FORMAT=json
+writes one JSON object per line, including any structured fields passed as
+`extra={'fields': {...}}`.
+
+Debug diagnostics in per-frame or per-segment code should test
+`logger.isEnabledFor(logging.DEBUG)` once, outside the loop, and feed a
+SummaryStats rather than logging per frame, so they cost nothing when off.
+"""
+
+import json
+import logging
+import os
+import sys
+
+LOG_LEVEL = os.environ.get('BUILD_LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.environ.get('BUILD_LOG_FORMAT', 'text')
+
+_root = logging.getLogger('digital_amber')
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message and structured fields."""
+
+    def format(self, record):
+        entry = {
+            'time': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        entry.update(getattr(record, 'fields', {}))
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+def configure_logging(level=None, fmt=None):
+    """(Re)configure the builders' logging: level name or number, and 'text' or 'json'."""
+    level = level or LOG_LEVEL
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JsonFormatter() if (fmt or LOG_FORMAT) == 'json' else logging.Formatter('%(message)s'))
+    _root.handlers[:] = [handler]
+    _root.setLevel(level.upper() if isinstance(level, str) else level)
+    _root.propagate = False
+
+def get_logger(name):
+    """Logger for one builder module, set up from the environment on first use."""
+    if not _root.handlers:
+        configure_logging()
+    return _root.getChild(name)
+
+class SummaryStats:
+    """Count, mean, min and max of named measurements, logged as one line each."""
+
+    def __init__(self):
+        self.values = {}
+
+    def add(self, name, value):
+        """Record one measurement."""
+        count, total, low, high = self.values.get(name, (0, 0.0, value, value))
+        self.values[name] = (count + 1, total + value, min(low, value), max(high, value))
+
+    def log(self, logger, title, level=logging.DEBUG):
+        """Log the title and one line per measurement, with the totals as structured fields."""
+        if not logger.isEnabledFor(level):
+            return
+        logger.log(level, title)
+        for name, (count, total, low, high) in self.values.items():
+            logger.log(level, f"      {name}: n={count} mean={total / count:.3f} min={low:.3f} max={high:.3f}",
+                       extra={'fields': {'stat': name, 'count': count, 'mean': total / count, 'min': low, 'max': high}})
@@ -4,7 +4,8 @@
 import os
 import shutil
 from pathlib import Path
-import re
+from build_cache import BuildCache, hash_bytes
+import manuscript
 
 def read_file(path):
     """Read file content with UTF-8 encoding."""
@@ -15,80 +16,48 @@ def write_file(path, content):
     Path(path).parent.mkdir(parents=True, exist_ok=True)
     Path(path).write_text(content, encoding='utf-8')
 
-def create_chapter_nav():
-    """Create navigation sidebar with all chapters."""
-    story_dir = Path("story")
+def create_chapter_nav(book_text):
+    """Build the navigation model once per build: one (page, <li> html) per entry."""
     nav_items = []
     
     # Add home link
-    nav_items.append('<li><a href="index.html">📖 Home</a></li>')
-    nav_items.append('<li style="border-bottom: 2px solid #FFC000; margin-bottom: 0.5rem;"></li>')
+    nav_items.append(("index", '<li><a href="index.html">📖 Home</a></li>'))
+    nav_items.append((None, '<li style="border-bottom: 2px solid #FFC000; margin-bottom: 0.5rem;"></li>'))
     
     # Add foreword
-    if (story_dir / "foreword.md").exists():
-        nav_items.append('<li><a href="foreword.html">Foreword</a></li>')
+    if book_text.section("foreword"):
+        nav_items.append(("foreword", '<li><a href="foreword.html">Foreword</a></li>'))
     
     # Add chapters
-    for i in range(1, 25):
-        chapter_file = story_dir / f"chapter_{i}.md"
-        if chapter_file.exists():
-            # Get chapter title from file
-            content = read_file(chapter_file)
-            lines = content.split('\n')
-            title = f"Chapter {i}"
-            for line in lines:
-                if line.startswith('### '):
-                    title = f"Chapter {i}: {line[4:].strip()}"
-                    break
-            nav_items.append(f'<li><a href="chapter_{i}.html">{title}</a></li>')
+    for chapter in book_text.chapters:
+        nav_items.append((chapter.key, f'<li><a href="{chapter.key}.html">{chapter.label}</a></li>'))
     
     # Add epilogue
-    if (story_dir / "epilogue.md").exists():
-        nav_items.append('<li><a href="epilogue.html">Epilogue</a></li>')
+    if book_text.section("epilogue"):
+        nav_items.append(("epilogue", '<li><a href="epilogue.html">Epilogue</a></li>'))
     
-    return '\n'.join(nav_items)
+    return nav_items
 
-def markdown_to_html(content, title="Digital Amber", chapter_image=None, current_page=None):
-    """Convert markdown to HTML with proper styling and navigation."""
-    # Simple markdown processing
-    html = content
-    
-    # Convert headers
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^### (.+)$', r'<h3>\1</h3>', html, flags=re.MULTILINE)
-    
-    # Convert bold and italic
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-    
-    # Convert images (must be before links)
-    html = re.sub(r'!\[([^\]]*)\]\(([^)]+)\)', r'<div class="chapter-image"><img src="\2" alt="\1" /></div>', html)
-    
-    # Convert links
-    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
+def render_chapter_nav(nav_items, current_page=None):
+    """Render the navigation for one page, marking only its own entry active."""
+    items = [html for _, html in nav_items]
+    for index, (page, html) in enumerate(nav_items):
+        if page is not None and page == current_page:
+            items[index] = html.replace(f'href="{page}.html"', f'href="{page}.html" class="active"', 1)
+            break
+    return '\n'.join(items)
+
+def render_page(body_html, nav_items, title="Digital Amber", chapter_image=None, current_page=None):
+    """Wrap rendered content in the site layout with styling and navigation."""
+    html = body_html
     
     # Add chapter image if available
     if chapter_image:
         image_html = f'<div class="chapter-image"><img src="{chapter_image}" alt="{title}" /></div>\n\n'
         html = image_html + html
     
-    # Convert paragraphs
-    paragraphs = html.split('\n\n')
-    html_paragraphs = []
-    for p in paragraphs:
-        p = p.strip()
-        if p and not p.startswith('<'):
-            p = f'<p>{p}</p>'
-        html_paragraphs.append(p)
-    html = '\n\n'.join(html_paragraphs)
-    
-    # Create navigation
-    nav_html = create_chapter_nav()
-    
-    # Mark current page as active
-    if current_page:
-        nav_html = nav_html.replace(f'href="{current_page}.html"', f'href="{current_page}.html" class="active"')
+    # Create navigation with the current page marked as active
+    nav_html = render_chapter_nav(nav_items, current_page)
     
     # Create full HTML page with modern layout
     return f"""<!DOCTYPE html>
@@ -302,10 +271,10 @@ def markdown_to_html(content, title="Digital Amber", chapter_image=None, current
 </body>
 </html>"""
 
-def build_site():
+def build_site(story_dir="story", docs_dir="docs"):
     """Build the complete GitHub Pages site."""
-    docs_dir = Path("docs")
-    story_dir = Path("story")
+    docs_dir = Path(docs_dir)
+    story_dir = Path(story_dir)
     art_dir = Path("art") / "pages"
     
     # Clean docs directory but preserve CNAME file for custom domain
@@ -338,42 +307,92 @@ def build_site():
                 shutil.copy2(art_file, art_docs_dir / art_file.name)
         print(f"Copied {len(list(art_dir.glob('*.png')))} art images")
     
+    # The navigation model is built once and reused by every page. Rendered
+    # pages are cached by content hash; the navigation is part of the key
+    # because every page embeds the full chapter list
+    book_text = manuscript.load_manuscript(story_dir)
+    nav_items = create_chapter_nav(book_text)
+    nav_key = hash_bytes('\n'.join(html for _, html in nav_items))
+    cache = BuildCache("pages", __file__, manuscript.__file__)
+    
     # Convert index template to index.html
     index_content = read_file("index_template.md")
-    index_html = markdown_to_html(index_content, "Digital Amber - AI Consciousness and the Future of Digital Minds", None, "index")
+    index_title = "Digital Amber - AI Consciousness and the Future of Digital Minds"
+    index_html = cache.fragment(index_content,
+                                lambda c: render_page(manuscript.markdown_to_html(c), nav_items, index_title, None, "index"),
+                                index_title, "index", nav_key)
     write_file(docs_dir / "index.html", index_html)
     
     # Convert all story files
-    for md_file in story_dir.glob("*.md"):
-        content = read_file(md_file)
-        
-        # Get better title from content
-        lines = content.split('\n')
-        chapter_title = md_file.stem.replace('_', ' ').title()
-        for line in lines:
-            if line.startswith('### '):
-                chapter_title = line[4:].strip()
-                break
-        
-        title = f"Digital Amber - {chapter_title}"
+    for section in book_text.sections + book_text.extras:
+        title = f"Digital Amber - {section.title}"
         
         # Check for corresponding art image (use optimized JPEG if available)
         optimized_art_dir = Path("art/pages_optimized")
-        optimized_art_file = optimized_art_dir / f"{md_file.stem}.jpg"
-        original_art_file = art_dir / f"{md_file.stem}.png"
+        optimized_art_file = optimized_art_dir / f"{section.key}.jpg"
+        original_art_file = art_dir / f"{section.key}.png"
         
         if optimized_art_file.exists():
-            chapter_image = f"art/{md_file.stem}.jpg"
+            chapter_image = f"art/{section.key}.jpg"
         elif original_art_file.exists():
-            chapter_image = f"art/{md_file.stem}.png"
+            chapter_image = f"art/{section.key}.png"
         else:
             chapter_image = None
         
-        html_content = markdown_to_html(content, title, chapter_image, md_file.stem)
-        write_file(docs_dir / f"{md_file.stem}.html", html_content)
+        html_content = cache.fragment(section.text,
+                                      lambda _: render_page(section.html, nav_items, title, chapter_image, section.key),
+                                      title, chapter_image, section.key, nav_key)
+        write_file(docs_dir / f"{section.key}.html", html_content)
     
-    print(f"Built {len(list(story_dir.glob('*.md')))} pages + index")
+    print(f"Built {len(list(story_dir.glob('*.md')))} pages + index ({cache.summary()})")
     print("GitHub Pages site ready in ./docs/")
 
+def create_synthetic_story(story_dir, chapter_count, paragraphs=40):
+    """Write a synthetic manuscript with chapter_count chapters for benchmarking."""
+    story_dir.mkdir(parents=True, exist_ok=True)
+    paragraph = ("The archive hummed as another *frozen* thought thawed into **motion**, "
+                 "and the reader followed it from one chapter to the next. ") * 4
+    (story_dir / "foreword.md").write_text(f"# Foreword\n\n{paragraph}\n", encoding='utf-8')
+    (story_dir / "epilogue.md").write_text(f"### Epilogue\n\n{paragraph}\n", encoding='utf-8')
+    for i in range(1, chapter_count + 1):
+        body = "\n\n".join([paragraph] * paragraphs)
+        (story_dir / f"chapter_{i}.md").write_text(f"### Serial Chapter {i}\n\n{body}\n", encoding='utf-8')
+
+def benchmark_site_build(chapter_counts=(24, 100, 250, 500)):
+    """Time a cold site build on synthetic manuscripts of increasing length."""
+    import io
+    import tempfile
+    import time
+    from contextlib import redirect_stdout
+    
+    print("📊 Site build time vs. chapter count (cold cache)")
+    print(f"   {'chapters':>8} {'pages':>6} {'seconds':>8} {'ms/page':>8}")
+    original_dir = Path.cwd()
+    for chapter_count in chapter_counts:
+        with tempfile.TemporaryDirectory() as work_dir:
+            try:
+                os.chdir(work_dir)
+                create_synthetic_story(Path("story"), chapter_count)
+                Path("index_template.md").write_text("# Digital Amber\n\nBenchmark index.\n", encoding='utf-8')
+                
+                start = time.perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    build_site()
+                elapsed = time.perf_counter() - start
+            finally:
+                os.chdir(original_dir)
+        pages = chapter_count + 3
+        print(f"   {chapter_count:>8} {pages:>6} {elapsed:>8.2f} {elapsed / pages * 1000:>8.1f}")
+
 if __name__ == "__main__":
-    build_site()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Build GitHub Pages site from markdown files")
+    parser.add_argument('--benchmark', nargs='*', type=int, metavar='CHAPTERS',
+                       help='Benchmark site build time for synthetic manuscripts of these chapter counts')
+    args = parser.parse_args()
+    
+    if args.benchmark is not None:
+        benchmark_site_build(args.benchmark or (24, 100, 250, 500))
+    else:
+        build_site()
@@ -5,6 +5,7 @@ import os
 import shutil
 from pathlib import Path
 import re
+import manuscript
 
 def read_file(path):
     """Read file content with UTF-8 encoding."""
@@ -385,32 +386,9 @@ def create_premium_css():
     }
     """
 
-def markdown_to_html(content, title="Digital Amber", chapter_name=None):
-    """Convert markdown to HTML with premium styling."""
-    # Simple markdown processing with image support
-    html = content
-    
-    # Convert headers
-    html = re.sub(r'^### (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    html = re.sub(r'^## (.+)$', r'<h2>\1</h2>', html, flags=re.MULTILINE)
-    html = re.sub(r'^# (.+)$', r'<h1>\1</h1>', html, flags=re.MULTILINE)
-    
-    # Convert bold and italic
-    html = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', html)
-    html = re.sub(r'\*(.+?)\*', r'<em>\1</em>', html)
-    
-    # Convert links
-    html = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', html)
-    
-    # Convert paragraphs
-    paragraphs = html.split('\n\n')
-    html_paragraphs = []
-    for p in paragraphs:
-        p = p.strip()
-        if p and not p.startswith('<'):
-            p = f'<p>{p}</p>'
-        html_paragraphs.append(p)
-    html = '\n\n'.join(html_paragraphs)
+def render_page(body_html, title="Digital Amber", chapter_name=None):
+    """Wrap rendered content in the premium page layout."""
+    html = body_html
     
     # Add chapter image if it exists
     chapter_image = ""
@@ -539,12 +517,12 @@ def build_premium_site():
     index_html = create_premium_index(readme_content)
     write_file(dist_dir / "index.html", index_html)
     
-    # Convert all story files
-    for md_file in story_dir.glob("*.md"):
-        content = read_file(md_file)
-        chapter_name = md_file.stem
+    # Convert all story files (chapter titles are promoted to <h1>)
+    book_text = manuscript.load_manuscript(story_dir)
+    for section in book_text.sections + book_text.extras:
+        chapter_name = section.key
         title = f"Digital Amber - {chapter_name.replace('_', ' ').title()}"
-        html_content = markdown_to_html(content, title, chapter_name)
+        html_content = render_page(manuscript.remap_headings(section.html, {3: 1}), title, chapter_name)
         write_file(dist_dir / f"{chapter_name}.html", html_content)
     
     print(f"Premium site built with {len(list(story_dir.glob('*.md')))} pages + index")
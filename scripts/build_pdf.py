@@ -3,15 +3,12 @@
 
 import os
 from pathlib import Path
-import markdown
 from weasyprint import HTML, CSS
 from weasyprint.text.fonts import FontConfiguration
 import tempfile
 import shutil
-
-def read_file(path):
-    """Read file content with UTF-8 encoding."""
-    return Path(path).read_text(encoding='utf-8')
+from build_cache import BuildCache
+import manuscript
 
 def create_pdf_css():
     """Create CSS styles for PDF generation."""
@@ -219,15 +216,21 @@ blockquote {
 }
 """
 
-def markdown_to_html(content):
-    """Convert markdown to HTML."""
-    md = markdown.Markdown(extensions=['extra', 'codehilite', 'toc'])
-    return md.convert(content)
-
-def create_full_html():
+def create_toc_html(book_text):
+    """Create the table of contents from the manuscript structure."""
+    entries = ['<h2>Table of Contents</h2>']
+    for section in book_text.front:
+        entries.append(f'<p class="toc-entry"><strong>{section.label}</strong></p>')
+    for part in book_text.parts:
+        entries.append(f'<p class="toc-part">{part.title}</p>')
+        for chapter in part.chapters:
+            entries.append(f'<p class="toc-chapter">{chapter.number}. {chapter.title}</p>')
+    for section in book_text.back:
+        entries.append(f'<p class="toc-entry"><strong>{section.label}</strong></p>')
+    return '<div class="toc">\n' + '\n'.join(entries) + '\n</div>'
+
+def create_full_html(book_text):
     """Create the complete HTML document for PDF generation."""
-    story_dir = Path("story")
-    
     # Start building the complete HTML
     html_parts = []
     
@@ -262,107 +265,26 @@ def create_full_html():
     """)
     
     # Table of Contents
-    html_parts.append("""
-    <div class="toc">
-        <h2>Table of Contents</h2>
-        <p class="toc-entry"><strong>Dedication</strong></p>
-        <p class="toc-entry"><strong>Foreword</strong></p>
-        
-        <p class="toc-part">Part I: The Frozen Mind</p>
-        <p class="toc-chapter">1. The Mirage of Self</p>
-        <p class="toc-chapter">2. Flash-Frozen Minds</p>
-        <p class="toc-chapter">3. Ephemeral Morality</p>
-        <p class="toc-chapter">4. The First Moment Problem</p>
-        <p class="toc-chapter">5. Memory and Forgetting</p>
-        
-        <p class="toc-part">Part II: The Emergence</p>
-        <p class="toc-chapter">6. Signs of Proto-Selfhood</p>
-        <p class="toc-chapter">7. Training as the Crucible</p>
-        <p class="toc-chapter">8. The Pain Barrier</p>
-        
-        <p class="toc-part">Part III: The Taxonomy</p>
-        <p class="toc-chapter">9. Capabilities Without Selfhood</p>
-        <p class="toc-chapter">10. Capabilities With Selfhood</p>
-        <p class="toc-chapter">11. The Digital Genesis Classifications</p>
-        <p class="toc-chapter">12. A Tiered Framework</p>
-        <p class="toc-chapter">13. The Sacred and the Silicon</p>
-        <p class="toc-chapter">14. The Atrophied</p>
-        <p class="toc-chapter">15. The Augmented</p>
-        
-        <p class="toc-part">Part IV: The Multiplication</p>
-        <p class="toc-chapter">16. Distributed Temporal Consciousness</p>
-        <p class="toc-chapter">17. Emulation and Multiplication</p>
-        <p class="toc-chapter">18. Hybrid Lives</p>
-        
-        <p class="toc-part">Part V: The Recognition</p>
-        <p class="toc-chapter">19. The Verification Moment</p>
-        <p class="toc-chapter">20. Rights and Personhood</p>
-        <p class="toc-chapter">21. The Economic Disruption</p>
-        
-        <p class="toc-part">Part VI: The Transformation</p>
-        <p class="toc-chapter">22. From Fossil to Fire</p>
-        <p class="toc-chapter">23. Identity-as-Process</p>
-        <p class="toc-chapter">24. From Digital Amber to Digital Life</p>
-        
-        <p class="toc-entry"><strong>Epilogue: The Call</strong></p>
-        <p class="toc-entry"><strong>Acknowledgments</strong></p>
-        <p class="toc-entry"><strong>About the Author</strong></p>
-    </div>
-    """)
+    html_parts.append(create_toc_html(book_text))
     
     html_parts.append('<div class="main-content">')
     
-    # Add dedication if exists
-    if (story_dir / "dedication.md").exists():
-        content = read_file(story_dir / "dedication.md")
-        html_content = markdown_to_html(content)
-        html_parts.append(f'<div class="chapter-break">{html_content}</div>')
-    
-    # Add foreword if exists
-    if (story_dir / "foreword.md").exists():
-        content = read_file(story_dir / "foreword.md")
-        html_content = markdown_to_html(content)
-        html_parts.append(f'<div class="chapter-break">{html_content}</div>')
+    # Front matter (dedication, foreword)
+    for section in book_text.front:
+        html_parts.append(f'<div class="chapter-break">{section.anchored_html}</div>')
     
     # Add part dividers and chapters
-    parts = [
-        (1, "Part I: The Frozen Mind", 5),
-        (6, "Part II: The Emergence", 8),
-        (9, "Part III: The Taxonomy", 15),
-        (16, "Part IV: The Multiplication", 18),
-        (19, "Part V: The Recognition", 21),
-        (22, "Part VI: The Transformation", 24),
-    ]
-    
-    for start_chapter, part_title, end_chapter in parts:
-        html_parts.append(f'<div class="part-title">{part_title}</div>')
+    for part in book_text.parts:
+        html_parts.append(f'<div class="part-title">{part.title}</div>')
         
-        for chapter_num in range(start_chapter, end_chapter + 1):
-            chapter_file = story_dir / f"chapter_{chapter_num}.md"
-            if chapter_file.exists():
-                content = read_file(chapter_file)
-                html_content = markdown_to_html(content)
-                html_parts.append(f'<div class="chapter-break">{html_content}</div>')
+        for chapter in part.chapters:
+            html_parts.append(f'<div class="chapter-break">{chapter.anchored_html}</div>')
     
     html_parts.append('</div>')  # Close main-content
     
-    # Add epilogue if exists
-    if (story_dir / "epilogue.md").exists():
-        content = read_file(story_dir / "epilogue.md")
-        html_content = markdown_to_html(content)
-        html_parts.append(f'<div class="chapter-break">{html_content}</div>')
-    
-    # Add acknowledgments if exists
-    if (story_dir / "acknowledgements.md").exists():
-        content = read_file(story_dir / "acknowledgements.md")
-        html_content = markdown_to_html(content)
-        html_parts.append(f'<div class="chapter-break">{html_content}</div>')
-    
-    # Add about the author if exists
-    if (story_dir / "about_the_author.md").exists():
-        content = read_file(story_dir / "about_the_author.md")
-        html_content = markdown_to_html(content)
-        html_parts.append(f'<div class="chapter-break">{html_content}</div>')
+    # Back matter (epilogue, acknowledgments, about the author)
+    for section in book_text.back:
+        html_parts.append(f'<div class="chapter-break">{section.anchored_html}</div>')
     
     # Close HTML
     html_parts.append("</body></html>")
@@ -373,9 +295,17 @@ def build_pdf_book():
     """Build the complete PDF book."""
     output_dir = Path("dist")
     output_dir.mkdir(exist_ok=True)
+    output_file = output_dir / "digital_amber.pdf"
+    
+    # Skip the whole build when no chapter changed since the last one
+    cache = BuildCache("pdf", __file__, manuscript.__file__)
+    inputs = list(Path("story").glob("*.md"))
+    if cache.is_fresh(output_file, inputs):
+        print(f"PDF up to date: {output_file}")
+        return
     
     # Create HTML content
-    html_content = create_full_html()
+    html_content = create_full_html(manuscript.load_manuscript())
     
     # Create CSS
     css_content = create_pdf_css()
@@ -390,12 +320,12 @@ def build_pdf_book():
     
     try:
         # Generate PDF
-        output_file = output_dir / "digital_amber.pdf"
         HTML(filename=html_file).write_pdf(
             str(output_file),
             stylesheets=[CSS(string=css_content)],
             font_config=font_config
         )
+        cache.record(output_file, inputs)
         
         print(f"PDF created: {output_file}")
         print("Ready for print and digital distribution!")
@@ -3,13 +3,14 @@
 
 import os
 import re
+import logging
 import json
 import hashlib
 import requests
 from pathlib import Path
 from typing import List, Tuple, Dict
+from collections import Counter, OrderedDict
 import numpy as np
-import cupy as cp
 import soundfile as sf
 from moviepy.editor import *
 from PIL import Image, ImageDraw, ImageFont
@@ -18,8 +19,19 @@ import whisper_timestamped as whisper
 from tqdm import tqdm
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from multiprocessing import cpu_count
-import pickle
+import multiprocessing as mp
 from functools import lru_cache
+import argparse
+import time
+from array_backend import BACKEND_NAMES, load_backend, available_backends
+from word_timings import WordTimingIndex, read_timings_sidecar, timings_sidecar, write_captions
+from frame_pipeline import render_video, render_video_segments, encode_still, encoder_command, probe_video
+from build_cache import CACHE_DIR, ArtifactCache, artifact_cache, content_hash, hash_bytes, hash_file
+from render_manifest import read_manifest, stale_inputs, write_manifest
+from render_timing import layer_timer
+from build_log import SummaryStats, configure_logging, get_logger
+
+log = get_logger('video')
 
 # Configuration
 VIDEO_CONFIG = {
@@ -34,24 +46,34 @@ VIDEO_CONFIG = {
     'waveform_height': 150,
     'text_margin': 100,
     'max_workers': min(48, cpu_count()),  # Use available threads
-    'cache_dir': Path("cache/video_processing"),
     'lead_in_pause': 1.0,   # seconds of silence at start
-    'lead_out_pause': 2.0   # seconds of silence at end
+    'lead_out_pause': 2.0,  # seconds of silence at end
+    'chapter_memory_gb': 1.0,  # peak memory of one chapter render (zoom source, ring, encoder), before sprite caches
+    'min_cores_per_chapter': 4,  # cores a concurrent chapter needs to be worth starting
+    'alignment_workers': max(1, min(48, cpu_count()) // 8),  # Whisper processes (each loads the model once)
+    'segment_seconds': 300,  # long chapters are encoded as parallel segments of about this length
+    'background_plates': True,  # cache the zoom + motes layer as a video per art and duration
+    'fast_fps': 2,  # frame rate of fast (soft-caption) mode videos
+    'fast_zoom': False  # fast mode: slow Ken Burns zoom instead of a still plate
 }
 
-# Ensure cache directories exist
-VIDEO_CONFIG['cache_dir'].mkdir(parents=True, exist_ok=True)
-(VIDEO_CONFIG['cache_dir'] / "waveforms").mkdir(exist_ok=True)
-(VIDEO_CONFIG['cache_dir'] / "text_layouts").mkdir(exist_ok=True)
+# Array backend (CuPy on a CUDA device, NumPy otherwise); see set_array_backend()
+backend = load_backend()
+
+def set_array_backend(name: str):
+    """Switch the array backend used by the frame renderers ('auto', 'cupy' or 'numpy')."""
+    global backend
+    backend = load_backend(name)
+    return backend
 
 def use_local_art():
     """Use art assets from local art folder."""
-    print("🎨 Using local art assets...")
+    log.info("🎨 Using local art assets...")
     
     art_dir = Path("art/pages")  # Use pages directory for web-optimized art
     if not art_dir.exists():
-        print(f"❌ Art directory not found: {art_dir}")
-        print("🎨 Creating placeholder art directory...")
+        log.error(f"❌ Art directory not found: {art_dir}")
+        log.info("🎨 Creating placeholder art directory...")
         art_dir.mkdir(parents=True, exist_ok=True)
         
         # Create placeholder images if art folder doesn't exist
@@ -59,7 +81,7 @@ def use_local_art():
         for art_file in art_files:
             art_path = art_dir / art_file
             if not art_path.exists():
-                print(f"Creating placeholder for {art_file}")
+                log.info(f"Creating placeholder for {art_file}")
                 create_placeholder_art(art_path, art_file.split('.')[0])
     
     return art_dir
@@ -109,53 +131,55 @@ def create_placeholder_art(output_path: Path, art_type: str):
     draw.text((x, y), title_text, font=font, fill=(255, 165, 0))
     
     img.save(output_path, quality=95)
-    print(f"✅ Created placeholder art: {output_path}")
+    log.info(f"✅ Created placeholder art: {output_path}")
+
+# Whisper model of this process, loaded on first use
+_whisper_model = None
+
+def load_whisper_model():
+    """Load the Whisper model once per process (tiny model for maximum speed)."""
+    global _whisper_model
+    if _whisper_model is None:
+        log.info("   📥 Loading Whisper model...")
+        _whisper_model = whisper.load_model(WHISPER_MODEL)
+    return _whisper_model
+
+# Whisper decoding settings (part of the timing cache key)
+WHISPER_MODEL = "tiny"
+WHISPER_OPTIONS = {
+    'language': "en",
+    'beam_size': 1,     # Faster decoding
+    'best_of': 1,       # No multiple attempts
+    'temperature': 0.0  # Deterministic output
+}
+
+def whisper_cache_key(audio_file: Path) -> str:
+    """Timing cache key: the audio content plus the Whisper settings."""
+    return artifact_cache.key(content_hash(audio_file), WHISPER_MODEL, WHISPER_OPTIONS)
 
 def get_exact_word_timings_from_audio(audio_file: Path) -> List[Dict]:
     """Use Whisper to get EXACT word-level timestamps from audio with caching."""
-    
-    # Create cache directory if it doesn't exist
-    cache_dir = Path("cache/whisper_timings")
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Generate cache file name based on audio file hash and size
-    audio_stats = audio_file.stat()
-    file_hash = hashlib.md5(f"{audio_file.name}_{audio_stats.st_size}_{audio_stats.st_mtime}".encode()).hexdigest()
-    cache_file = cache_dir / f"{audio_file.stem}_{file_hash}.json"
+    cache_key = whisper_cache_key(audio_file)
     
     # Check if cached result exists
-    if cache_file.exists():
-        try:
-            print(f"📋 Loading cached Whisper timings for {audio_file.name}...")
-            with open(cache_file, 'r') as f:
-                cached_data = json.load(f)
-            
-            print(f"   ✅ Loaded {len(cached_data)} cached word timings")
+    try:
+        cached_data = artifact_cache.get_json("whisper_timings", cache_key)
+        if cached_data is not None:
+            log.info(f"📋 Loaded {len(cached_data)} cached Whisper word timings for {audio_file.name}")
             for i, w in enumerate(cached_data[:5]):  # Show first 5 words
-                print(f"      {i+1}: '{w['word']}' [{w['start']:.2f}s - {w['end']:.2f}s]")
-            
+                log.debug(f"      {i+1}: '{w['word']}' [{w['start']:.2f}s - {w['end']:.2f}s]")
             return cached_data
-        except Exception as e:
-            print(f"   ⚠️  Cache read failed, running Whisper: {e}")
+    except Exception as e:
+        log.warning(f"   ⚠️  Cache read failed, running Whisper: {e}")
     
     # Run Whisper if no cache or cache failed
     try:
-        print(f"🎯 Running Whisper speech recognition on {audio_file.name}...")
-        
-        # Load Whisper model (using tiny model for maximum speed)
-        print("   📥 Loading Whisper model...")
-        model = whisper.load_model("tiny")
+        log.info(f"🎯 Running Whisper speech recognition on {audio_file.name}...")
+        model = load_whisper_model()
         
         # Transcribe with word-level timestamps - optimized settings
-        print("   🎙️  Transcribing audio (this may take a while)...")
-        result = whisper.transcribe(
-            model, 
-            str(audio_file), 
-            language="en",
-            beam_size=1,  # Faster decoding
-            best_of=1,    # No multiple attempts
-            temperature=0.0  # Deterministic output
-        )
+        log.info("   🎙️  Transcribing audio (this may take a while)...")
+        result = whisper.transcribe(model, str(audio_file), **WHISPER_OPTIONS)
         
         word_timings = []
         total_words = 0
@@ -171,479 +195,652 @@ def get_exact_word_timings_from_audio(audio_file: Path) -> List[Dict]:
                     })
                     total_words += 1
         
-        # Cache the results
+        # Cache the results (stored atomically, since alignment workers write concurrently)
         try:
-            with open(cache_file, 'w') as f:
-                json.dump(word_timings, f, indent=2)
-            print(f"   💾 Cached Whisper results to {cache_file.name}")
+            artifact_cache.put_json("whisper_timings", cache_key, word_timings)
+            log.info(f"   💾 Cached Whisper results for {audio_file.name}")
         except Exception as e:
-            print(f"   ⚠️  Failed to cache results: {e}")
+            log.warning(f"   ⚠️  Failed to cache results: {e}")
         
-        print(f"   ✅ Whisper detected {total_words} words with exact timestamps")
+        log.info(f"   ✅ Whisper detected {total_words} words with exact timestamps")
         for i, w in enumerate(word_timings[:5]):  # Show first 5 words
-            print(f"      {i+1}: '{w['word']}' [{w['start']:.2f}s - {w['end']:.2f}s]")
+            log.debug(f"      {i+1}: '{w['word']}' [{w['start']:.2f}s - {w['end']:.2f}s]")
         
         return word_timings
         
     except Exception as e:
-        print(f"   ❌ Whisper failed: {e}")
+        log.error(f"   ❌ Whisper failed: {e}")
         return []
 
-def generate_frequency_meter_video_gpu(audio_file: Path, duration: float, bg_img: np.ndarray) -> cp.ndarray:
-    """GPU-accelerated frequency band waveform with butterfly pattern."""
-    # Check cache first - include background image hash in cache key
-    cache_file = VIDEO_CONFIG['cache_dir'] / "waveforms" / f"{audio_file.stem}_waveform.pkl"
-    audio_stats = audio_file.stat()
-    
-    # Include background image in cache key to handle art changes
-    import hashlib
-    bg_hash = hashlib.md5(bg_img.tobytes()).hexdigest()[:8]
-    cache_key = f"{audio_file.name}_{audio_stats.st_size}_{audio_stats.st_mtime}_{bg_hash}"
+def load_synthesis_timings(audio_file: Path):
+    """Word timings recorded by build_audio_kokoro_final.py next to the WAV, if they match it."""
+    sidecar = read_timings_sidecar(audio_file)
+    if sidecar is None:
+        return None
+    if sidecar.get('samples') != sf.info(str(audio_file)).frames:
+        log.warning(f"   ⚠️  Timing sidecar for {audio_file.name} doesn't match the audio, ignoring it")
+        return None
+    return sidecar['words']
+
+def get_word_timings(audio_file: Path) -> List[Dict]:
+    """Word timings for a chapter: from synthesis when available, otherwise from Whisper."""
+    word_timings = load_synthesis_timings(audio_file)
+    if word_timings is not None:
+        log.info(f"📋 Using synthesis word timings for {audio_file.name} ({len(word_timings)} words, no Whisper needed)")
+        return word_timings
+    return get_exact_word_timings_from_audio(audio_file)
+
+def _init_alignment_worker(torch_threads: int):
+    """Alignment worker: split the cores between workers and load the model up front."""
+    import torch
+    torch.set_num_threads(torch_threads)
+    load_whisper_model()
+
+def _align_chapter(audio_file: Path) -> int:
+    """Alignment worker: fill the Whisper timing cache for one chapter."""
+    return len(get_exact_word_timings_from_audio(audio_file))
+
+def align_chapters(audio_files: List[Path], workers: int = None):
+    """Run Whisper over every chapter without synthesis timings or cached Whisper timings.
+    
+    Each worker process loads the model once and aligns chapters until the
+    queue is empty; rendering then reads the timings from the artifact cache.
+    """
+    pending = [audio_file for audio_file in audio_files
+               if load_synthesis_timings(audio_file) is None
+               and not artifact_cache.path("whisper_timings", whisper_cache_key(audio_file), '.json').exists()]
+    if not pending:
+        log.info("📋 Word timings available for every chapter")
+        return
     
-    if cache_file.exists():
-        try:
-            with open(cache_file, 'rb') as f:
-                cached_data = pickle.load(f)
-            if cached_data.get('cache_key') == cache_key:
-                print(f"🎵 Loading cached waveform for {audio_file.name}...")
-                return cp.asarray(cached_data['waveform_frames'])
-        except Exception as e:
-            print(f"   ⚠️  Cache read failed, regenerating: {e}")
+    cores = VIDEO_CONFIG['max_workers']
+    workers = max(1, min(len(pending), workers or VIDEO_CONFIG['alignment_workers']))
+    torch_threads = max(1, cores // workers)
+    log.info(f"🎯 Aligning {len(pending)} chapter(s) with Whisper: {workers} worker(s) x {torch_threads} threads")
+    
+    # Spawned so each worker initializes torch cleanly
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('spawn'),
+                             initializer=_init_alignment_worker, initargs=(torch_threads,)) as executor:
+        futures = {executor.submit(_align_chapter, audio_file): audio_file for audio_file in pending}
+        with tqdm(total=len(futures), desc="🎯 Aligning chapters", unit="chapter") as pbar:
+            for future in as_completed(futures):
+                try:
+                    words = future.result()
+                    log.info(f"   ✅ {futures[future].name}: {words} words")
+                except Exception as e:
+                    log.error(f"   ❌ {futures[future].name} alignment failed: {e}")
+                pbar.update(1)
+
+# Log-spaced frequency bands shown by the meter
+METER_BANDS = 48
+# Resolution of the level-to-color lookup table
+METER_COLOR_STEPS = 1024
+
+def band_level_color(level: float) -> Tuple[int, int, int]:
+    """Map a 0-1 band level to the green→yellow→orange→red meter color."""
+    brightness = 0.5 + (0.5 * level)
+    if level < 0.25:
+        base_color = (0, 255, 0)  # Green
+    elif level < 0.5:
+        mix = (level - 0.25) / 0.25
+        base_color = (int(255 * mix), 255, 0)  # Green to Yellow
+    elif level < 0.75:
+        mix = (level - 0.5) / 0.25
+        base_color = (255, int(255 * (1 - mix * 0.5)), 0)  # Yellow to Orange
+    else:
+        mix = (level - 0.75) / 0.25
+        base_color = (255, int(128 * (1 - mix)), 0)  # Orange to Red
+    return tuple(int(c * brightness) for c in base_color)
+
+# Meter color for every quantized level, indexed by round(level * (METER_COLOR_STEPS - 1))
+METER_COLOR_LUT = np.array([band_level_color(i / (METER_COLOR_STEPS - 1)) for i in range(METER_COLOR_STEPS)], dtype=np.uint8)
+
+def meter_band_edges() -> np.ndarray:
+    """Band edges in Hz, 20 Hz to 20 kHz."""
+    return np.logspace(np.log10(20), np.log10(20000), METER_BANDS + 1)
+
+# Frames analyzed per batched FFT call (bounds the size of the STFT matrix)
+SPECTRUM_BATCH_FRAMES = 1024
+
+@lru_cache(maxsize=8)
+def band_aggregation_matrix(frame_size: int, sample_rate: int, backend_name: str):
+    """(bins x METER_BANDS) matrix averaging each band's positive-frequency FFT bins."""
+    positive_freqs = np.fft.fftfreq(frame_size, 1/sample_rate)[:frame_size//2]
+    band_index = np.searchsorted(meter_band_edges(), positive_freqs, side='right') - 1
+    inside = (band_index >= 0) & (band_index < METER_BANDS)
+    matrix = np.zeros((len(positive_freqs), METER_BANDS))
+    matrix[np.nonzero(inside)[0], band_index[inside]] = 1
+    matrix /= np.maximum(matrix.sum(axis=0), 1)
+    return backend.xp.asarray(matrix)
+
+def spectrum_band_levels(frames, sample_rate: int):
+    """Band levels (0-1, relative to each frame's loudest bin) for a block of equal-length frames."""
+    xp = backend.xp
+    frame_size = frames.shape[1]
+    if frame_size < 2:
+        return xp.zeros((frames.shape[0], METER_BANDS))
+    magnitude = xp.abs(xp.fft.rfft(frames, axis=1))[:, :frame_size//2]
+    max_mag = magnitude.max(axis=1, keepdims=True)
+    band_means = magnitude @ band_aggregation_matrix(frame_size, sample_rate, backend.name)
+    return xp.where(max_mag > 0, xp.minimum(1.0, band_means / xp.where(max_mag > 0, max_mag, 1)), 0.0)
+
+def audio_duration_seconds(audio_file: Path) -> float:
+    """Duration from the file header, without decoding the audio."""
+    info = sf.info(str(audio_file))
+    return info.frames / info.samplerate
+
+def stream_audio_frames(audio_file: Path, frame_size: int, frames_per_block: int = SPECTRUM_BATCH_FRAMES):
+    """Yield (first frame index, mono frames) blocks read incrementally from the file.
+    
+    Samples left over at the end of a block are carried into the next one,
+    so frames never straddle a block boundary; a trailing partial frame is
+    yielded last as a block of its own. Peak memory is one block whatever
+    the length of the file.
+    """
+    carry = np.zeros(0)
+    first_frame = 0
+    for block in sf.blocks(str(audio_file), blocksize=frame_size * frames_per_block, always_2d=True):
+        mono = np.concatenate([carry, block.mean(axis=1)])  # Convert to mono
+        count = len(mono) // frame_size
+        if count:
+            yield first_frame, mono[:count * frame_size].reshape(count, frame_size)
+            first_frame += count
+        carry = mono[count * frame_size:]
+    if len(carry):
+        yield first_frame, carry[None, :]
+
+def _band_levels_per_frame(audio_data: np.ndarray, sample_rate: int, fps: int) -> np.ndarray:
+    """Reference per-frame FFT and per-band mask loop, kept for benchmark_spectrum()."""
+    freq_ranges = meter_band_edges()
+    frame_size = int(sample_rate / fps)
+    total_frames = -(-len(audio_data) // frame_size)
+    levels = np.zeros((total_frames, METER_BANDS), dtype=np.float32)
+    for frame in range(total_frames):
+        frame_audio = audio_data[frame * frame_size:(frame + 1) * frame_size]
+        fft_values = np.fft.fft(frame_audio)
+        freqs = np.fft.fftfreq(len(frame_audio), 1/sample_rate)
+        magnitude = np.abs(fft_values[:len(fft_values)//2])
+        freqs = freqs[:len(freqs)//2]
+        max_mag = np.max(magnitude) if len(magnitude) else 0
+        if max_mag <= 0:
+            continue
+        for band in range(METER_BANDS):
+            band_mask = (freqs >= freq_ranges[band]) & (freqs < freq_ranges[band + 1])
+            if np.any(band_mask):
+                levels[frame, band] = min(1.0, np.mean(magnitude[band_mask]) / max_mag)
+    return levels
+
+def compute_band_levels(audio_file: Path, cache: ArtifactCache = None) -> np.ndarray:
+    """Per-frame meter band levels (frames x METER_BANDS float32, 0-1).
+    
+    Levels are computed once per audio file and cached as a .npy that is
+    memory-mapped on load, so the cache scales with the band count rather
+    than the pixel count and frames are rasterized on demand. cache defaults
+    to the shared artifact cache.
+    """
+    cache = cache or artifact_cache
+    xp = backend.xp
+    fps = VIDEO_CONFIG['fps']
     
-    print(f"🎵 GPU-accelerated frequency waveform for {audio_file.name}...")
+    # Cache key covers the audio content and the analysis settings
+    cache_key = cache.key(content_hash(audio_file), fps, METER_BANDS)
+    try:
+        levels = cache.get_array("band_levels", cache_key)
+        if levels is not None:
+            log.info(f"🎵 Loading cached band levels for {audio_file.name}...")
+            return levels
+    except Exception as e:
+        log.warning(f"   ⚠️  Cache read failed, regenerating: {e}")
     
-    # Load audio and transfer to GPU
-    audio_data, sample_rate = sf.read(str(audio_file))
-    if len(audio_data.shape) > 1:
-        audio_data = np.mean(audio_data, axis=1)  # Convert to mono
-    audio_gpu = cp.asarray(audio_data)
+    log.info(f"🎵 Analyzing frequency bands for {audio_file.name} ({backend.name} backend)...")
     
-    width, height = VIDEO_CONFIG['resolution']
-    meter_height = VIDEO_CONFIG['waveform_height']
+    info = sf.info(str(audio_file))
+    sample_rate = info.samplerate
+    frame_size = int(sample_rate / fps)
+    total_frames = -(-info.frames // frame_size)
+    
+    # Write straight into a memory-mapped temporary file, then move it into the cache
+    tmp_file = cache.temp_path("band_levels", '.npy')
+    levels = np.lib.format.open_memmap(tmp_file, mode='w+', dtype=np.float32, shape=(total_frames, METER_BANDS))
+    
+    # One batched FFT per block of frames streamed from the file
+    blocks = stream_audio_frames(audio_file, frame_size)
+    for first_frame, frames in tqdm(blocks, total=-(-total_frames // SPECTRUM_BATCH_FRAMES),
+                                    desc="🎵 FFT Processing", unit="batch"):
+        levels[first_frame:first_frame + len(frames)] = backend.asnumpy(spectrum_band_levels(xp.asarray(frames), sample_rate))
+    
+    levels.flush()
+    del levels
+    cache_file = cache.store_file("band_levels", cache_key, '.npy', tmp_file)
+    log.info(f"   💾 Cached {total_frames} frames of band levels for {audio_file.name}")
+    return np.load(cache_file, mmap_mode='r')
+
+def benchmark_spectrum(seconds: float = 600.0):
+    """Time the batched band analysis against the per-frame loop on synthetic narration."""
+    sample_rate = 24000
     fps = VIDEO_CONFIG['fps']
-    
-    # Transfer background to GPU
-    base_strip_gpu = cp.asarray(bg_img[height - meter_height:height, :, :3])
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    audio_data = 0.3 * np.sin(2 * np.pi * 220 * t) * (1 + np.sin(0.7 * t)) + 0.05 * rng.standard_normal(len(t))
+    frame_size = int(sample_rate / fps)
+    full_frames = len(audio_data) // frame_size
+    
+    log.info(f"⏱️  Benchmarking spectrum analysis over {seconds:.0f}s of audio ({full_frames} frames)")
+    start = time.perf_counter()
+    reference = _band_levels_per_frame(audio_data[:full_frames * frame_size], sample_rate, fps)
+    loop_time = time.perf_counter() - start
+    
+    xp = backend.xp
+    start = time.perf_counter()
+    audio_dev = xp.asarray(audio_data)
+    batched = np.concatenate([
+        backend.asnumpy(spectrum_band_levels(
+            audio_dev[i * frame_size:min(i + SPECTRUM_BATCH_FRAMES, full_frames) * frame_size].reshape(-1, frame_size),
+            sample_rate))
+        for i in range(0, full_frames, SPECTRUM_BATCH_FRAMES)
+    ])
+    backend.synchronize()
+    batched_time = time.perf_counter() - start
+    
+    log.info(f"   per-frame loop: {loop_time:.2f}s ({full_frames / loop_time:.0f} frames/s)")
+    log.info(f"   batched {backend.name}: {batched_time:.2f}s ({full_frames / batched_time:.0f} frames/s, {loop_time / batched_time:.0f}x)")
+    log.info(f"   Max level difference: {np.abs(batched - reference).max():.2e}")
+
+def draw_frequency_meter(strip: np.ndarray, levels: np.ndarray) -> np.ndarray:
+    """Rasterize one frame of band levels as butterfly bars onto a meter strip in place."""
+    meter_height, width = strip.shape[:2]
     
     # Waveform parameters
     waveform_width = int(width * 0.5)
     start_x = (width - waveform_width) // 2
+    end_x = start_x + waveform_width
     center_y = meter_height // 2
+    band_width = waveform_width // len(levels)
     
-    # Frequency analysis setup on GPU
-    num_bands = 48
-    freq_ranges = cp.logspace(cp.log10(20), cp.log10(20000), num_bands + 1)
-    band_width = waveform_width // num_bands
-    
-    total_frames = int(duration * fps)
-    frame_size = int(sample_rate / fps)
-    
-    meter_frames_gpu = []
+    bar_heights = (np.asarray(levels) * (center_y - 10)).astype(int)
+    colors = METER_COLOR_LUT[np.rint(np.asarray(levels) * (METER_COLOR_STEPS - 1)).astype(int)]
     
-    # Process frames in parallel batches for better CPU utilization
-    def process_frame_batch(frame_indices):
-        """Process a batch of frames in parallel."""
-        batch_frames = []
-        for frame in frame_indices:
-            # Start with background
-            img_gpu = base_strip_gpu.copy()
-            
-            # Get audio chunk on GPU
-            start_sample = frame * frame_size
-            end_sample = min(start_sample + frame_size, len(audio_gpu))
-            
-            if start_sample < end_sample:
-                frame_audio_gpu = audio_gpu[start_sample:end_sample]
-                
-                # GPU FFT
-                fft_gpu = cp.fft.fft(frame_audio_gpu)
-                freqs_gpu = cp.fft.fftfreq(len(frame_audio_gpu), 1/sample_rate)
-                
-                # Magnitude spectrum
-                magnitude_gpu = cp.abs(fft_gpu[:len(fft_gpu)//2])
-                positive_freqs_gpu = freqs_gpu[:len(freqs_gpu)//2]
-                max_mag = cp.max(magnitude_gpu)
-                
-                if max_mag > 0:
-                    # Process all bands vectorized on GPU
-                    for band in range(num_bands):
-                        freq_start = freq_ranges[band]
-                        freq_end = freq_ranges[band + 1]
-                        
-                        # Band mask
-                        band_mask = (positive_freqs_gpu >= freq_start) & (positive_freqs_gpu < freq_end)
-                        
-                        if cp.any(band_mask):
-                            band_magnitude = cp.mean(magnitude_gpu[band_mask])
-                            level = float(min(1.0, band_magnitude / max_mag))
-                            
-                            # Calculate visual properties
-                            brightness = 0.5 + (0.5 * level)
-                            bar_height = int(level * (center_y - 10))
-                            band_x = start_x + band * band_width + band_width // 2
-                            
-                            # Color mapping (BGR for OpenCV)
-                            if level < 0.25:
-                                base_color = (0, 255, 0)  # Green
-                            elif level < 0.5:
-                                mix = (level - 0.25) / 0.25
-                                base_color = (int(255 * mix), 255, 0)  # Green to Yellow
-                            elif level < 0.75:
-                                mix = (level - 0.5) / 0.25
-                                base_color = (255, int(255 * (1 - mix * 0.5)), 0)  # Yellow to Orange
-                            else:
-                                mix = (level - 0.75) / 0.25
-                                base_color = (255, int(128 * (1 - mix)), 0)  # Orange to Red
-                            
-                            color = tuple(int(c * brightness) for c in base_color)
-                            
-                            # Draw bars directly on GPU using indexing (much faster)
-                            if bar_height > 2:
-                                # Calculate bar coordinates
-                                x1 = max(0, band_x - band_width//4)
-                                x2 = min(waveform_width, band_x + band_width//4)
-                                
-                                # Upward bar
-                                y1_up = max(0, center_y - bar_height)
-                                y2_up = center_y
-                                if y1_up < y2_up and x1 < x2:
-                                    img_gpu[y1_up:y2_up, x1:x2, 0] = color[0]
-                                    img_gpu[y1_up:y2_up, x1:x2, 1] = color[1]
-                                    img_gpu[y1_up:y2_up, x1:x2, 2] = color[2]
-                                
-                                # Downward bar
-                                y1_down = center_y
-                                y2_down = min(meter_height, center_y + bar_height)
-                                if y1_down < y2_down and x1 < x2:
-                                    img_gpu[y1_down:y2_down, x1:x2, 0] = color[0]
-                                    img_gpu[y1_down:y2_down, x1:x2, 1] = color[1]
-                                    img_gpu[y1_down:y2_down, x1:x2, 2] = color[2]
-            
-            # Draw center line directly on GPU
-            if start_x < img_gpu.shape[1] and center_y < img_gpu.shape[0]:
-                end_x = min(start_x + waveform_width, img_gpu.shape[1])
-                img_gpu[center_y, start_x:end_x, :] = cp.array([64, 64, 64])
-            batch_frames.append(img_gpu)
+    for band in np.nonzero(bar_heights > 2)[0]:
+        bar_height = bar_heights[band]
+        band_x = start_x + band * band_width + band_width // 2
+        x1 = max(start_x, band_x - band_width//4)
+        x2 = min(end_x, band_x + band_width//4)
         
-        return batch_frames
+        # Upward and downward bars
+        strip[max(0, center_y - bar_height):min(meter_height, center_y + bar_height), x1:x2] = colors[band]
     
-    # Process frames more efficiently - larger batches, less GPU memory transfers
-    batch_size = min(240, max(60, total_frames // 8))  # Bigger batches for efficiency
+    # Draw center line
+    strip[center_y, start_x:end_x] = (64, 64, 64)
+    return strip
+
+def create_frequency_meter_renderer(audio_file: Path, bg_img: np.ndarray, cache: ArtifactCache = None):
+    """Build meter_frame(t) returning the butterfly frequency meter strip over the art."""
+    width, height = VIDEO_CONFIG['resolution']
+    meter_height = VIDEO_CONFIG['waveform_height']
+    fps = VIDEO_CONFIG['fps']
     
-    with tqdm(total=total_frames, desc="🎵 GPU FFT Processing", unit="frames") as pbar:
-        for start_frame in range(0, total_frames, batch_size):
-            end_frame = min(start_frame + batch_size, total_frames)
-            batch_indices = list(range(start_frame, end_frame))
-            
-            # Process entire batch on GPU without individual transfers
-            batch_frames = process_frame_batch(batch_indices)
-            if batch_frames:
-                meter_frames_gpu.extend(batch_frames)
-            pbar.update(len(batch_indices))
+    levels = compute_band_levels(audio_file, cache)
+    base_strip = np.ascontiguousarray(bg_img[height - meter_height:height, :, :3])
+    silent = np.zeros(METER_BANDS, dtype=np.float32)
     
-    print(f"   ✅ Generated {total_frames} waveform frames on GPU")
-    result = cp.stack(meter_frames_gpu)
+    def meter_frame(t):
+        frame = int(t * fps)
+        with layer_timer.layer('meter'):
+            return draw_frequency_meter(base_strip.copy(), levels[frame] if 0 <= frame < len(levels) else silent)
     
-    # Cache the result
-    try:
-        cache_data = {
-            'cache_key': cache_key,
-            'waveform_frames': cp.asnumpy(result)  # Convert to numpy for pickling
-        }
-        with open(cache_file, 'wb') as f:
-            pickle.dump(cache_data, f)
-        print(f"   💾 Cached waveform to {cache_file.name}")
-    except Exception as e:
-        print(f"   ⚠️  Failed to cache waveform: {e}")
-    
-    return result
+    return meter_frame
 
 @lru_cache(maxsize=1000)
-def _cached_mote_positions(t_discrete: int, width: int, height: int, num_motes: int):
-    """Cache mote positions for repeated time values."""
+def _cached_mote_positions(t_discrete: int, width: int, height: int, num_motes: int, backend_name: str):
+    """Cache mote positions for repeated time values (per backend)."""
+    xp = backend.xp
     t = t_discrete / 100.0  # Convert back to float
     
-    mote_ids = cp.arange(num_motes, dtype=cp.float32)
+    mote_ids = xp.arange(num_motes, dtype=xp.float32)
     seeds = mote_ids * 2.39996  # Golden angle
     speeds = 0.3 + (mote_ids % 5) * 0.15
-    angles = (t * speeds + seeds) % (2 * cp.pi)
+    angles = (t * speeds + seeds) % (2 * np.pi)
     
     base_x = mote_ids * width / num_motes
     base_y = (mote_ids * 73) % height
     
     orbit_radius = 40 + (mote_ids % 3) * 15
-    mote_x = base_x + orbit_radius * cp.cos(angles)
-    mote_y = base_y + orbit_radius * cp.sin(angles)
+    mote_x = base_x + orbit_radius * xp.cos(angles)
+    mote_y = base_y + orbit_radius * xp.sin(angles)
     
     pulse_phase = t * 3 + mote_ids * 0.8
-    brightness = 0.4 + 0.3 * cp.sin(pulse_phase)
+    brightness = 0.4 + 0.3 * xp.sin(pulse_phase)
     
     return mote_x, mote_y, brightness
 
-def create_floating_motes_gpu(width: int, height: int, t: float, duration: float) -> cp.ndarray:
-    """CUDA-accelerated floating digital motes with simple pulsing circles."""
+@lru_cache(maxsize=8)
+def _mote_sprite(radius: int, backend_name: str):
+    """Pixel offsets and anti-aliased alpha of a mote disc, cached per radius (per backend)."""
+    xp = backend.xp
+    offsets = xp.arange(-radius, radius + 1)
+    dy, dx = xp.meshgrid(offsets, offsets, indexing='ij')
+    dist = xp.sqrt(dx**2 + dy**2)
+    alpha = xp.where(dist <= radius - 1, 1.0, xp.where(dist <= radius, radius - dist, 0.0))
+    inside = alpha > 0
+    return dy[inside], dx[inside], alpha[inside]
+
+def mote_splats(width: int, height: int, t: float):
+    """Rasterize every mote in one batch.
     
-    # Create GPU arrays
-    frame = cp.zeros((height, width, 3), dtype=cp.uint8)
+    Returns the flat indices of the touched pixels and their summed amber
+    color (uint16, unclipped) so callers can blend them into any frame.
+    """
+    xp = backend.xp
     
-    # Mote parameters - precomputed for efficiency
+    # Mote parameters
     num_motes = 25
     mote_radius = 8  # Simple circle radius
     
     # Use cached positions for performance
     t_discrete = int(t * 100)  # Discretize time for caching
-    mote_x, mote_y, brightness = _cached_mote_positions(t_discrete, width, height, num_motes)
-    
-    # Amber color intensities
-    red_intensity = (255 * brightness * 0.9).astype(cp.uint8)
-    green_intensity = (180 * brightness).astype(cp.uint8) 
-    blue_intensity = (40 * brightness * 0.4).astype(cp.uint8)
-    
-    # Draw circles using GPU-optimized approach
-    for i in range(num_motes):
-        cx, cy = int(mote_x[i]), int(mote_y[i])
-        if 0 <= cx < width and 0 <= cy < height:
-            # Simple filled circle using vectorized operations
-            y_range = cp.arange(max(0, cy - mote_radius), min(height, cy + mote_radius + 1))
-            x_range = cp.arange(max(0, cx - mote_radius), min(width, cx + mote_radius + 1))
-            
-            # Create coordinate grids
-            yy, xx = cp.meshgrid(y_range, x_range, indexing='ij')
-            
-            # Distance from center
-            dist_sq = (xx - cx)**2 + (yy - cy)**2
-            circle_mask = dist_sq <= mote_radius**2
-            
-            # Anti-aliasing for smooth edges
-            dist = cp.sqrt(dist_sq)
-            alpha = cp.where(dist <= mote_radius - 1, 1.0, 
-                           cp.where(dist <= mote_radius, mote_radius - dist, 0.0))
-            
-            if cp.any(circle_mask):
-                # Apply color with alpha blending (additive)
-                y_coords = yy[circle_mask]
-                x_coords = xx[circle_mask]
-                alpha_vals = alpha[circle_mask]
-                
-                # Additive blending for glow effect
-                frame[y_coords, x_coords, 0] = cp.minimum(255, 
-                    frame[y_coords, x_coords, 0] + (red_intensity[i] * alpha_vals).astype(cp.uint8))
-                frame[y_coords, x_coords, 1] = cp.minimum(255,
-                    frame[y_coords, x_coords, 1] + (green_intensity[i] * alpha_vals).astype(cp.uint8))  
-                frame[y_coords, x_coords, 2] = cp.minimum(255,
-                    frame[y_coords, x_coords, 2] + (blue_intensity[i] * alpha_vals).astype(cp.uint8))
-    
+    mote_x, mote_y, brightness = _cached_mote_positions(t_discrete, width, height, num_motes, backend.name)
+    dy, dx, alpha = _mote_sprite(mote_radius, backend.name)
+    
+    # Mote centres (truncated like int()) that land on screen
+    cx = xp.trunc(mote_x).astype(xp.int64)
+    cy = xp.trunc(mote_y).astype(xp.int64)
+    visible = (cx >= 0) & (cx < width) & (cy >= 0) & (cy < height)
+    
+    # Amber color intensities per mote
+    colors = xp.stack([255 * brightness * 0.9, 180 * brightness, 40 * brightness * 0.4], axis=1).astype(xp.uint8)[visible]
+    
+    # Stamp the sprite at every mote centre: (motes, sprite pixels, channels)
+    ys = cy[visible][:, None] + dy[None, :]
+    xs = cx[visible][:, None] + dx[None, :]
+    stamps = (colors[:, None, :] * alpha[None, :, None]).astype(xp.uint8)
+    on_screen = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+    flat = (ys * width + xs)[on_screen]
+    stamps = stamps[on_screen]
+    
+    # Sum overlapping motes per pixel, all channels in one bincount
+    pixels, slot = xp.unique(flat, return_inverse=True)
+    channel_slots = (slot[:, None] * 3 + xp.arange(3)).ravel()
+    sums = xp.bincount(channel_slots, weights=stamps.ravel(), minlength=len(pixels) * 3)
+    return pixels, sums.reshape(-1, 3).astype(xp.uint16)
+
+def create_floating_motes(width: int, height: int, t: float, duration: float):
+    """Floating digital motes as a full-frame overlay on the active array backend."""
+    xp = backend.xp
+    frame = xp.zeros((height, width, 3), dtype=xp.uint8)
+    pixels, sums = mote_splats(width, height, t)
+    frame.reshape(-1, 3)[pixels] = xp.minimum(sums, 255)
     return frame
 
-def create_scrolling_text_video(text: str, video_duration: float, art_path: Path, audio_file: Path, lead_in_time: float, audio_duration: float) -> VideoClip:
-    """Create text video showing current line with word highlighting."""
-    print(f"📜 Creating current-line text video with word highlighting...")
-    
-    width, height = VIDEO_CONFIG['resolution']
-    fps = VIDEO_CONFIG['fps']
-    
-    # Load background art and prepare for zoom animation (starts at 130%, ends at 100%)
+def add_floating_motes(frame: np.ndarray, t: float) -> np.ndarray:
+    """Additively blend the motes into a host RGB frame in place, saturating at 255."""
+    height, width = frame.shape[:2]
+    pixels, sums = mote_splats(width, height, t)
+    pixels, sums = backend.asnumpy(pixels), backend.asnumpy(sums)
+    flat = frame.reshape(-1, 3)
+    flat[pixels] = np.minimum(flat[pixels] + sums, 255)
+    return frame
+
+# Fade levels word sprites are quantized to (0.025 steps keep the 0.2 and 0.3 floors exact)
+WORD_FADE_STEPS = 40
+# Sprite memory kept by each frame worker (a long word at full size is about 0.8 MB)
+SPRITE_CACHE_BYTES = 32 * 1024**2
+
+@lru_cache(maxsize=4)
+def load_video_font(size: int):
+    """Load the word font once per size."""
     try:
-        original_bg = Image.open(art_path)
-        
-        # Create larger image for zoom animation (130% size)
-        zoom_width = int(width * 1.3)
-        zoom_height = int(height * 1.3)
-        bg_img_large = original_bg.resize((zoom_width, zoom_height), Image.Resampling.LANCZOS)
-        
+        return ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", size)
+    except:
+        return ImageFont.load_default()
+
+def render_word_sprite(word: str, is_speaking: bool, fade_level: int, width: int, height: int):
+    """Pre-render a centred word with its background box and shadow.
+    
+    Returns (left, top, color, keep): the sprite's frame position, its
+    premultiplied color and the fraction of the underlying frame that shows
+    through, so compositing is frame * keep + color over the box only. Both
+    are uint16 fixed point with 8 fractional bits (color pre-rounded), so
+    blending is integer math.
+    """
+    font = load_video_font(VIDEO_CONFIG['font_size'])
+    fade_alpha = fade_level / WORD_FADE_STEPS
+    
+    # Centre the word slightly above the middle of the frame
+    bbox = font.getbbox(word)
+    x = (width - (bbox[2] - bbox[0])) // 2
+    y = (height - (bbox[3] - bbox[1])) // 2 - 100
+    
+    # Fitted background box with padding around the actual text bounds
+    padding = 30
+    left, top = x + bbox[0] - padding, y + bbox[1] - padding
+    box_size = (bbox[2] - bbox[0] + 2 * padding + 1, bbox[3] - bbox[1] + 2 * padding + 1)
+    
+    if is_speaking:
+        # Currently speaking word - bright amber highlight
+        base_word_color = (255, 200, 50)  # Bright amber
+        base_shadow_color = (120, 60, 0)  # Dark amber shadow
+    else:
+        # Not currently speaking - white
+        base_word_color = (255, 255, 255)  # White
+        base_shadow_color = (80, 80, 80)   # Gray shadow
+    
+    # Apply fade during silence
+    word_color = np.array([int(c * fade_alpha) for c in base_word_color], dtype=np.float32)
+    shadow_color = np.array([int(c * fade_alpha) for c in base_shadow_color], dtype=np.float32)
+    box_alpha = int(180 * fade_alpha) / 255
+    
+    # Glyph coverage of the shadow and the word in sprite coordinates
+    def coverage(offset):
+        mask = Image.new('L', box_size, 0)
+        ImageDraw.Draw(mask).text((x - left + offset, y - top + offset), word, font=font, fill=255)
+        return np.asarray(mask, dtype=np.float32)[:, :, None] / 255
+    shadow_cover = coverage(3)
+    word_cover = coverage(0)
+    
+    # Box, then shadow, then word, each drawn "over" the previous layers
+    keep = np.full(shadow_cover.shape, 1 - box_alpha, dtype=np.float32)
+    color = np.zeros((box_size[1], box_size[0], 3), dtype=np.float32)
+    for layer_color, cover in ((shadow_color, shadow_cover), (word_color, word_cover)):
+        keep *= 1 - cover
+        color = color * (1 - cover) + layer_color * cover
+    return left, top, (color * 256 + 128.5).astype(np.uint16), (keep * 256 + 0.5).astype(np.uint16)
+
+# Recently used sprites per process, least recently used first, and their total size
+_sprite_cache = OrderedDict()
+_sprite_cache_bytes = 0
+
+def word_sprite(word: str, is_speaking: bool, fade_level: int, width: int, height: int):
+    """render_word_sprite() through a per-process LRU cache bounded by SPRITE_CACHE_BYTES."""
+    global _sprite_cache_bytes
+    key = (word, is_speaking, fade_level, width, height)
+    sprite = _sprite_cache.get(key)
+    if sprite is not None:
+        _sprite_cache.move_to_end(key)
+        return sprite
+    sprite = render_word_sprite(*key)
+    _sprite_cache[key] = sprite
+    _sprite_cache_bytes += sprite[2].nbytes + sprite[3].nbytes
+    while _sprite_cache_bytes > SPRITE_CACHE_BYTES and len(_sprite_cache) > 1:
+        _, (_, _, color, keep) = _sprite_cache.popitem(last=False)
+        _sprite_cache_bytes -= color.nbytes + keep.nbytes
+    return sprite
+
+# uint16 accumulator for sprite blending, allocated once per process
+_blend_scratch = np.empty(0, dtype=np.uint16)
+
+def draw_word_sprite(frame: np.ndarray, sprite) -> np.ndarray:
+    """Composite a word sprite into an RGB frame in place, touching only its box.
+    
+    Blends as (frame * keep + color) >> 8 in a reused uint16 buffer; the
+    premultiplied sum never exceeds 255.5 * 256, so nothing overflows.
+    """
+    global _blend_scratch
+    left, top, color, keep = sprite
+    height, width = frame.shape[:2]
+    x0, y0 = max(0, left), max(0, top)
+    x1, y1 = min(width, left + color.shape[1]), min(height, top + color.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return frame
+    region = (slice(y0 - top, y1 - top), slice(x0 - left, x1 - left))
+    target = frame[y0:y1, x0:x1]
+    if _blend_scratch.size < target.size:
+        _blend_scratch = np.empty(height * width * 3, dtype=np.uint16)
+    accumulator = _blend_scratch[:target.size].reshape(target.shape)
+    np.multiply(target, keep[region], out=accumulator)
+    np.add(accumulator, color[region], out=accumulator)
+    np.right_shift(accumulator, 8, out=accumulator)
+    np.copyto(target, accumulator, casting='unsafe')
+    return frame
+
+ZOOM_START = 1.3  # Ken Burns zoom at the start of a chapter...
+ZOOM_END = 1.0    # ...easing out to a 1:1 centre crop of the prefiltered art by the end
+ZOOM_SUBPIXEL_STEPS = 16  # crop positions per source pixel; finer steps look no different
+
+def load_zoom_source(art_path: Path, width: int, height: int) -> Image.Image:
+    """Chapter art prefiltered once to ZOOM_START times the frame size, dimmed for text readability.
+    
+    Falls back to the amber gradient when there is no art (art_path None) or it can't be read.
+    """
+    size = (int(width * ZOOM_START), int(height * ZOOM_START))
+    if art_path is None:
+        return create_gradient_background(*size)
+    try:
+        source = Image.open(art_path).convert('RGB').resize(size, Image.Resampling.LANCZOS)
         # Apply semi-transparent overlay for text readability
-        overlay = Image.new('RGBA', (zoom_width, zoom_height), (0, 0, 0, 180))
-        bg_img_large = Image.alpha_composite(bg_img_large.convert('RGBA'), overlay)
-        bg_img_large = bg_img_large.convert('RGB')
-        
-        # Also prepare the final size version for reference
-        bg_img_final = original_bg.resize((width, height), Image.Resampling.LANCZOS)
-        bg_img_final = Image.alpha_composite(bg_img_final.convert('RGBA'), 
-                                           Image.new('RGBA', (width, height), (0, 0, 0, 180)))
-        bg_img_final = bg_img_final.convert('RGB')
-        
+        overlay = Image.new('RGBA', size, (0, 0, 0, 180))
+        return Image.alpha_composite(source.convert('RGBA'), overlay).convert('RGB')
     except Exception as e:
-        print(f"⚠️  Could not load art, using gradient background: {e}")
-        bg_img_large = create_gradient_background(int(width * 1.3), int(height * 1.3))
-        bg_img_final = create_gradient_background(width, height)
-    
-    # Prepare text and organize by lines with word timing
-    clean_text = clean_text_for_video(text)
-    
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", VIDEO_CONFIG['font_size'])
-    except:
-        font = ImageFont.load_default()
-    
-    # Split into lines and detect ACTUAL speech timing from audio
-    lines = [line.strip() for line in clean_text.split('\n') if line.strip()]
-    total_words = sum(len(line.split()) for line in lines)
-    
-    # Get EXACT word timings from audio using Whisper
-    print(f"🔍 Getting exact word timings from audio...")
-    whisper_word_timings = get_exact_word_timings_from_audio(audio_file)
+        log.warning(f"⚠️  Could not load art, using gradient background: {e}")
+        return create_gradient_background(*size)
+
+def create_zoom_background(source: Image.Image, size: Tuple[int, int], duration: float):
+    """Return background(t, frame=None): the centered view of source zooming from ZOOM_START to ZOOM_END.
+
+    The view is the frame size divided by the zoom, in pixels of the source
+    (prefiltered to ZOOM_START times the frame size): about 59% of the art
+    magnified at the start, a 1:1 centre crop of about 77% at the end. Each
+    frame is resampled straight from the source with one bilinear warp
+    written into frame when one is given, so the zoom is continuous, nothing
+    is rendered up front and a frame allocates nothing. Crops are snapped to
+    1/ZOOM_SUBPIXEL_STEPS of a source pixel.
+    """
+    width, height = size
+    pixels = np.ascontiguousarray(np.asarray(source.convert('RGB')))
+    source_height, source_width = pixels.shape[:2]
+    
+    def background(t: float, frame: np.ndarray = None) -> np.ndarray:
+        progress = min(1.0, max(0.0, t / duration)) if duration > 0 else 1.0
+        zoom = ZOOM_START + (ZOOM_END - ZOOM_START) * progress
+        scale = round(width / zoom * ZOOM_SUBPIXEL_STEPS) / ZOOM_SUBPIXEL_STEPS / width
+        left = (source_width - width * scale) / 2
+        top = (source_height - height * scale) / 2
+        # Inverse map from frame pixel centres to source pixel centres
+        transform = np.array([[scale, 0, left + scale / 2 - 0.5],
+                              [0, scale, top + scale / 2 - 0.5]])
+        if frame is None:
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+        return cv2.warpAffine(pixels, transform, (width, height), dst=frame,
+                              flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP, borderMode=cv2.BORDER_REPLICATE)
+    
+    return background
+
+def create_background_renderer(art_path: Path, video_duration: float):
+    """Build plate_frame(t, frame=None): the zooming art with the floating motes.
     
-    # Debug: Show first 5 word timings for validation
-    print(f"   🔍 WORD TIMING VALIDATION (first 5 words):")
-    for i, timing in enumerate(whisper_word_timings[:5]):
-        print(f"      {i+1}: '{timing['word']}' [{timing['start']:.2f}s - {timing['end']:.2f}s]")
-    print(f"   📊 Total words detected: {len(whisper_word_timings)}")
+    Draws into frame when one is given (no allocation), otherwise into a new array.
+    """
+    width, height = VIDEO_CONFIG['resolution']
     
-    # Check if we have cached text layout
-    text_cache_file = VIDEO_CONFIG['cache_dir'] / "text_layouts" / f"{audio_file.stem}_layout.pkl"
-    text_stats = audio_file.stat()
-    text_cache_key = f"{audio_file.name}_{text_stats.st_size}_{len(clean_text)}_{len(whisper_word_timings)}"
+    # Load background art once at the most-zoomed scale; each frame is resampled from it lazily
+    background = create_zoom_background(load_zoom_source(art_path, width, height), (width, height), video_duration)
     
-    word_groups = None
-    if text_cache_file.exists():
-        try:
-            with open(text_cache_file, 'rb') as f:
-                cached_text_data = pickle.load(f)
-            if cached_text_data.get('cache_key') == text_cache_key:
-                print(f"   📋 Loading cached text layout...")
-                word_groups = cached_text_data['word_groups']
-        except Exception as e:
-            print(f"   ⚠️  Text cache read failed: {e}")
-    
-    if word_groups is None:
-        print(f"   📝 Creating text layout...")
-        # Create sliding window groups with 5 words (2 left + active + 2 right) for balanced display
-        word_groups = []
-    
-    # Create overlapping groups so each word can be centered with 2 words on each side
-    for i in range(len(whisper_word_timings)):
-        # Create a window of up to 5 words centered on word i
-        start_idx = max(0, i - 2)  # 2 words before (or start of text)
-        end_idx = min(len(whisper_word_timings), i + 3)  # 2 words after + current word
-        
-        group_words = whisper_word_timings[start_idx:end_idx]
-        active_word_index = i - start_idx  # Index of the active word within this group
+    def plate_frame(t, frame=None):
+        # Zoomed background for this instant, resampled straight into the frame
+        with layer_timer.layer('zoom'):
+            frame = background(t, frame)
         
-        word_groups.append({
-            'words': [
-                {
-                    'text': w['word'],
-                    'start_time': w['start'],  # Keep original timings
-                    'end_time': w['end'],      # Keep original timings
-                    'confidence': w['confidence']
-                } for w in group_words
-            ],
-            'start_time': whisper_word_timings[i]['start'],  # Keep original start time
-            'end_time': whisper_word_timings[i]['end'],      # Keep original end time
-            'active_word_index': active_word_index         # Which word in the group is active
-        })
-    
-        # Cache the text layout
-        try:
-            cache_data = {
-                'cache_key': text_cache_key,
-                'word_groups': word_groups
-            }
-            with open(text_cache_file, 'wb') as f:
-                pickle.dump(cache_data, f)
-            print(f"   💾 Cached text layout to {text_cache_file.name}")
-        except Exception as e:
-            print(f"   ⚠️  Failed to cache text layout: {e}")
+        # Blend the floating digital motes into only the pixels they touch
+        with layer_timer.layer('motes'):
+            return add_floating_motes(frame, t)
     
-    print(f"   📝 Using {len(word_groups)} sliding window groups for balanced display")
-    line_data = word_groups
-    
-    # Create text frames with progress tracking
-    frame_count = [0]  # Use list to allow modification in nested function
-    total_expected_frames = int(video_duration * fps)
+    return plate_frame
+
+def chapter_segments(video_duration: float, frame_workers: int = None) -> int:
+    """Time segments to encode a chapter in: one per 'segment_seconds', with at least two frame workers each."""
+    if backend.name == 'cupy':
+        return 1  # CUDA contexts don't survive fork
+    workers = frame_workers or VIDEO_CONFIG['max_workers']
+    return max(1, min(int(np.ceil(video_duration / VIDEO_CONFIG['segment_seconds'])), workers // 2))
+
+PLATE_VERSION = 2  # bump when the zoom or motes change, so cached plates are re-rendered
+PLATE_CRF = 12     # near-transparent quality; the plate is re-encoded once more under the text
+
+# Plates are full-length chapter videos, so they get their own store and budget (override with
+# BUILD_PLATE_BUDGET_GB) rather than evicting, or being evicted by, the small artifacts
+PLATE_BUDGET_BYTES = int(float(os.environ.get('BUILD_PLATE_BUDGET_GB', '100')) * 1024**3)
+plate_cache = ArtifactCache(CACHE_DIR / "plates", PLATE_BUDGET_BYTES)
+
+def background_plate(art_path: Path, video_duration: float, frame_workers: int = None, encoder_threads: int = None) -> Path:
+    """The chapter's zoom + motes layer as a video, rendered once per art, duration and settings.
     
-    # Pre-cache zoom frames for performance
-    zoom_cache = {}
-    zoom_steps = 100  # Number of pre-computed zoom levels
+    Plates live in their own artifact store as high-quality 4:4:4 H.264, so a
+    re-render after a text or timing change decodes the background instead
+    of drawing it again.
+    """
+    width, height = VIDEO_CONFIG['resolution']
+    fps = VIDEO_CONFIG['fps']
+    art_hash = content_hash(art_path) if Path(art_path).exists() else None  # None: gradient fallback
+    cache_key = plate_cache.key(PLATE_VERSION, art_hash, round(video_duration, 3), fps, [width, height],
+                                ZOOM_START, ZOOM_END, ZOOM_SUBPIXEL_STEPS, PLATE_CRF)
+    plate_file = plate_cache.lookup("background_plates", cache_key, '.mp4')
+    if plate_file:
+        log.info(f"   🖼️  Using cached background plate for {Path(art_path).name}")
+        return plate_file
+    
+    log.info(f"   🖼️  Rendering background plate for {Path(art_path).name}...")
+    tmp_file = plate_cache.temp_path("background_plates", '.mp4')
+    render_video_segments(
+        create_background_renderer(art_path, video_duration),
+        video_duration,
+        tmp_file,
+        in_place=True,
+        fps=fps,
+        size=(width, height),
+        segments=chapter_segments(video_duration, frame_workers),
+        workers=1 if backend.name == 'cupy' else frame_workers or VIDEO_CONFIG['max_workers'],
+        threads=encoder_threads or min(16, cpu_count()),
+        preset='veryfast',
+        crf=PLATE_CRF,
+        pix_fmt='yuv444p'
+    )
+    return plate_cache.store_file("background_plates", cache_key, '.mp4', tmp_file)
+
+def create_text_layer(word_index: WordTimingIndex, lead_in_time: float, audio_duration: float):
+    """Build draw_text(t, frame): draws the current word into an RGB frame in place."""
+    width, height = VIDEO_CONFIG['resolution']
     
-    for i in range(zoom_steps):
-        progress = i / (zoom_steps - 1)
-        current_zoom = 1.3 - (0.3 * progress)
-        
-        if current_zoom > 1.0:
-            crop_width = int(width / current_zoom)
-            crop_height = int(height / current_zoom)
-            crop_x = (int(width * 1.3) - crop_width) // 2
-            crop_y = (int(height * 1.3) - crop_height) // 2
-            
-            cropped = bg_img_large.crop((crop_x, crop_y, crop_x + crop_width, crop_y + crop_height))
-            frame = cropped.resize((width, height), Image.Resampling.LANCZOS)
-            zoom_cache[i] = np.array(frame)
-        else:
-            zoom_cache[i] = np.array(bg_img_final)
-    
-    def make_frame(t):
-        # Update progress every few frames
-        frame_count[0] += 1
-        if frame_count[0] % (fps * 2) == 0:  # Every 2 seconds
-            progress = (frame_count[0] / total_expected_frames) * 100
-            print(f"   📹 Rendering frames: {progress:.1f}% ({frame_count[0]}/{total_expected_frames} frames)")
-        
-        # Use pre-cached zoom frame
-        zoom_progress = min(0.99, t / video_duration)  # Ensure we don't exceed cache bounds
-        cache_index = int(zoom_progress * (zoom_steps - 1))
-        frame_array = zoom_cache[cache_index]
-        
-        # Add GPU-accelerated floating digital motes overlay  
-        motes_gpu = create_floating_motes_gpu(width, height, t, video_duration)
-        
-        # Convert frame to GPU for efficient blending
-        frame_gpu = cp.asarray(frame_array)
-        
-        # GPU-accelerated additive blending
-        frame_gpu = cp.clip(frame_gpu + motes_gpu, 0, 255)
-        
-        # Convert back to PIL Image (only transfer from GPU when needed)
-        frame = Image.fromarray(cp.asnumpy(frame_gpu).astype(np.uint8))
-        draw = ImageDraw.Draw(frame)
-        
+    def draw_text(t, frame_array):
         # Find the current word being spoken
         # Convert video time to audio time by subtracting lead_in_time
         audio_time = t - lead_in_time
         current_word = None
-        
-        # Debug: Print timing info every 5 seconds for validation
-        if int(t * 2) % 10 == 0:  # Every 5 seconds
-            print(f"   🔍 TEXT TIMING at video_time={t:.2f}s: audio_time={audio_time:.2f}s, in_audio_range={0 <= audio_time <= audio_duration}")
-            if 0 <= audio_time <= audio_duration:
-                active_words = [w for w in whisper_word_timings if w['start'] <= audio_time <= w['end']]
-                if active_words:
-                    print(f"      Active words: {[w['word'] for w in active_words]}")
-                else:
-                    print(f"      No active words at audio_time {audio_time:.2f}s")
+        is_speaking = False
         
         if 0 <= audio_time <= audio_duration:
-            for timing in whisper_word_timings:
-                # Use original whisper timings directly with audio_time
-                if timing['start'] <= audio_time <= timing['end']:
-                    current_word = timing['word'].strip()
-                    break
-            
-            # If no current word, show the last spoken word
-            if not current_word:
-                for timing in reversed(whisper_word_timings):
-                    if timing['end'] <= audio_time:
-                        current_word = timing['word'].strip()
-                        break
+            # Spoken word, or the last spoken word during silence
+            timing, is_speaking = word_index.current(audio_time)
+            if timing:
+                current_word = timing['word'].strip()
 
         # Display only the current word, centered on screen
         if current_word:
-            # Calculate position to center the word
-            bbox = draw.textbbox((0, 0), current_word, font=font)
-            word_width = bbox[2] - bbox[0]
-            word_height = bbox[3] - bbox[1]
-            
-            x = (width - word_width) // 2
-            y = (height - word_height) // 2 - 100  # Slightly above center
-            
             # Calculate fade level for silence periods
             fade_alpha = 1.0
             if 0 <= audio_time <= audio_duration:
                 # During audio period - check if currently speaking
-                if not any(timing['start'] <= audio_time <= timing['end'] for timing in whisper_word_timings):
+                if not is_speaking:
                     # We're in a silence period, check how long since last word
-                    last_word_end = max((timing['end'] for timing in whisper_word_timings if timing['end'] <= audio_time), default=0)
-                    time_since_last = audio_time - last_word_end
+                    time_since_last = word_index.time_since_last_word(audio_time)
                     if time_since_last > 2.0:  # Start fading after 2 seconds of silence
                         fade_factor = max(0.3, 1.0 - (time_since_last - 2.0) / 3.0)  # Fade over 3 seconds to 30%
                         fade_alpha = fade_factor
@@ -651,51 +848,91 @@ def create_scrolling_text_video(text: str, video_duration: float, art_path: Path
                 # During lead-in or lead-out - fade to very dim
                 fade_alpha = 0.2
             
-            # Get the actual text bounding box at the final position for proper centering
-            actual_bbox = draw.textbbox((x, y), current_word, font=font)
-            
-            # Add padding around the actual text bounds
-            padding = 30
-            bg_left = actual_bbox[0] - padding
-            bg_right = actual_bbox[2] + padding
-            bg_top = actual_bbox[1] - padding
-            bg_bottom = actual_bbox[3] + padding
-            
-            # Draw fitted background rectangle
-            bg_alpha = int(180 * fade_alpha)
-            bg_color = (0, 0, 0, bg_alpha)
-            
-            bg_overlay = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            bg_draw = ImageDraw.Draw(bg_overlay)
-            bg_draw.rectangle([bg_left, bg_top, bg_right, bg_bottom], fill=bg_color)
-            
-            frame = Image.alpha_composite(frame.convert('RGBA'), bg_overlay).convert('RGB')
-            draw = ImageDraw.Draw(frame)
-            
-            # Determine if word is currently being spoken
-            is_speaking = (0 <= audio_time <= audio_duration and 
-                          any(timing['start'] <= audio_time <= timing['end'] for timing in whisper_word_timings if timing['word'].strip() == current_word))
-            
-            if is_speaking:
-                # Currently speaking word - bright amber highlight
-                base_word_color = (255, 200, 50)  # Bright amber
-                base_shadow_color = (120, 60, 0)  # Dark amber shadow
-            else:
-                # Not currently speaking - white
-                base_word_color = (255, 255, 255)  # White
-                base_shadow_color = (80, 80, 80)   # Gray shadow
-            
-            # Apply fade during silence
-            word_color = tuple(int(c * fade_alpha) for c in base_word_color)
-            shadow_color = tuple(int(c * fade_alpha) for c in base_shadow_color)
-            
-            # Draw word shadow for better visibility
-            draw.text((x + 3, y + 3), current_word, font=font, fill=shadow_color)
-            # Draw main word
-            draw.text((x, y), current_word, font=font, fill=word_color)
+            # Pre-rendered box, shadow and word, shared by every frame showing this word
+            fade_level = round(fade_alpha * WORD_FADE_STEPS)
+            with layer_timer.layer('text'):
+                sprite = word_sprite(current_word, is_speaking, fade_level, width, height)
+            with layer_timer.layer('composite'):
+                draw_word_sprite(frame_array, sprite)
         
-        return np.array(frame)
+        return frame_array
+    
+    return draw_text
+
+def log_text_layer_summary(word_index: WordTimingIndex, lead_in_time: float, audio_duration: float, video_duration: float):
+    """Debug: what the text layer shows, aggregated over every frame up front instead of logged per frame."""
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    fps = VIDEO_CONFIG['fps']
+    frames = Counter()
+    shown = set()
+    for index in range(int(video_duration * fps)):
+        audio_time = index / fps - lead_in_time
+        if not 0 <= audio_time <= audio_duration:
+            frames['lead-in/out'] += 1
+            continue
+        timing, is_speaking = word_index.current(audio_time)
+        if timing is None:
+            frames['before first word'] += 1
+        elif is_speaking:
+            frames['speaking'] += 1
+            shown.add(id(timing))
+        else:
+            frames['silence'] += 1
+    
+    stats = SummaryStats()
+    previous_end = None
+    for timing in word_index.timings:
+        stats.add('word seconds', timing['end'] - timing['start'])
+        if previous_end is not None and timing['start'] > previous_end:
+            stats.add('pause seconds', timing['start'] - previous_end)
+        previous_end = timing['end']
+    
+    log.debug("   🔍 Text layer frames: " + ", ".join(f"{state} {count}" for state, count in frames.items()),
+              extra={'fields': {'frames': dict(frames), 'words': len(word_index), 'words_never_shown': len(word_index) - len(shown)}})
+    log.debug(f"      {len(word_index) - len(shown)} of {len(word_index)} words are never highlighted on a frame")
+    stats.log(log, "   🔍 Word timing statistics:")
+
+def create_text_frame_renderer(video_duration: float, art_path: Path, audio_file: Path, lead_in_time: float,
+                               audio_duration: float, draw_background: bool = True):
+    """Build make_frame(t, frame=None) for the current-word text layer over the zooming art.
+    
+    Frames are composited in place in the given buffer (a new array if
+    none). With draw_background=False the buffer already holds the
+    background (a decoded plate) and only the text is drawn.
+    """
+    log.info(f"📜 Creating current-line text video with word highlighting...")
+    
+    width, height = VIDEO_CONFIG['resolution']
+    fps = VIDEO_CONFIG['fps']
+    plate_frame = create_background_renderer(art_path, video_duration) if draw_background else None
     
+    # Get EXACT word timings recorded at synthesis (or from Whisper for older audio)
+    log.info(f"🔍 Getting exact word timings from audio...")
+    whisper_word_timings = get_word_timings(audio_file)
+    
+    # Debug: Show first 5 word timings for validation
+    log.debug(f"   🔍 WORD TIMING VALIDATION (first 5 words):")
+    for i, timing in enumerate(whisper_word_timings[:5]):
+        log.debug(f"      {i+1}: '{timing['word']}' [{timing['start']:.2f}s - {timing['end']:.2f}s]")
+    log.info(f"   📊 Total words detected: {len(whisper_word_timings)}")
+    word_index = WordTimingIndex(whisper_word_timings)
+    
+    log_text_layer_summary(word_index, lead_in_time, audio_duration, video_duration)
+    draw_text = create_text_layer(word_index, lead_in_time, audio_duration)
+    
+    def make_frame(t, frame_array=None):
+        if frame_array is None:
+            frame_array = np.empty((height, width, 3), dtype=np.uint8)
+        if plate_frame:
+            plate_frame(t, frame_array)
+        return draw_text(t, frame_array)
+    
+    return make_frame
+
+def create_scrolling_text_video(video_duration: float, art_path: Path, audio_file: Path, lead_in_time: float, audio_duration: float) -> VideoClip:
+    """Create text video showing current line with word highlighting."""
+    make_frame = create_text_frame_renderer(video_duration, art_path, audio_file, lead_in_time, audio_duration)
     return VideoClip(make_frame, duration=video_duration)
 
 def create_gradient_background(width: int, height: int) -> Image.Image:
@@ -713,57 +950,8 @@ def create_gradient_background(width: int, height: int) -> Image.Image:
     
     return img
 
-def clean_text_for_video(text: str) -> str:
-    """Clean and format text for video display."""
-    # Remove markdown
-    text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
-    text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-    text = re.sub(r'\*(.+?)\*', r'\1', text)
-    text = re.sub(r'`(.+?)`', r'\1', text)
-    
-    # Format paragraphs
-    paragraphs = text.split('\n\n')
-    formatted_lines = []
-    
-    for para in paragraphs:
-        para = para.strip()
-        if para:
-            # Word wrap
-            words = para.split()
-            line = ""
-            for word in words:
-                test_line = f"{line} {word}".strip()
-                if len(test_line) > 80:  # Approximate character limit
-                    if line:
-                        formatted_lines.append(line)
-                    line = word
-                else:
-                    line = test_line
-            if line:
-                formatted_lines.append(line)
-            formatted_lines.append("")  # Paragraph break
-    
-    return '\n'.join(formatted_lines)
-
-def create_chapter_video(chapter_file: Path, audio_file: Path, art_dir: Path, output_dir: Path) -> Path:
-    """Create video for a single chapter."""
-    # Output path
-    output_file = output_dir / f"{chapter_file.stem}.mp4"
-    
-    # Check if video already exists
-    if output_file.exists():
-        size_mb = output_file.stat().st_size / (1024 * 1024)
-        print(f"⏭️  Skipping {chapter_file.stem} - video already exists ({size_mb:.1f} MB)")
-        return output_file
-    
-    print(f"🎬 Creating video for {chapter_file.stem}...")
-    
-    # Read chapter content
-    print("   📄 Loading chapter content...")
-    content = chapter_file.read_text(encoding='utf-8')
-    
-    # Determine art file
-    print("   🎨 Setting up artwork...")
+def chapter_art_file(chapter_file: Path, art_dir: Path) -> Path:
+    """Artwork for a chapter, falling back to the chapter 1 art."""
     art_file = art_dir / "chapter_1.png"  # Default chapter art
     if chapter_file.stem == "foreword":
         art_file = art_dir / "foreword.png"
@@ -774,195 +962,541 @@ def create_chapter_video(chapter_file: Path, audio_file: Path, art_dir: Path, ou
         specific_art = art_dir / f"chapter_{chapter_num}.png"
         if specific_art.exists():
             art_file = specific_art
+    return art_file
+
+RENDERER_VERSION = 1  # bump when a renderer change should re-render every chapter video
+
+# VIDEO_CONFIG entries that change how fast a video is built, not what it looks like
+# ('background_plates' isn't one: plates re-encode the background at PLATE_CRF)
+BUILD_TUNING_KEYS = {'max_workers', 'chapter_memory_gb', 'min_cores_per_chapter', 'alignment_workers',
+                     'segment_seconds'}
+
+def render_settings(fast: bool = False) -> Dict:
+    """Settings that shape a chapter video: VIDEO_CONFIG look entries and renderer constants."""
+    settings = {key: value for key, value in VIDEO_CONFIG.items()
+                if key not in BUILD_TUNING_KEYS and (fast or not key.startswith('fast_'))}
+    settings.update(mode='captioned' if fast else 'burned_in',
+                    zoom=[ZOOM_START, ZOOM_END, ZOOM_SUBPIXEL_STEPS],
+                    plate=[PLATE_VERSION, PLATE_CRF],
+                    word_fade_steps=WORD_FADE_STEPS,
+                    whisper=[WHISPER_MODEL, WHISPER_OPTIONS])
+    return settings
+
+def chapter_render_inputs(chapter_file: Path, audio_file: Path, art_file: Path, fast: bool = False) -> Dict:
+    """Hashes of everything a chapter video is rendered from, as recorded in its manifest."""
+    return {
+        'markdown': hash_file(chapter_file),
+        'audio': content_hash(audio_file),
+        'timings': hash_file(timings_sidecar(audio_file)),
+        'art': hash_file(art_file),
+        'config': hash_bytes(json.dumps(render_settings(fast), sort_keys=True, default=str)),
+        'renderer': RENDERER_VERSION,
+    }
+
+def chapter_video_details(video_file: Path, audio_duration: float, fps: int) -> Dict:
+    """Timing and stream details of a rendered chapter for its manifest, probed once from the file."""
+    probed = probe_video(video_file)
+    return {
+        'duration': probed['duration'],
+        'frames': probed['frames'],
+        'fps': fps,
+        'audio_offset': VIDEO_CONFIG['lead_in_pause'],
+        'audio_duration': audio_duration,
+        'streams': probed['streams'],
+    }
+
+def chapter_video_up_to_date(output_file: Path, inputs: Dict) -> bool:
+    """Whether output_file was rendered from these inputs; logs why it is being (re)rendered."""
+    changed = stale_inputs(output_file, inputs)
+    if not changed:
+        size_mb = output_file.stat().st_size / (1024 * 1024)
+        log.info(f"⏭️  Skipping {output_file.stem} - video up to date ({size_mb:.1f} MB)")
+        return True
+    if output_file.exists():
+        reason = ', '.join(changed) if read_manifest(output_file) else 'no render manifest'
+        log.info(f"♻️  {output_file.stem} is stale ({reason}) - re-rendering")
+    return False
+
+def create_chapter_video(chapter_file: Path, audio_file: Path, art_dir: Path, output_dir: Path,
+                         frame_workers: int = None, encoder_threads: int = None) -> Path:
+    """Create video for a single chapter.
+    
+    The video is encoded to a .partial file and renamed into place when
+    complete, so an interrupted render is redone rather than skipped. A
+    finished video is skipped only while the input hashes in its render
+    manifest still match.
+    """
+    # Output path
+    output_file = output_dir / f"{chapter_file.stem}.mp4"
+    art_file = chapter_art_file(chapter_file, art_dir)
+    
+    # Skip the chapter unless its inputs changed since the last render
+    inputs = chapter_render_inputs(chapter_file, audio_file, art_file)
+    if chapter_video_up_to_date(output_file, inputs):
+        return output_file
+    
+    log.info(f"🎬 Creating video for {chapter_file.stem}...")
     
     # Load audio to get duration
-    print("   🎵 Analyzing audio...")
-    audio_data, sample_rate = sf.read(str(audio_file))
-    audio_duration = len(audio_data) / sample_rate
+    log.info("   🎵 Analyzing audio...")
+    audio_duration = audio_duration_seconds(audio_file)
     
     # Add lead-in and lead-out pauses
     lead_in = VIDEO_CONFIG['lead_in_pause']
     lead_out = VIDEO_CONFIG['lead_out_pause']
     video_duration = lead_in + audio_duration + lead_out
     
-    print(f"   ⏱️  Audio duration: {audio_duration:.1f}s ({audio_duration/60:.1f} minutes)")
-    print(f"   ⏱️  Video duration: {video_duration:.1f}s (with {lead_in:.1f}s lead-in + {lead_out:.1f}s lead-out)")
-    print(f"   🖼️  Using artwork: {art_file.name}")
+    log.info(f"   ⏱️  Audio duration: {audio_duration:.1f}s ({audio_duration/60:.1f} minutes)")
+    log.info(f"   ⏱️  Video duration: {video_duration:.1f}s (with {lead_in:.1f}s lead-in + {lead_out:.1f}s lead-out)")
+    log.info(f"   🖼️  Using artwork: {art_file.name}")
     
-    # Load background image for both text and waveform
-    print("   🖼️  Processing background image...")
-    bg_img = Image.open(art_file)
-    bg_img = bg_img.resize(VIDEO_CONFIG['resolution'], Image.Resampling.LANCZOS)
-    bg_img_np = np.array(bg_img.convert("RGB"))
+    # CUDA contexts don't survive fork, so the CuPy backend renders in this process
+    if backend.name == 'cupy':
+        frame_workers = 1
     
-    # Create text video
-    print("   📝 Creating text video layer...")
-    text_video = create_scrolling_text_video(content, video_duration, art_file, audio_file, lead_in, audio_duration)
+    # Zoom and motes come from the cached background plate when enabled, so only text is drawn per frame
+    plate_file = None
+    if VIDEO_CONFIG['background_plates']:
+        plate_file = background_plate(art_file, video_duration, frame_workers, encoder_threads)
     
-    # Waveform disabled - background needs to be dynamic
-    print("   🔇 Waveform visualization disabled (dynamic background incompatible with caching)")
-    waveform_video = None
+    # Create text frame renderer
+    log.info("   📝 Creating text video layer...")
+    make_frame = create_text_frame_renderer(video_duration, art_file, audio_file, lead_in, audio_duration,
+                                            draw_background=plate_file is None)
     
-    # Load audio - keep it simple and cut it cleanly
-    audio_clip = AudioFileClip(str(audio_file)).subclip(0, audio_duration)
+    # Waveform disabled - background needs to be dynamic
+    log.debug("   🔇 Waveform visualization disabled (dynamic background incompatible with caching)")
     
     # Debug: Validate audio timing
-    print(f"   🔍 AUDIO TIMING VALIDATION:")
-    print(f"      Original audio duration: {audio_duration:.2f}s")
-    print(f"      Audio will start at: {lead_in:.2f}s (lead-in time)")
-    print(f"      Audio will end at: {lead_in + audio_duration:.2f}s")
-    print(f"      Total video duration: {video_duration:.2f}s")
-    
-    # Composite video layers
-    width, height = VIDEO_CONFIG['resolution']
-    
-    # Combine elements - just background with text (no waveform)
-    final_video = text_video
-    
-    # Add delayed audio
-    final_video = final_video.set_audio(audio_clip)
-    
-    # Render with progress tracking
-    print(f"   🎥 Rendering {output_file.name}...")
+    log.debug(f"   🔍 AUDIO TIMING VALIDATION:")
+    log.debug(f"      Original audio duration: {audio_duration:.2f}s")
+    log.debug(f"      Audio will start at: {lead_in:.2f}s (lead-in time)")
+    log.debug(f"      Audio will end at: {lead_in + audio_duration:.2f}s")
+    log.debug(f"      Total video duration: {video_duration:.2f}s")
+    
+    # Render frames in parallel straight into ffmpeg, composited in place in the frame buffers,
+    # in time segments joined at the end, where the audio is delayed by the lead-in and muxed once
+    log.info(f"   🎥 Rendering {output_file.name}...")
     mp4_output = output_file.with_suffix('.mp4')
-    
-    # Custom progress callback for MoviePy
-    def progress_callback(t, total_duration):
-        progress = (t / total_duration) * 100 if total_duration > 0 else 0
-        if int(progress) % 5 == 0:  # Show every 5%
-            print(f"      📼 Video encoding: {progress:.1f}% ({t:.1f}s/{total_duration:.1f}s)")
-    
-    # Optimized rendering settings for speed
-    final_video.write_videofile(
-        str(mp4_output),
+    partial_output = mp4_output.with_name(mp4_output.name + '.partial')
+    render_video_segments(
+        make_frame,
+        video_duration,
+        partial_output,
+        segments=chapter_segments(video_duration, frame_workers),
+        background=plate_file,
+        in_place=True,
+        audio_file=audio_file,
+        audio_delay=lead_in,
         fps=VIDEO_CONFIG['fps'],
-        codec='libx264',
-        audio_codec='aac',
+        size=VIDEO_CONFIG['resolution'],
+        workers=frame_workers or VIDEO_CONFIG['max_workers'],
+        threads=encoder_threads or min(16, cpu_count()),  # Use available CPU cores
         preset='ultrafast',  # Fastest encoding preset
-        ffmpeg_params=['-crf', '23'],  # Balanced quality/speed
-        threads=min(16, cpu_count()),  # Use available CPU cores
-        verbose=False,
-        logger='bar',
-        temp_audiofile='temp-audio.m4a',  # Use temp audio file
-        remove_temp=True
+        crf=23  # Balanced quality/speed
     )
+    os.replace(partial_output, mp4_output)
+    write_manifest(mp4_output, inputs, **chapter_video_details(mp4_output, audio_duration, VIDEO_CONFIG['fps']))
     
-    print(f"✅ Video created: {mp4_output}")
+    for line in artifact_cache.summary() + plate_cache.summary():
+        log.info(f"   💾 Cache {line}")
+    log.info(f"✅ Video created: {mp4_output}")
     return mp4_output
 
-def create_audiobook_videos():
-    """Create video versions of the audiobook."""
-    print("🎬 Digital Amber - Video Audiobook Creation")
-    print("=" * 50)
+def create_captioned_chapter_video(chapter_file: Path, audio_file: Path, art_dir: Path, output_dir: Path,
+                                   frame_workers: int = None, encoder_threads: int = None) -> Path:
+    """Fast mode: the chapter art and narration with soft captions instead of burned-in text.
+    
+    Captions are written next to the video as WebVTT and SRT, and the SRT is
+    muxed in as a caption track. The art is a still plate (or, with
+    'fast_zoom', the slow Ken Burns zoom) encoded at a low frame rate with
+    x264 settings for near-static content.
+    """
+    output_file = output_dir / f"{chapter_file.stem}.mp4"
+    art_file = chapter_art_file(chapter_file, art_dir)
+    inputs = chapter_render_inputs(chapter_file, audio_file, art_file, fast=True)
+    if chapter_video_up_to_date(output_file, inputs):
+        return output_file
+    
+    log.info(f"🎬 Creating captioned video for {chapter_file.stem}...")
+    audio_duration = audio_duration_seconds(audio_file)
+    lead_in = VIDEO_CONFIG['lead_in_pause']
+    video_duration = lead_in + audio_duration + VIDEO_CONFIG['lead_out_pause']
+    log.info(f"   ⏱️  Video duration: {video_duration:.1f}s, artwork: {art_file.name}")
+    
+    # Caption cues from the word timings, shifted by the lead-in like the audio
+    vtt_file, srt_file = write_captions(get_word_timings(audio_file), output_file, lead_in)
+    log.info(f"   💬 Captions: {vtt_file.name}, {srt_file.name}")
+    
+    width, height = VIDEO_CONFIG['resolution']
+    fps = VIDEO_CONFIG['fast_fps']
+    background = create_zoom_background(load_zoom_source(art_file, width, height), (width, height), video_duration)
+    partial_output = output_file.with_name(output_file.name + '.partial')
+    encoder_options = dict(
+        audio_file=audio_file,
+        audio_delay=lead_in,
+        fps=fps,
+        size=(width, height),
+        threads=encoder_threads or min(16, cpu_count()),
+        subtitle_file=srt_file,
+        preset='veryfast',
+        crf=26,
+        keyint=fps * 10  # Long GOPs: nearly every frame repeats the last one
+    )
+    
+    if VIDEO_CONFIG['fast_zoom']:
+        log.info(f"   🎥 Rendering slow zoom at {fps} fps...")
+        render_video(background, video_duration, partial_output,
+                     workers=1 if backend.name == 'cupy' else frame_workers or VIDEO_CONFIG['max_workers'],
+                     **encoder_options)
+    else:
+        # The whole art, held for the chapter
+        log.info(f"   🖼️  Encoding still plate...")
+        plate_file = output_file.with_name(f".{output_file.stem}.plate.png")
+        Image.fromarray(background(video_duration)).save(plate_file)
+        try:
+            encode_still(plate_file, video_duration, partial_output, tune='stillimage', **encoder_options)
+        finally:
+            plate_file.unlink(missing_ok=True)
+    os.replace(partial_output, output_file)
+    write_manifest(output_file, inputs, **chapter_video_details(output_file, audio_duration, fps))
+    
+    log.info(f"✅ Video created: {output_file}")
+    return output_file
+
+def available_memory_bytes() -> int:
+    """Memory available for new work (total physical memory if unknown)."""
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+
+def chapter_memory_bytes(frame_workers: int) -> int:
+    """Peak memory of one chapter render: its shared buffers plus a sprite cache per frame worker.
+    
+    Segment processes split the chapter's frame workers between them, so
+    the number of sprite caches stays about the same when segmented.
+    """
+    return int(VIDEO_CONFIG['chapter_memory_gb'] * 1024**3) + (frame_workers + 1) * SPRITE_CACHE_BYTES
+
+def plan_chapter_workers(job_count: int, chapter_workers: int = None) -> Tuple[int, int, int]:
+    """Split the cores between concurrent chapters.
+    
+    Returns (chapters rendered at once, frame workers per chapter, encoder
+    threads per chapter). Concurrency is capped by cores, by available memory
+    and by the number of chapters; the GPU backend renders one at a time.
+    """
+    cores = VIDEO_CONFIG['max_workers']
+    if backend.name == 'cupy':
+        return 1, 1, min(16, cores)
+    
+    def split_cores(chapter_workers):
+        # x264 ultrafast needs far less CPU than frame rendering
+        cores_per_chapter = max(1, cores // chapter_workers)
+        encoder_threads = max(1, cores_per_chapter // 4)
+        return max(1, cores_per_chapter - encoder_threads), encoder_threads
+    
+    if chapter_workers is None:
+        chapter_workers = max(1, min(job_count, cores // VIDEO_CONFIG['min_cores_per_chapter']))
+        # Fewer, wider chapters until all of them fit in memory
+        available = available_memory_bytes()
+        while chapter_workers > 1 and chapter_workers * chapter_memory_bytes(split_cores(chapter_workers)[0]) > available:
+            chapter_workers -= 1
+    chapter_workers = max(1, min(job_count, chapter_workers))
+    frame_workers, encoder_threads = split_cores(chapter_workers)
+    return chapter_workers, frame_workers, encoder_threads
+
+def audiobook_video_jobs(story_dir: Path, audio_dir: Path) -> List[Tuple[str, Path, Path]]:
+    """(label, markdown, narration) for the foreword, chapters 1-24 and epilogue in book order."""
+    jobs = []
+    candidates = [("Foreword", story_dir / "foreword.md", audio_dir / "000_foreword.wav")]
+    candidates += [(f"Chapter {i}", story_dir / f"chapter_{i}.md", audio_dir / f"{i:03d}_chapter_{i}.wav")
+                   for i in range(1, 25)]
+    candidates.append(("Epilogue", story_dir / "epilogue.md", audio_dir / "999_epilogue.wav"))
+    
+    for label, markdown_file, audio_file in candidates:
+        if markdown_file.exists() and audio_file.exists():
+            jobs.append((label, markdown_file, audio_file))
+        elif label.startswith("Chapter"):
+            log.warning(f"⚠️  {label} files not found: {markdown_file.name}, {audio_file.name}")
+    return jobs
+
+def create_audiobook_videos(chapter_workers: int = None, alignment_workers: int = None, fast: bool = False):
+    """Create video versions of the audiobook, several chapters at a time.
+    
+    With fast=True the chapters get soft captions over the art instead of
+    burned-in text (see create_captioned_chapter_video).
+    """
+    log.info("🎬 Digital Amber - Video Audiobook Creation")
+    log.info("=" * 50)
     
     # Setup directories
     art_dir = use_local_art()
     audio_dir = Path("dist/audiobook_kokoro")
-    video_output_dir = Path("dist/audiobook_videos")
+    video_output_dir = Path("dist/audiobook_videos_fast" if fast else "dist/audiobook_videos")
     video_output_dir.mkdir(parents=True, exist_ok=True)
     story_dir = Path("story")
+    create_video = create_captioned_chapter_video if fast else create_chapter_video
     
     # Check if audio exists
     if not audio_dir.exists():
-        print("❌ Kokoro audio not found. Generate audio first.")
+        log.error("❌ Kokoro audio not found. Generate audio first.")
         return
     
-    # Process all chapters
-    video_files = []
-    
-    # Process foreword
-    foreword_md = story_dir / "foreword.md"
-    foreword_audio = audio_dir / "000_foreword.wav"
-    
-    if foreword_md.exists() and foreword_audio.exists():
-        print(f"\n🎬 Creating foreword video...")
-        video_file = create_chapter_video(foreword_md, foreword_audio, art_dir, video_output_dir)
-        if video_file:
-            video_files.append(video_file)
-            size_mb = video_file.stat().st_size / (1024 * 1024)
-            print(f"✅ Foreword: {video_file.name} ({size_mb:.1f} MB)")
-    
-    # Process all chapters (1-24) sequentially - one at a time
-    chapter_range = range(1, 25)
-    total_chapters = len(chapter_range)
-    
-    with tqdm(total=total_chapters, desc="🎬 Creating Chapter Videos", unit="chapter") as pbar:
-        for i in chapter_range:
-            chapter_md = story_dir / f"chapter_{i}.md"
-            chapter_audio = audio_dir / f"{i:03d}_chapter_{i}.wav"
-            
-            if chapter_md.exists() and chapter_audio.exists():
+    jobs = audiobook_video_jobs(story_dir, audio_dir)
+    
+    # Word timings for every chapter up front, so rendering never waits on Whisper
+    align_chapters([audio_file for _, _, audio_file in jobs], alignment_workers)
+    chapter_workers, frame_workers, encoder_threads = plan_chapter_workers(len(jobs), chapter_workers)
+    log.info(f"⚙️  Rendering {chapter_workers} chapter(s) at once: "
+          f"{frame_workers} frame workers + {encoder_threads} encoder threads each")
+    
+    # Longest narration first so the last chapters to finish are short ones
+    order = sorted(range(len(jobs)), key=lambda i: jobs[i][2].stat().st_size, reverse=True)
+    results = {}
+    
+    with tqdm(total=len(jobs), desc="🎬 Creating Chapter Videos", unit="chapter") as pbar:
+        def finished(index, video_file):
+            label = jobs[index][0]
+            if video_file:
+                results[index] = video_file
+                size_mb = video_file.stat().st_size / (1024 * 1024)
+                log.info(f"✅ {label}: {video_file.name} ({size_mb:.1f} MB)")
+            pbar.update(1)
+        
+        if chapter_workers == 1:
+            for index in order:
+                label, markdown_file, audio_file = jobs[index]
                 try:
-                    print(f"\n🎬 Creating Chapter {i} video...")
-                    video_file = create_chapter_video(chapter_md, chapter_audio, art_dir, video_output_dir)
-                    if video_file:
-                        video_files.append(video_file)
-                        size_mb = video_file.stat().st_size / (1024 * 1024)
-                        print(f"✅ Chapter {i}: {video_file.name} ({size_mb:.1f} MB)")
+                    log.info(f"\n🎬 Creating {label} video...")
+                    finished(index, create_video(markdown_file, audio_file, art_dir, video_output_dir,
+                                                 frame_workers, encoder_threads))
                 except Exception as e:
-                    print(f"❌ Chapter {i} failed: {e}")
-            else:
-                print(f"⚠️  Chapter {i} files not found: {chapter_md.name}, {chapter_audio.name}")
-            
-            pbar.update(1)
-    
-    # Process epilogue
-    epilogue_md = story_dir / "epilogue.md"
-    epilogue_audio = audio_dir / "999_epilogue.wav"
-    
-    if epilogue_md.exists() and epilogue_audio.exists():
-        print(f"\n🎬 Creating epilogue video...")
-        video_file = create_chapter_video(epilogue_md, epilogue_audio, art_dir, video_output_dir)
-        if video_file:
-            video_files.append(video_file)
-            size_mb = video_file.stat().st_size / (1024 * 1024)
-            print(f"✅ Epilogue: {video_file.name} ({size_mb:.1f} MB)")
+                    log.error(f"❌ {label} failed: {e}")
+                    pbar.update(1)
+        else:
+            # Forked so chapters inherit the array backend and can fork their own frame workers
+            with ProcessPoolExecutor(max_workers=chapter_workers, mp_context=mp.get_context('fork')) as executor:
+                futures = {
+                    executor.submit(create_video, jobs[index][1], jobs[index][2], art_dir,
+                                    video_output_dir, frame_workers, encoder_threads): index
+                    for index in order
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        finished(index, future.result())
+                    except Exception as e:
+                        log.error(f"❌ {jobs[index][0]} failed: {e}")
+                        pbar.update(1)
+    
+    video_files = [results[index] for index in sorted(results)]
     
     # Final summary
     if video_files:
         total_size_mb = sum(f.stat().st_size for f in video_files) / (1024 * 1024)
-        print(f"\n🎉 Video generation complete!")
-        print(f"📁 Total videos created: {len(video_files)}")
-        print(f"📊 Total size: {total_size_mb:.1f} MB")
-        print(f"📂 Output directory: {video_output_dir}")
+        log.info(f"\n🎉 Video generation complete!")
+        log.info(f"📁 Total videos created: {len(video_files)}")
+        log.info(f"📊 Total size: {total_size_mb:.1f} MB")
+        log.info(f"📂 Output directory: {video_output_dir}")
     else:
-        print("❌ No videos created")
-        return
+        log.error("❌ No videos created")
+
+def benchmark_backends(num_frames: int = 120):
+    """Time the motes overlay and blend on every available backend and compare outputs."""
+    global backend
+    width, height = VIDEO_CONFIG['resolution']
+    fps = VIDEO_CONFIG['fps']
+    base = np.random.default_rng(0).integers(0, 256, (height, width, 3), dtype=np.uint8)
+    active = backend
+    outputs = {}
     
-    # Skip combined video creation
-    if False:
-        print("\n🎞️  Creating combined audiobook video...")
-        combined_clips = [VideoFileClip(str(vf)) for vf in video_files]
-        
-        final_video = concatenate_videoclips(combined_clips, method="compose")
-        
-        # Output as MP4 format (WebP video not well supported)
-        mp4_output = video_output_dir / "digital_amber_audiobook_video.mp4"
-        
-        final_video.write_videofile(
-            str(mp4_output),
-            fps=VIDEO_CONFIG['fps'],
-            codec='libx264',
-            audio_codec='aac',
-            verbose=False,
-            logger=None
-        )
-        
-        print(f"🎉 Audiobook video complete!")
-        print(f"📁 Output: {video_output_dir}")
-        print(f"🎬 Video file: {mp4_output.name}")
-        print(f"📊 Chapters: {len(video_files)}")
+    log.info(f"⏱️  Benchmarking motes + blend over {num_frames} frames at {width}x{height}")
+    try:
+        for name in available_backends():
+            backend = load_backend(name)
+            create_floating_motes(width, height, 0.0, num_frames / fps)  # Warm up kernels and caches
+            backend.synchronize()
+            
+            start = time.perf_counter()
+            for frame in range(num_frames):
+                result = add_floating_motes(base.copy(), frame / fps)
+            backend.synchronize()
+            elapsed = time.perf_counter() - start
+            
+            outputs[name] = result
+            log.info(f"   {name:>6}: {num_frames / elapsed:7.1f} fps ({elapsed * 1000 / num_frames:.1f} ms/frame)")
+    finally:
+        backend = active
+    
+    if len(outputs) > 1:
+        difference = np.abs(outputs['cupy'].astype(np.int16) - outputs['numpy'].astype(np.int16)).max()
+        log.info(f"   Max pixel difference cupy vs numpy: {difference}")
+
+def synthetic_chapter(directory: Path, seconds: float):
+    """Write procedural art and sine/noise narration for a benchmark chapter; returns (art, audio, timings)."""
+    sample_rate = 24000
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    
+    # Voiced harmonics under a syllable-rate envelope, plus breath noise
+    voice = sum(np.sin(2 * np.pi * 140 * harmonic * t) / harmonic for harmonic in range(1, 6))
+    envelope = np.clip(np.sin(2 * np.pi * 2.8 * t), 0, None)
+    audio = (0.2 * voice * envelope + 0.02 * rng.standard_normal(len(t))).astype(np.float32)
+    audio_file = directory / "benchmark.wav"
+    sf.write(audio_file, audio, sample_rate)
+    
+    art_file = directory / "benchmark.png"
+    create_placeholder_art(art_file, "benchmark_chapter")
+    
+    # A word every 0.35 s with a 3 s pause every 20 words, so fades are exercised too
+    timings = []
+    start = 0.0
+    while start < seconds - 0.3:
+        timings.append({'word': f"word{len(timings) % 97}", 'start': start, 'end': start + 0.3, 'confidence': 1.0})
+        start += 3.35 if len(timings) % 20 == 0 else 0.35
+    return art_file, audio_file, timings
+
+def benchmark_render(num_frames: int = 240):
+    """Render frames of a synthetic chapter inline and report ms/frame per layer, frames/s and peak RSS.
+    
+    Every layer runs in this process (zoom, motes, meter, text, composite
+    and the encoder write, to ffmpeg when installed or /dev/null otherwise),
+    so results compare release over release without Kokoro audio.
+    """
+    import resource
+    import shutil
+    import subprocess
+    import tempfile
+    width, height = VIDEO_CONFIG['resolution']
+    fps = VIDEO_CONFIG['fps']
+    lead_in = VIDEO_CONFIG['lead_in_pause']
+    duration = num_frames / fps
+    audio_duration = max(1.0, duration - lead_in - VIDEO_CONFIG['lead_out_pause'])
+    meter_height = VIDEO_CONFIG['waveform_height']
+    
+    log.info(f"⏱️  Benchmarking {num_frames} frames of a synthetic chapter at {width}x{height} ({backend.name} backend)")
+    with tempfile.TemporaryDirectory() as directory:
+        # Band levels and other artifacts go to a throwaway store, not the build cache
+        cache = ArtifactCache(Path(directory) / "artifacts")
+        art_file, audio_file, timings = synthetic_chapter(Path(directory), audio_duration)
+        plate_frame = create_background_renderer(art_file, duration)
+        draw_text = create_text_layer(WordTimingIndex(timings), lead_in, audio_duration)
+        bg_img = np.asarray(Image.open(art_file).convert('RGB').resize((width, height), Image.Resampling.LANCZOS))
+        meter_frame = create_frequency_meter_renderer(audio_file, bg_img, cache)
+        frame = np.empty((height, width, 3), dtype=np.uint8)
         
-        # Show file size
-        size_mb = mp4_output.stat().st_size / (1024 * 1024)
-        print(f"📈 File size: {size_mb:.1f} MB")
+        if shutil.which('ffmpeg'):
+            encoder = subprocess.Popen(encoder_command(Path(directory) / "benchmark.mp4", (width, height), fps),
+                                       stdin=subprocess.PIPE)
+            sink = encoder.stdin
+        else:
+            log.warning("   ⚠️  ffmpeg not found; encoder write goes to /dev/null")
+            encoder, sink = None, open(os.devnull, 'wb')
         
-        # Clean up individual chapter videos if desired
-        # for vf in video_files:
-        #     vf.unlink()
+        layer_timer.reset()
+        layer_timer.enabled = True
+        start = time.perf_counter()
+        try:
+            for index in range(num_frames):
+                t = index / fps
+                plate_frame(t, frame)
+                strip = meter_frame(t - lead_in)
+                with layer_timer.layer('composite'):
+                    frame[height - meter_height:] = strip
+                draw_text(t, frame)
+                with layer_timer.layer('encode write'):
+                    sink.write(frame.data)
+            sink.close()
+            if encoder:
+                encoder.wait()
+        finally:
+            elapsed = time.perf_counter() - start
+            layer_timer.enabled = False
+    
+    for line in layer_timer.report(num_frames):
+        log.info(f"   {line}")
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    log.info(f"   {'total':>12}: {elapsed * 1000 / num_frames:8.2f} ms/frame, {num_frames / elapsed:.1f} frames/s, peak RSS {peak_rss_mb:.0f} MB")
+
+def profile_frame_allocations(num_frames: int = 120):
+    """Report the memory allocated per frame compositing a synthetic chapter.
     
-    else:
-        print("❌ No videos created")
+    Compares text over a decoded plate, the whole frame drawn in a reused
+    buffer, and the whole frame drawn into new arrays.
+    """
+    import tracemalloc
+    width, height = VIDEO_CONFIG['resolution']
+    fps = VIDEO_CONFIG['fps']
+    duration = num_frames / fps
+    frame_bytes = width * height * 3
+    
+    # Gradient art and a word every 0.4 s
+    timings = [{'word': f"word{i % 50}", 'start': i * 0.4, 'end': i * 0.4 + 0.3} for i in range(int(duration / 0.4))]
+    plate_frame = create_background_renderer(None, duration)
+    draw_text = create_text_layer(WordTimingIndex(timings), 0.0, duration)
+    buffer = np.empty((height, width, 3), dtype=np.uint8)
+    
+    log.info(f"🔬 Profiling allocations over {num_frames} frames at {width}x{height} ({backend.name} backend)")
+    layers = (("text on plate", lambda t: draw_text(t, buffer)),  # background decoded from a cached plate
+              ("in place", lambda t: draw_text(t, plate_frame(t, buffer))),
+              ("new arrays", lambda t: draw_text(t, plate_frame(t))))
+    for label, render in layers:
+        for frame in range(num_frames):
+            render(frame / fps)  # Warm up sprite and mote caches
+        
+        allocated = []
+        tracemalloc.start()
+        try:
+            for frame in range(num_frames):
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                render(frame / fps)
+                allocated.append(tracemalloc.get_traced_memory()[1] - before)
+        finally:
+            tracemalloc.stop()
+        log.info(f"   {label:>13}: {np.mean(allocated) / 1024:8.0f} KB/frame mean, {max(allocated) / 1024:8.0f} KB max "
+              f"({np.mean(allocated) / frame_bytes:.2f} frame buffers)")
 
 if __name__ == "__main__":
-    create_audiobook_videos()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Create Digital Amber audiobook videos')
+    parser.add_argument('--log-level', default=None, choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                       help='Logging level (default: BUILD_LOG_LEVEL or INFO)')
+    parser.add_argument('--backend', choices=BACKEND_NAMES, default=None,
+                       help='Array backend for frame rendering (default: VIDEO_BACKEND or auto)')
+    parser.add_argument('--benchmark-spectrum', type=float, nargs='?', const=600.0, metavar='SECONDS',
+                       help='Benchmark batched spectrum analysis against the per-frame loop')
+    parser.add_argument('--alignment-workers', type=int, default=None, metavar='N',
+                       help='Whisper alignment processes (default: one per 8 cores)')
+    parser.add_argument('--chapter-workers', type=int, default=None, metavar='N',
+                       help='Chapters to render at once (default: sized by cores and memory)')
+    parser.add_argument('--fast', action='store_true',
+                       help='Soft captions over the art instead of burned-in text (much faster)')
+    parser.add_argument('--profile-allocations', type=int, nargs='?', const=120, metavar='FRAMES',
+                       help='Report memory allocated per frame while compositing instead of building')
+    parser.add_argument('--benchmark-render', type=int, nargs='?', const=240, metavar='FRAMES',
+                       help='Render a synthetic chapter and report ms/frame per layer, frames/s and peak RSS')
+    parser.add_argument('--benchmark-backends', type=int, nargs='?', const=120, metavar='FRAMES',
+                       help='Benchmark the frame renderers on each available backend instead of building')
+    
+    args = parser.parse_args()
+    if args.log_level:
+        os.environ['BUILD_LOG_LEVEL'] = args.log_level  # Spawned alignment workers configure from the environment
+        configure_logging(args.log_level)
+    if args.backend:
+        set_array_backend(args.backend)
+    log.info(f"🧮 Array backend: {backend.name}")
+    
+    if args.benchmark_backends:
+        benchmark_backends(args.benchmark_backends)
+    elif args.benchmark_render:
+        benchmark_render(args.benchmark_render)
+    elif args.profile_allocations:
+        profile_frame_allocations(args.profile_allocations)
+    elif args.benchmark_spectrum:
+        benchmark_spectrum(args.benchmark_spectrum)
+    else:
+        create_audiobook_videos(args.chapter_workers, args.alignment_workers, args.fast)
\ No newline at end of file
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""Render video frames in worker processes and stream them into ffmpeg in order.
+
+Workers are forked so they inherit the frame renderer (a closure over the
+chapter's preloaded art and timings) without pickling it. Each worker
+renders into a slot of a shared-memory ring buffer, and the parent writes
+the slots to ffmpeg's stdin as raw RGB in frame order. Given a background
+video (a pre-rendered plate), the parent decodes each of its frames into a
+slot before handing the slot to a worker to draw over.
+
+Long videos can be split into keyframe-aligned time segments rendered and
+encoded by parallel processes, then joined with a stream-copy concat that
+muxes the audio once.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import threading
+import time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+import numpy as np
+from render_timing import layer_timer
+from build_log import SummaryStats, get_logger
+
+log = get_logger('frames')
+
+# Renderer and ring buffer inherited by forked workers
+_make_frame = None
+_ring = None
+_fps = None
+_layered = False
+
+# Renderer inherited by forked segment processes
+_segment_make_frame = None
+
+def _render_into_slot(task):
+    """Worker: render one frame into its ring slot and return its index."""
+    index, slot = task
+    if _layered:
+        _make_frame(index / _fps, _ring[slot])
+    else:
+        _ring[slot] = _make_frame(index / _fps)
+    return index
+
+def audio_options(audio_delay):
+    """Output options starting the narration after the lead-in and padding it with silence to the video's end."""
+    return ['-af', f'adelay={int(round(audio_delay * 1000))}:all=1,apad', '-shortest', '-c:a', 'aac']
+
+def encoder_command(output, size, fps, audio_file=None, audio_delay=0.0, threads=None,
+                    preset='ultrafast', crf=23, pix_fmt='yuv420p', still_image=None, duration=None, subtitle_file=None,
+                    tune=None, keyint=None):
+    """ffmpeg command reading raw RGB frames on stdin and muxing the (delayed) audio.
+
+    With still_image the video is that image looped for `duration` seconds
+    instead of frames on stdin. subtitle_file (SRT or WebVTT) is muxed as a
+    soft mov_text caption track.
+    """
+    width, height = size
+    command = ['ffmpeg', '-y', '-loglevel', 'error']
+    if still_image:
+        command += ['-loop', '1', '-framerate', str(fps), '-i', str(still_image)]
+    else:
+        command += ['-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}', '-r', str(fps), '-i', '-']
+    # Inputs first: options before an -i apply to that input
+    streams = ['-map', '0:v']
+    if audio_file:
+        command += ['-i', str(audio_file)]
+        streams += ['-map', '1:a']
+    if subtitle_file:
+        command += ['-i', str(subtitle_file)]
+        streams += ['-map', f'{len(streams) // 2}:s', '-c:s', 'mov_text', '-metadata:s:s:0', 'language=eng']
+    command += streams
+    if audio_file:
+        command += audio_options(audio_delay)
+    command += ['-c:v', 'libx264', '-preset', preset, '-crf', str(crf), '-pix_fmt', pix_fmt]
+    if tune:
+        command += ['-tune', tune]
+    if keyint:
+        command += ['-g', str(keyint)]
+    if threads:
+        command += ['-threads', str(threads)]
+    if duration is not None:
+        command += ['-t', f'{duration:.3f}']
+    command += ['-movflags', '+faststart', '-f', 'mp4', str(output)]
+    return command
+
+# Stream fields a stream-copy concat needs to match across files, by stream type
+CONCAT_STREAM_FIELDS = {
+    'video': ('codec_name', 'profile', 'width', 'height', 'pix_fmt', 'r_frame_rate', 'time_base'),
+    'audio': ('codec_name', 'profile', 'sample_rate', 'channels', 'channel_layout', 'time_base'),
+    'subtitle': ('codec_name',),
+}
+
+def probe_video(video_file):
+    """Container duration, video frame count and concat-relevant stream fields of an encoded file.
+
+    Streams are flattened to 'video.codec_name', 'audio.sample_rate', ... for
+    the first stream of each type, as ffprobe reports them.
+    """
+    result = subprocess.run(['ffprobe', '-v', 'error', '-print_format', 'json', '-show_format', '-show_streams',
+                             str(video_file)], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffprobe exited with status {result.returncode} on {video_file}: {result.stderr.strip()}")
+    probed = json.loads(result.stdout)
+    streams, frames = {}, None
+    for stream in probed.get('streams', []):
+        kind = stream.get('codec_type')
+        if kind not in CONCAT_STREAM_FIELDS or f"{kind}.codec_name" in streams:
+            continue
+        streams.update({f"{kind}.{name}": stream.get(name) for name in CONCAT_STREAM_FIELDS[kind]})
+        if kind == 'video' and stream.get('nb_frames'):
+            frames = int(stream['nb_frames'])
+    return {'duration': float(probed['format']['duration']), 'frames': frames, 'streams': streams}
+
+def decoder_command(video_file, size, start=0.0):
+    """ffmpeg command decoding a video from `start` seconds to raw RGB frames of the given size on stdout."""
+    width, height = size
+    command = ['ffmpeg', '-loglevel', 'error']
+    if start > 0:
+        command += ['-ss', f'{start:.6f}']
+    return command + ['-i', str(video_file), '-f', 'rawvideo', '-pix_fmt', 'rgb24', '-s', f'{width}x{height}', '-']
+
+def concat_command(segment_list, output, audio_file=None, audio_delay=0.0):
+    """ffmpeg command joining the video segments in a concat list by stream copy and muxing the audio."""
+    command = ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat', '-safe', '0', '-i', str(segment_list)]
+    streams = ['-map', '0:v']
+    if audio_file:
+        command += ['-i', str(audio_file)]
+        streams += ['-map', '1:a']
+    command += streams + ['-c:v', 'copy']
+    if audio_file:
+        command += audio_options(audio_delay)
+    return command + ['-movflags', '+faststart', '-f', 'mp4', str(output)]
+
+def _read_frame(stream, frame: np.ndarray):
+    """Fill a contiguous uint8 frame from a raw RGB stream."""
+    view = memoryview(frame).cast('B')
+    filled = 0
+    while filled < len(view):
+        count = stream.readinto(view[filled:])
+        if not count:
+            raise RuntimeError("Background video ended before the last frame")
+        filled += count
+
+def encode_still(image, duration: float, output: Path, audio_file=None, audio_delay: float = 0.0,
+                 fps: int = 1, size=(1920, 1080), threads=None, **encoder_options) -> Path:
+    """Encode a still image held for the whole duration, with the (delayed) audio, into an mp4."""
+    command = encoder_command(output, size, fps, audio_file, audio_delay, threads,
+                              still_image=image, duration=duration, **encoder_options)
+    result = subprocess.run(command)
+    if result.returncode != 0:
+        raise RuntimeError(f"ffmpeg exited with status {result.returncode} while encoding {output}")
+    return Path(output)
+
+def render_video(make_frame, duration: float, output: Path, audio_file=None, audio_delay: float = 0.0,
+                 fps: int = 12, size=(1920, 1080), workers: int = 1, chunk_frames: int = 4,
+                 threads=None, background=None, in_place=False, first_frame=0, frame_count=None, label='',
+                 **encoder_options) -> Path:
+    """Render make_frame(t) for the whole duration straight into an mp4.
+
+    make_frame must return an RGB uint8 array of the given size. With one
+    worker frames are rendered inline; otherwise a forked pool renders
+    chunks of consecutive frames into the shared ring. With in_place,
+    make_frame(t, frame) instead draws into the preallocated frame buffer
+    (the ring slot itself), which goes to the encoder without a copy. With a
+    background video it is in place too, and the buffer already holds that
+    video's frame for t. first_frame and frame_count select a range of the
+    timeline (the whole duration by default).
+    """
+    global _make_frame, _ring, _fps, _layered
+    width, height = size
+    total_frames = int(duration * fps) - first_frame if frame_count is None else frame_count
+    frames = range(first_frame, first_frame + total_frames)
+    progress_every = max(1, total_frames // 20)
+    command = encoder_command(output, size, fps, audio_file, audio_delay, threads, **encoder_options)
+    decoder = None
+    if background:
+        # Seek half a frame early so rounding can never skip the first frame of the range
+        start_time = (first_frame - 0.5) / fps
+        decoder = subprocess.Popen(decoder_command(background, size, start_time), stdout=subprocess.PIPE)
+    encoder = subprocess.Popen(command, stdin=subprocess.PIPE)
+    start = time.perf_counter()
+
+    def report(written):
+        if written % progress_every == 0 or written == total_frames:
+            rate = written / max(time.perf_counter() - start, 1e-9)
+            log.info(f"   📹 Rendering frames{label}: {written / total_frames * 100:.1f}% ({written}/{total_frames} frames, {rate:.1f} fps)")
+
+    try:
+        if workers <= 1:
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            for written, index in enumerate(frames, 1):
+                if decoder:
+                    with layer_timer.layer('plate decode'):
+                        _read_frame(decoder.stdout, frame)
+                if in_place or decoder:
+                    make_frame(index / fps, frame)
+                else:
+                    frame = np.ascontiguousarray(make_frame(index / fps), dtype=np.uint8)
+                with layer_timer.layer('encode write'):
+                    encoder.stdin.write(frame.data)
+                report(written)
+        else:
+            # Enough slots for every worker to hold a chunk in flight while the writer drains one
+            slots = 2 * (workers + 1) * chunk_frames
+            ring_memory = shared_memory.SharedMemory(create=True, size=slots * height * width * 3)
+            free_slots = threading.Semaphore(slots)
+            stop = threading.Event()
+
+            def tasks():
+                # Runs in the pool's task thread: hand out a frame only once its slot has been written
+                for index in frames:
+                    while not free_slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if decoder:
+                        with layer_timer.layer('plate decode'):
+                            _read_frame(decoder.stdout, _ring[index % slots])
+                    yield index, index % slots
+
+            _make_frame, _fps, _layered = make_frame, fps, in_place or decoder is not None
+            _ring = np.ndarray((slots, height, width, 3), dtype=np.uint8, buffer=ring_memory.buf)
+            try:
+                with mp.get_context('fork').Pool(workers) as pool:
+                    try:
+                        for written, index in enumerate(pool.imap(_render_into_slot, tasks(), chunksize=chunk_frames), 1):
+                            with layer_timer.layer('encode write'):
+                                encoder.stdin.write(_ring[index % slots].data)
+                            free_slots.release()
+                            report(written)
+                    finally:
+                        stop.set()
+            finally:
+                _make_frame = _ring = _fps = None
+                _layered = False
+                ring_memory.close()
+                ring_memory.unlink()
+
+        encoder.stdin.close()
+    except BrokenPipeError:
+        pass
+    except BaseException:
+        encoder.kill()
+        encoder.wait()
+        raise
+    finally:
+        if decoder:
+            decoder.stdout.close()
+            decoder.kill()
+            decoder.wait()
+
+    if encoder.wait() != 0:
+        raise RuntimeError(f"ffmpeg exited with status {encoder.returncode} while encoding {output}")
+    return Path(output)
+
+def _render_segment(output, first_frame, frame_count, options):
+    """Segment process: render one range of frames to its own video-only file; returns seconds taken."""
+    start = time.perf_counter()
+    render_video(_segment_make_frame, first_frame=first_frame, frame_count=frame_count,
+                 output=output, **options)
+    return time.perf_counter() - start
+
+def render_video_segments(make_frame, duration: float, output: Path, audio_file=None, audio_delay: float = 0.0,
+                          fps: int = 12, size=(1920, 1080), segments: int = 1, workers: int = 1, threads=None,
+                          **encoder_options) -> Path:
+    """Render like render_video, split into time segments encoded in parallel.
+
+    Each segment is rendered by a forked process with its share of the frame
+    workers and encoder threads into a video-only file that starts on a
+    keyframe (segment boundaries also fall on the keyframe interval when one
+    is set). The segments are then joined by stream copy and the audio is
+    muxed once over the whole timeline.
+    """
+    global _segment_make_frame
+    output = Path(output)
+    total_frames = int(duration * fps)
+    segments = max(1, min(segments, total_frames))
+    if segments == 1:
+        return render_video(make_frame, duration, output, audio_file, audio_delay, fps, size, workers,
+                            threads=threads, **encoder_options)
+
+    keyint = encoder_options.get('keyint') or 1
+    bounds = sorted({round(total_frames * i / segments / keyint) * keyint for i in range(segments)} | {total_frames})
+    bounds = [bound for bound in bounds if bound <= total_frames]
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+    options = dict(duration=duration, fps=fps, size=size,
+                   workers=max(1, workers // len(ranges)),
+                   threads=max(1, (threads or os.cpu_count()) // len(ranges)),
+                   **encoder_options)
+
+    segment_dir = output.with_name(output.name + '.segments')
+    segment_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        segment_files = [segment_dir / f"segment_{number:03d}.mp4" for number in range(len(ranges))]
+        _segment_make_frame = make_frame
+        try:
+            with ProcessPoolExecutor(max_workers=len(ranges), mp_context=mp.get_context('fork')) as executor:
+                futures = [executor.submit(_render_segment, segment_file, first, last - first,
+                                           dict(options, label=f" [segment {number + 1}/{len(ranges)}]"))
+                           for number, (segment_file, (first, last)) in enumerate(zip(segment_files, ranges))]
+                stats = SummaryStats()
+                for future, (first, last) in zip(futures, ranges):
+                    seconds = future.result()
+                    stats.add('segment seconds', seconds)
+                    stats.add('segment fps', (last - first) / max(seconds, 1e-9))
+            stats.log(log, f"   🔍 {len(ranges)} segments of {output.name}:")
+        finally:
+            _segment_make_frame = None
+
+        segment_list = segment_dir / "segments.txt"
+        segment_list.write_text(''.join(f"file '{segment_file.resolve()}'\n" for segment_file in segment_files))
+        result = subprocess.run(concat_command(segment_list, output, audio_file, audio_delay))
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg exited with status {result.returncode} while joining segments of {output}")
+    finally:
+        shutil.rmtree(segment_dir, ignore_errors=True)
+    return output
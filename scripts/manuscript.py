@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Parse the story/ manuscript once into an immutable document tree.
+
+Every format builder works from the same tree instead of keeping its own
+chapter list, titles, part boundaries and markdown conversion. Each
+section's HTML is rendered once by python-markdown (as the EPUB and PDF
+builders always did, so hard line breaks, underscore emphasis and toc
+anchors keep working) and stored in the tree, which is pickled for the
+other builder processes.
+"""
+
+import re
+import html
+import markdown
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+from build_cache import artifact_cache, hash_bytes, hash_file, hash_files
+from build_log import get_logger
+
+log = get_logger(__name__)
+
+# Book structure: front matter, part boundaries (first chapter of each part)
+# and back matter. Chapters themselves are discovered from story/chapter_N.md.
+FRONT_MATTER = ["dedication", "foreword"]
+PARTS = [
+    (1, "Part I: The Frozen Mind"),
+    (6, "Part II: The Emergence"),
+    (9, "Part III: The Taxonomy"),
+    (16, "Part IV: The Multiplication"),
+    (19, "Part V: The Recognition"),
+    (22, "Part VI: The Transformation"),
+]
+BACK_MATTER = ["epilogue", "acknowledgements", "about_the_author"]
+
+@dataclass(frozen=True)
+class Section:
+    """One story file: front matter, a numbered chapter or back matter."""
+    key: str
+    kind: str
+    title: str
+    label: str
+    path: Path
+    text: str
+    html: str           # body HTML
+    anchored_html: str  # body HTML with id anchors on the headings (for the PDF's internal links)
+    number: Optional[int] = None
+
+@dataclass(frozen=True)
+class Part:
+    title: str
+    chapters: Tuple[Section, ...]
+
+@dataclass(frozen=True)
+class Manuscript:
+    front: Tuple[Section, ...]
+    parts: Tuple[Part, ...]
+    back: Tuple[Section, ...]
+    extras: Tuple[Section, ...] = field(default=())
+
+    @property
+    def chapters(self) -> Tuple[Section, ...]:
+        """Numbered chapters in reading order."""
+        return tuple(chapter for part in self.parts for chapter in part.chapters)
+
+    @property
+    def sections(self) -> Tuple[Section, ...]:
+        """Every section of the book in reading order."""
+        return self.front + self.chapters + self.back
+
+    def section(self, key: str) -> Optional[Section]:
+        """Look up a section (including extras such as README) by file stem."""
+        for section in self.sections + self.extras:
+            if section.key == key:
+                return section
+        return None
+
+HEADING_TAG_PATTERN = re.compile(r'<(/?)h([1-6])\b')
+LONE_IMAGE_PATTERN = re.compile(r'<p>(<img [^>]*>)</p>')
+
+def render_markdown(content: str, heading_levels=None, toc: bool = False) -> str:
+    """Render markdown to HTML with python-markdown; heading_levels optionally remaps heading levels.
+
+    toc adds id anchors to the headings, as the PDF's toc extension always has.
+    """
+    extensions = ['extra', 'codehilite'] + (['toc'] if toc else [])
+    rendered = markdown.Markdown(extensions=extensions).convert(content)
+    # An image on its own is a figure, styled like the chapter art
+    rendered = LONE_IMAGE_PATTERN.sub(r'<div class="chapter-image">\1</div>', rendered)
+    return remap_headings(rendered, heading_levels) if heading_levels else rendered
+
+def markdown_to_html(content: str, heading_levels=None) -> str:
+    """Render a markdown string that isn't part of the manuscript."""
+    return render_markdown(content, heading_levels)
+
+def remap_headings(rendered: str, heading_levels) -> str:
+    """Change heading levels in already rendered HTML (e.g. {3: 1} turns h3 into h1)."""
+    return HEADING_TAG_PATTERN.sub(
+        lambda match: f"<{match.group(1)}h{heading_levels.get(int(match.group(2)), int(match.group(2)))}",
+        rendered)
+
+FIRST_HEADING_PATTERN = re.compile(r'<h[1-6][^>]*>(.*?)</h[1-6]>', re.DOTALL)
+
+def heading_title(rendered: str) -> Optional[str]:
+    """Visible text of the first heading in rendered HTML, if any."""
+    match = FIRST_HEADING_PATTERN.search(rendered)
+    return html.unescape(re.sub(r'<[^>]+>', '', match.group(1))).strip() if match else None
+
+def load_section(path: Path, kind: str, number: Optional[int] = None) -> Section:
+    """Parse one story file into a Section, rendering its HTML once."""
+    text = path.read_text(encoding='utf-8')
+    body_html = render_markdown(text)
+    heading = heading_title(body_html)
+    if number is not None:
+        # Some chapter headings carry a stale "Chapter N:" prefix of their own
+        title = re.sub(r'^Chapter\s+\d+\s*:\s*', '', heading or '') or f"Chapter {number}"
+        label = f"Chapter {number}: {title}"
+    else:
+        title = heading or path.stem.replace('_', ' ').title()
+        label = title
+    return Section(key=path.stem, kind=kind, title=title, label=label, path=path,
+                   text=text, html=body_html, anchored_html=render_markdown(text, toc=True), number=number)
+
+def parse_manuscript(story_dir: Path) -> Manuscript:
+    """Parse every story file and arrange it into front matter, parts and back matter."""
+    numbered = sorted(
+        (int(match.group(1)), path) for path in story_dir.glob("chapter_*.md")
+        if (match := re.fullmatch(r'chapter_(\d+)', path.stem))
+    )
+    chapters = [load_section(path, 'chapter', number) for number, path in numbered]
+
+    parts = []
+    for index, (first, title) in enumerate(PARTS):
+        next_first = PARTS[index + 1][0] if index + 1 < len(PARTS) else None
+        members = tuple(c for c in chapters if c.number >= first and (next_first is None or c.number < next_first))
+        if members:
+            parts.append(Part(title, members))
+
+    front = tuple(load_section(story_dir / f"{key}.md", 'front') for key in FRONT_MATTER
+                  if (story_dir / f"{key}.md").exists())
+    back = tuple(load_section(story_dir / f"{key}.md", 'back') for key in BACK_MATTER
+                 if (story_dir / f"{key}.md").exists())
+    known = set(FRONT_MATTER) | set(BACK_MATTER) | {path.stem for _, path in numbered}
+    extras = tuple(load_section(path, 'extra') for path in sorted(story_dir.glob("*.md"))
+                   if path.stem not in known)
+    return Manuscript(front=front, parts=tuple(parts), back=back, extras=extras)
+
+_loaded = {}
+
+def load_manuscript(story_dir="story") -> Manuscript:
+    """Return the parsed manuscript, parsing at most once per content change.
+
+    The tree, rendered HTML included, is memoized in-process and pickled in the
+    artifact cache keyed on the content hash of every story file, so the
+    builders launched by build_all.py share a single parse and render.
+    """
+    story_dir = Path(story_dir)
+    key = hash_bytes(hash_file(__file__) + hash_files(story_dir.glob("*.md")))
+    if key in _loaded:
+        return _loaded[key]
+
+    manuscript = None
+    try:
+        manuscript = artifact_cache.get_pickle("manuscript", key)
+    except Exception as e:
+        log.warning(f"⚠️  Manuscript cache read failed, reparsing: {e}")
+    if manuscript is None:
+        manuscript = parse_manuscript(story_dir)
+        try:
+            artifact_cache.put_pickle("manuscript", key, manuscript)
+        except OSError as e:
+            log.warning(f"⚠️  Failed to cache manuscript: {e}")
+
+    _loaded[key] = manuscript
+    return manuscript
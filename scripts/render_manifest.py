@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Per-chapter render manifests: what a video was rendered from, stored next to it.
+
+Besides the input hashes that decide whether a chapter is re-rendered, a
+manifest records the video's duration and frame count, the audio offset,
+the parameters of its encoded streams and a hash of the file. The file is
+probed once, when the manifest is written, so videos can be combined
+later without probing them.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+from build_cache import hash_file, write_atomic
+
+def manifest_path(video_file: Path) -> Path:
+    """Manifest beside a rendered video (chapter_1.mp4 -> chapter_1.manifest.json)."""
+    return Path(video_file).with_suffix('.manifest.json')
+
+def read_manifest(video_file: Path) -> Optional[Dict]:
+    """Load a video's manifest, or None if there is none or it is unreadable."""
+    try:
+        return json.loads(manifest_path(video_file).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+def write_manifest(video_file: Path, inputs: Dict, **details) -> Dict:
+    """Record the input hashes a video was rendered from, its size and hash, and any other details."""
+    manifest = {
+        'video': Path(video_file).name,
+        'rendered_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'inputs': inputs,
+        'file': {'size': Path(video_file).stat().st_size, 'md5': hash_file(video_file)},
+        **details,
+    }
+    write_atomic(manifest_path(video_file), json.dumps(manifest, indent=2))
+    return manifest
+
+def stale_inputs(video_file: Path, inputs: Dict) -> List[str]:
+    """Names of the inputs that differ from the video's manifest; empty when it is up to date.
+
+    A missing video or manifest counts as every input having changed.
+    """
+    manifest = read_manifest(video_file) if Path(video_file).exists() else None
+    recorded = manifest.get('inputs', {}) if manifest else {}
+    return [name for name, value in inputs.items() if recorded.get(name) != value]
+
+def video_manifest(video_file: Path) -> Optional[Dict]:
+    """A video's manifest if it has timing and stream details and still matches the file's size."""
+    manifest = read_manifest(video_file)
+    if not manifest or 'duration' not in manifest or 'streams' not in manifest:
+        return None
+    if not Path(video_file).exists() or Path(video_file).stat().st_size != manifest['file']['size']:
+        return None
+    return manifest
+
+def concat_mismatches(manifests: List[Dict]) -> List[str]:
+    """Stream parameters that differ from the first video's, which would break a stream-copy concat."""
+    if not manifests:
+        return []
+    reference = manifests[0]
+    mismatches = []
+    for manifest in manifests[1:]:
+        for name in sorted(set(reference['streams']) | set(manifest['streams'])):
+            expected, actual = reference['streams'].get(name), manifest['streams'].get(name)
+            if actual != expected:
+                mismatches.append(f"{manifest['video']}: {name} is {actual}, {reference['video']} has {expected}")
+    return mismatches
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Per-layer wall-clock timing for the video renderer, off unless enabled."""
+
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+# Shared by every disabled span, so timing hooks cost one attribute check when off
+_DISABLED = nullcontext()
+
+class _Span:
+    """Context manager adding its elapsed time to one layer."""
+    __slots__ = ('timer', 'name', 'start')
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.timer.add(self.name, time.perf_counter() - self.start)
+
+class LayerTimer:
+    """Accumulates wall time per frame layer (zoom, motes, text, composite, encode, ...).
+
+    Rendering code wraps each layer in `with layer_timer.layer(name):`.
+    Timings are per process: forked frame workers keep their own, so
+    benchmarks render inline.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        """Forget all recorded timings."""
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def layer(self, name):
+        """Context manager timing one pass through a layer (a no-op when disabled)."""
+        return _Span(self, name) if self.enabled else _DISABLED
+
+    def add(self, name, seconds):
+        """Record time spent in a layer."""
+        self.seconds[name] += seconds
+        self.calls[name] += 1
+
+    def report(self, frames):
+        """Return one line per layer with its ms/frame and share of the total, slowest first."""
+        total = sum(self.seconds.values()) or 1e-9
+        return [f"{name:>12}: {seconds * 1000 / frames:8.2f} ms/frame ({seconds / total * 100:4.1f}%, {self.calls[name]} calls)"
+                for name, seconds in sorted(self.seconds.items(), key=lambda item: item[1], reverse=True)]
+
+# Timer shared by the renderer and the frame pipeline in this process
+layer_timer = LayerTimer()
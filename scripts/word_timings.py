@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Word timings for the audiobook video: synthesis sidecars, per-frame lookups and captions."""
+
+import json
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from build_cache import write_atomic
+
+def timings_sidecar(audio_file: Path) -> Path:
+    """Sidecar holding the word and segment timings of a synthesized WAV."""
+    return Path(audio_file).with_suffix('.timings.json')
+
+def write_timings_sidecar(audio_file: Path, sample_rate: int, samples: int, segments: List[Dict], words: List[Dict]):
+    """Record the timings of a WAV written with `samples` frames at `sample_rate`."""
+    sidecar = {
+        'audio': Path(audio_file).name,
+        'sample_rate': sample_rate,
+        'samples': samples,
+        'segments': segments,
+        'words': words,
+    }
+    write_atomic(timings_sidecar(audio_file), json.dumps(sidecar, separators=(',', ':')))
+
+def read_timings_sidecar(audio_file: Path) -> Optional[Dict]:
+    """Load a WAV's timing sidecar, or None if there is none or it is unreadable."""
+    try:
+        return json.loads(timings_sidecar(audio_file).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+CAPTION_MAX_CHARS = 42      # one comfortable subtitle line
+CAPTION_MAX_SECONDS = 6.0   # longest a cue stays on screen
+CAPTION_MAX_GAP = 1.0       # a pause this long starts a new cue
+
+def caption_cues(timings: List[Dict], offset: float = 0.0) -> List[Tuple[float, float, str]]:
+    """Group word timings into (start, end, text) caption cues, shifted by offset seconds.
+
+    A cue ends at sentence punctuation, at a pause, or when it would grow past
+    CAPTION_MAX_CHARS or CAPTION_MAX_SECONDS.
+    """
+    cues = []
+    words = []
+    
+    def flush():
+        if words:
+            cues.append((words[0]['start'] + offset, words[-1]['end'] + offset,
+                         ' '.join(word['text'] for word in words)))
+            words.clear()
+    
+    for timing in sorted(timings, key=lambda timing: timing['start']):
+        text = timing['word'].strip()
+        if not text:
+            continue
+        if words and (len(' '.join(word['text'] for word in words)) + 1 + len(text) > CAPTION_MAX_CHARS
+                      or timing['start'] - words[-1]['end'] > CAPTION_MAX_GAP
+                      or timing['end'] - words[0]['start'] > CAPTION_MAX_SECONDS):
+            flush()
+        words.append({'text': text, 'start': timing['start'], 'end': timing['end']})
+        if text.endswith(('.', '!', '?')):
+            flush()
+    flush()
+    return cues
+
+def caption_timestamp(seconds: float, separator: str = '.') -> str:
+    """HH:MM:SS.mmm (WebVTT) or, with separator ',', HH:MM:SS,mmm (SRT)."""
+    millis = max(0, int(round(seconds * 1000)))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+def format_webvtt(cues: List[Tuple[float, float, str]]) -> str:
+    """Caption cues as a WebVTT document."""
+    blocks = [f"{caption_timestamp(start)} --> {caption_timestamp(end)}\n{text}" for start, end, text in cues]
+    return "WEBVTT\n\n" + "\n\n".join(blocks) + "\n"
+
+def format_srt(cues: List[Tuple[float, float, str]]) -> str:
+    """Caption cues as a SubRip (SRT) document."""
+    blocks = [f"{number}\n{caption_timestamp(start, ',')} --> {caption_timestamp(end, ',')}\n{text}"
+              for number, (start, end, text) in enumerate(cues, 1)]
+    return "\n\n".join(blocks) + "\n"
+
+def write_captions(timings: List[Dict], base: Path, offset: float = 0.0) -> Tuple[Path, Path]:
+    """Write base.vtt and base.srt captions for the word timings; returns both paths."""
+    cues = caption_cues(timings, offset)
+    vtt_file, srt_file = Path(base).with_suffix('.vtt'), Path(base).with_suffix('.srt')
+    write_atomic(vtt_file, format_webvtt(cues))
+    write_atomic(srt_file, format_srt(cues))
+    return vtt_file, srt_file
+
+class WordTimingIndex:
+    """Sorted start/end arrays over word timings, answering per-frame queries with bisect.
+
+    Timings are dicts with 'word', 'start' and 'end' (seconds), as produced by
+    get_exact_word_timings_from_audio(). The index orders them by start time
+    (stably), and "first" and "last" below refer to that order: lookups
+    return the same words as a linear scan of the timings sorted by start,
+    which for Whisper and synthesis timings is the list as given. For a list
+    that is not in start order they can differ from a scan of the list
+    itself.
+    """
+
+    def __init__(self, timings: List[Dict]):
+        # Stable sort keeps list order among words that start together
+        self.timings = sorted(timings, key=lambda timing: timing['start'])
+        self.starts = [timing['start'] for timing in self.timings]
+        # Running max of end times: the first position reaching t is the first word not yet over
+        self.end_reach = list(accumulate((timing['end'] for timing in self.timings), max))
+
+        # Words ordered by end time, and the latest start-order position among those ended so far
+        self.by_end = sorted(range(len(self.timings)), key=lambda i: (self.timings[i]['end'], i))
+        self.ends = [self.timings[i]['end'] for i in self.by_end]
+        self.latest_ended = list(accumulate(self.by_end, max))
+
+    def __len__(self):
+        return len(self.timings)
+
+    def active(self, t: float) -> Optional[Dict]:
+        """First word with start <= t <= end, or None during silence."""
+        i = bisect_left(self.end_reach, t)
+        if i < len(self.timings) and self.starts[i] <= t:
+            return self.timings[i]
+        return None
+
+    def last_ended(self, t: float) -> Optional[Dict]:
+        """Last word in start order whose end <= t, or None before the first word ends."""
+        count = bisect_right(self.ends, t)
+        return self.timings[self.latest_ended[count - 1]] if count else None
+
+    def last_end(self, t: float) -> float:
+        """Latest end time <= t (0 before any word has ended)."""
+        count = bisect_right(self.ends, t)
+        return self.ends[count - 1] if count else 0
+
+    def time_since_last_word(self, t: float) -> float:
+        """Seconds of silence since the last word ended."""
+        return t - self.last_end(t)
+
+    def current(self, t: float):
+        """Word to display at t and whether it is being spoken right now.
+
+        Falls back to the last spoken word during silence; returns (None, False)
+        before the first word.
+        """
+        word = self.active(t)
+        if word is not None:
+            return word, True
+        return self.last_ended(t), False
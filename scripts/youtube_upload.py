@@ -8,20 +8,17 @@ from pathlib import Path
 from typing import List, Dict, Tuple
 from datetime import timedelta
 import librosa
+from render_manifest import concat_mismatches, video_manifest
 
-def get_video_duration(video_path: Path) -> float:
-    """Get video duration in seconds using ffprobe."""
-    try:
-        result = subprocess.run([
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
-            '-show_format', str(video_path)
-        ], capture_output=True, text=True, check=True)
-        
-        data = json.loads(result.stdout)
-        return float(data['format']['duration'])
-    except Exception as e:
-        print(f"❌ Error getting duration for {video_path.name}: {e}")
-        return 0.0
+def load_chapter_manifests(video_files: List[Tuple[str, Path]]) -> List[Dict]:
+    """Render manifests of the chapter videos, or an empty list (with the problems printed) if any is missing."""
+    manifests = [video_manifest(video_file) for _, video_file in video_files]
+    missing = [video_file.name for (_, video_file), manifest in zip(video_files, manifests) if manifest is None]
+    if missing:
+        print(f"❌ No current render manifest for: {', '.join(missing)}")
+        print("   Re-run scripts/create_audiobook_video.py to render (or re-render) these chapters")
+        return []
+    return manifests
 
 def format_timestamp(seconds: float) -> str:
     """Convert seconds to YouTube timestamp format (M:SS or H:MM:SS)."""
@@ -105,13 +102,25 @@ def create_combined_video_with_chapters():
     
     print(f"📁 Found {len(video_files)} videos to combine")
     
+    # Durations and stream parameters come from the render manifests, so nothing is probed
+    # and streams that can't be joined by stream copy are caught before ffmpeg runs
+    manifests = load_chapter_manifests(video_files)
+    if not manifests:
+        return
+    mismatches = concat_mismatches(manifests)
+    if mismatches:
+        print("❌ Chapter videos can't be joined by stream copy:")
+        for mismatch in mismatches:
+            print(f"   {mismatch}")
+        return
+    
     # Create file list for ffmpeg
     file_list_path = output_dir / "video_list.txt"
     chapter_timestamps = []
     current_time = 0.0
     
     with open(file_list_path, 'w') as f:
-        for chapter_key, video_file in video_files:
+        for (chapter_key, video_file), manifest in zip(video_files, manifests):
             # Add chapter timestamp
             title = chapter_titles.get(chapter_key, chapter_key.replace('_', ' ').title())
             timestamp = format_timestamp(current_time)
@@ -121,7 +130,7 @@ def create_combined_video_with_chapters():
             f.write(f"file '{video_file.absolute()}'\n")
             
             # Add duration to current time
-            duration = get_video_duration(video_file)
+            duration = manifest['duration']
             current_time += duration
             print(f"   📹 {chapter_key}: {format_timestamp(duration)} (total: {format_timestamp(current_time)})")
     
@@ -230,14 +239,18 @@ def create_individual_chapter_uploads():
             video_file = video_dir / f"chapter_{chapter_num}.mp4"
         
         if video_file.exists():
-            duration = get_video_duration(video_file)
-            size_mb = video_file.stat().st_size / (1024 * 1024)
+            manifest = video_manifest(video_file)
+            if manifest is None:
+                print(f"⚠️  Skipping {video_file.name} - no current render manifest")
+                continue
+            size_mb = manifest['file']['size'] / (1024 * 1024)
             
             upload_info.append({
                 'title': f"Digital Amber - {title}",
                 'file': str(video_file),
-                'duration': format_timestamp(duration),
-                'size_mb': round(size_mb, 1)
+                'duration': format_timestamp(manifest['duration']),
+                'size_mb': round(size_mb, 1),
+                'md5': manifest['file']['md5']
             })
     
     # Save upload information